@@ -1,6 +1,8 @@
 from .category import CategoryAdmin
 from .comment import CommentAdmin
+from .dead_letter import SyncDeadLetterAdmin
 from .insight import InsightAdmin
+from .job import SyncJobAdmin
 from .media import MediaAdmin
 from .instagram_account import InstagramAccountAdmin
 from .page import FacebookPageDataAdmin
@@ -17,6 +19,8 @@ __all__ = [
     "SettingsAdmin",
     "StoryAdmin",
     "InstagramAccountAdmin",
+    "SyncJobAdmin",
+    "SyncDeadLetterAdmin",
     "FacebookPageDataAdmin",
     "PostPublishAdmin",
 ]
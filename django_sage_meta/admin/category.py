@@ -1,14 +1,14 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
-from django.urls import path, reverse
-from django.shortcuts import redirect
+from django.urls import path
 
-from django_sage_meta.repository import SyncService
+from django_sage_meta.admin.job import SyncJobEnqueueMixin
+from django_sage_meta.helper.choice import SyncJobKindEnum
 from django_sage_meta.models import Category
 
 
 @admin.register(Category)
-class CategoryAdmin(admin.ModelAdmin):
+class CategoryAdmin(SyncJobEnqueueMixin, admin.ModelAdmin):
     save_on_top = True
     change_list_template = "admin/email/category.html"
     readonly_fields = ("id", "name", "category_id")
@@ -30,15 +30,13 @@ class CategoryAdmin(admin.ModelAdmin):
         return custom_urls + urls
 
     def sync_categories(self, request):
-        try:
-            SyncService.sync_categories()
-            self.message_user(
-                request, _("Instagram categories synchronized successfully.")
-            )
-            change_list_url = reverse(
-                f"admin:{self.model._meta.app_label}_{self.model._meta.model_name}_changelist"
-            )
-            return redirect(change_list_url)
+        """Queues a background sync of categories.
+
+        Args:
+            request (HttpRequest): The current request object.
+
+        Returns:
+            HttpResponse: A redirect to the job status page.
 
-        except Exception as e:
-            self.message_user(request, _(f"An error occurred: {e}"), level="error")
+        """
+        return self.enqueue_sync(request, SyncJobKindEnum.categories)
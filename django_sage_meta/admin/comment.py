@@ -1,17 +1,26 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
 
+from django_sage_meta.admin.search import FullTextSearchMixin
 from django_sage_meta.models import Comment
 from django_sage_meta.repository import PublisherService
 
 
 @admin.register(Comment)
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(FullTextSearchMixin, admin.ModelAdmin):
     save_on_top = True
-    list_display = ("id", "comment_id", "username", "like_counts", "timestamp", "media")
+    list_display = (
+        "id",
+        "comment_id",
+        "username",
+        "like_counts",
+        "published_at",
+        "media",
+    )
     search_fields = ("comment_id", "username", "text")
-    search_help_text = _("Search by Comment ID, Username, or Text")
-    list_filter = ("like_counts", "timestamp")
+    search_id_fields = ("comment_id",)
+    search_help_text = _("Search by Comment ID or words of the Username or Text")
+    list_filter = ("like_counts", "published_at")
     ordering = ("id",)
     fieldsets = (
         (
@@ -0,0 +1,34 @@
+from django.contrib import admin
+
+from django_sage_meta.models import SyncDeadLetter
+
+
+@admin.register(SyncDeadLetter)
+class SyncDeadLetterAdmin(admin.ModelAdmin):
+    list_display = (
+        "object_id",
+        "request",
+        "stage",
+        "account_id",
+        "attempts",
+        "updated_at",
+    )
+    list_filter = ("stage", "request")
+    search_fields = ("object_id", "account_id", "error")
+    ordering = ("-updated_at",)
+    readonly_fields = (
+        "stage",
+        "account_id",
+        "object_id",
+        "request",
+        "error",
+        "attempts",
+        "created_at",
+        "updated_at",
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
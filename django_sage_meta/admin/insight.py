@@ -1,14 +1,14 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
-from django.urls import path, reverse
-from django.shortcuts import redirect
+from django.urls import path
 
+from django_sage_meta.admin.job import SyncJobEnqueueMixin
+from django_sage_meta.helper.choice import SyncJobKindEnum
 from django_sage_meta.models import Insight
-from django_sage_meta.repository import SyncService
 
 
 @admin.register(Insight)
-class InsightAdmin(admin.ModelAdmin):
+class InsightAdmin(SyncJobEnqueueMixin, admin.ModelAdmin):
     save_on_top = True
     change_list_template = "admin/email/insight.html"
     list_display = ("name", "title", "kind")
@@ -54,14 +54,13 @@ class InsightAdmin(admin.ModelAdmin):
         return custom_urls + urls
 
     def sync_insights(self, request):
-        try:
-            SyncService.sync_insights(1)
-            self.message_user(
-                request, _("Instagram insights synchronized successfully.")
-            )
-            change_list_url = reverse(
-                f"admin:{self.model._meta.app_label}_{self.model._meta.model_name}_changelist"
-            )
-            return redirect(change_list_url)
-        except Exception as e:
-            self.message_user(request, _(f"An error occurred: {e}"), level="error")
+        """Queues a background sync of insights.
+
+        Args:
+            request (HttpRequest): The current request object.
+
+        Returns:
+            HttpResponse: A redirect to the job status page.
+
+        """
+        return self.enqueue_sync(request, SyncJobKindEnum.insights)
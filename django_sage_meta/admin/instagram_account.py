@@ -1,10 +1,9 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
-from django.http import HttpResponse
-from django.urls import path, reverse
-from django.shortcuts import redirect
+from django.urls import path
 
-from django_sage_meta.repository import SyncService
+from django_sage_meta.admin.job import SyncJobEnqueueMixin
+from django_sage_meta.helper.choice import SyncJobKindEnum
 from django_sage_meta.models import InstagramAccount, Story
 
 
@@ -16,7 +15,7 @@ class StoryInline(admin.TabularInline):
 
 
 @admin.register(InstagramAccount)
-class InstagramAccountAdmin(admin.ModelAdmin):
+class InstagramAccountAdmin(SyncJobEnqueueMixin, admin.ModelAdmin):
     save_on_top = True
     change_list_template = "admin/email/insta.html"
     list_display = (
@@ -61,15 +60,13 @@ class InstagramAccountAdmin(admin.ModelAdmin):
         return custom_urls + urls
 
     def sync_insta_business(self, request):
-        try:
-            SyncService.sync_instagram_accounts()
-            self.message_user(
-                request, _("Instagram accounts synchronized successfully.")
-            )
-            change_list_url = reverse(
-                f"admin:{self.model._meta.app_label}_{self.model._meta.model_name}_changelist"
-            )
-            return redirect(change_list_url)
-        except Exception as e:
-            self.message_user(request, _(f"An error occurred: {e}"), level="error")
-            return HttpResponse(f"An error occurred: {e}", status=500)
+        """Queues a background sync of Instagram accounts.
+
+        Args:
+            request (HttpRequest): The current request object.
+
+        Returns:
+            HttpResponse: A redirect to the job status page.
+
+        """
+        return self.enqueue_sync(request, SyncJobKindEnum.accounts)
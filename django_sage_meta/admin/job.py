@@ -0,0 +1,103 @@
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+from django.urls import reverse
+from django.shortcuts import redirect
+
+from django_sage_meta.models import SyncJob
+from django_sage_meta.repository.jobs import enqueue_job
+
+
+class SyncJobEnqueueMixin:
+    """Admin mixin whose sync buttons queue a background job.
+
+    The admin request only inserts a job row and returns right away; a
+    ``sync_worker`` process runs the sync.
+
+    """
+
+    def enqueue_sync(self, request, kind):
+        """Queue a sync job and redirect to its status page.
+
+        Args:
+            request (HttpRequest): The current request object.
+            kind (str): A ``SyncJobKindEnum`` value.
+
+        Returns:
+            HttpResponse: A redirect to the job status page.
+
+        """
+        try:
+            job, created = enqueue_job(kind)
+        except Exception as e:
+            self.message_user(request, _(f"An error occurred: {e}"), level="error")
+            return redirect(
+                reverse(
+                    f"admin:{self.model._meta.app_label}_{self.model._meta.model_name}_changelist"
+                )
+            )
+
+        if created:
+            self.message_user(request, _("Synchronization queued."))
+        else:
+            self.message_user(
+                request,
+                _("This synchronization is already {}.").format(job.status),
+                level="warning",
+            )
+        return redirect(
+            reverse(
+                f"admin:{job._meta.app_label}_{job._meta.model_name}_change",
+                args=[job.pk],
+            )
+        )
+
+
+@admin.register(SyncJob)
+class SyncJobAdmin(admin.ModelAdmin):
+    change_form_template = "admin/email/job.html"
+    list_display = (
+        "id",
+        "kind",
+        "status",
+        "processed",
+        "total",
+        "rows",
+        "created_at",
+        "finished_at",
+    )
+    list_filter = ("kind", "status")
+    ordering = ("-created_at",)
+    readonly_fields = (
+        "kind",
+        "status",
+        "processed",
+        "total",
+        "rows",
+        "error",
+        "worker",
+        "created_at",
+        "started_at",
+        "heartbeat_at",
+        "finished_at",
+    )
+    fieldsets = (
+        ("Job", {"fields": ("kind", "status", "processed", "total", "rows", "error")}),
+        (
+            "Timing",
+            {
+                "fields": (
+                    "worker",
+                    "created_at",
+                    "started_at",
+                    "heartbeat_at",
+                    "finished_at",
+                )
+            },
+        ),
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -1,11 +1,13 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
-from django.urls import path, reverse
-from django.shortcuts import redirect
+from django.urls import path
 
 
+from django_sage_meta.admin.job import SyncJobEnqueueMixin
+from django_sage_meta.admin.search import FullTextSearchMixin
+from django_sage_meta.helper.choice import SyncJobKindEnum
 from django_sage_meta.models import Media, Comment
-from django_sage_meta.repository import SyncService, PublisherService
+from django_sage_meta.repository import PublisherService
 
 
 class CommentInline(admin.TabularInline):
@@ -16,7 +18,7 @@ class CommentInline(admin.TabularInline):
 
 
 @admin.register(Media)
-class MediaAdmin(admin.ModelAdmin):
+class MediaAdmin(FullTextSearchMixin, SyncJobEnqueueMixin, admin.ModelAdmin):
     save_on_top = True
     list_display = (
         "id",
@@ -26,11 +28,13 @@ class MediaAdmin(admin.ModelAdmin):
         "like_counts",
         "comments_counts",
         "username",
+        "published_at",
     )
     change_list_template = "admin/email/media.html"
-    search_fields = ("media_id", "caption", "kind")
-    search_help_text = _("Search by Media ID, Caption, or Media Type")
-    list_filter = ("kind", "like_counts", "comments_counts")
+    search_fields = ("media_id", "caption")
+    search_id_fields = ("media_id",)
+    search_help_text = _("Search by Media ID or words of the Caption")
+    list_filter = ("kind", "published_at", "like_counts", "comments_counts")
     ordering = ("id",)
     inlines = [CommentInline]
 
@@ -74,26 +78,16 @@ class MediaAdmin(admin.ModelAdmin):
         return super().get_fieldsets(request, obj)
 
     def sync_media(self, request):
-        """Synchronizes media by calling the SyncService.
-
-        This method attempts to synchronize media and returns an appropriate HttpResponse.
+        """Queues a background sync of media.
 
         Args:
             request (HttpRequest): The current request object.
 
         Returns:
-            HttpResponse: An HttpResponse indicating success or failure.
+            HttpResponse: A redirect to the job status page.
 
         """
-        try:
-            SyncService.sync_media()
-            self.message_user(request, _("Instagram medias synchronized successfully."))
-            change_list_url = reverse(
-                f"admin:{self.model._meta.app_label}_{self.model._meta.model_name}_changelist"
-            )
-            return redirect(change_list_url)
-        except Exception as e:
-            self.message_user(request, _(f"An error occurred: {e}"), level="error")
+        return self.enqueue_sync(request, SyncJobKindEnum.media)
 
     def save_model(self, request, obj, form, change):
         """Saves the model and publishes the media using the PublisherService.
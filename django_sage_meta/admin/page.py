@@ -1,14 +1,14 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
-from django.urls import path, reverse
-from django.shortcuts import redirect
+from django.urls import path
 
+from django_sage_meta.admin.job import SyncJobEnqueueMixin
+from django_sage_meta.helper.choice import SyncJobKindEnum
 from django_sage_meta.models import FacebookPageData
-from django_sage_meta.repository import SyncService
 
 
 @admin.register(FacebookPageData)
-class FacebookPageDataAdmin(admin.ModelAdmin):
+class FacebookPageDataAdmin(SyncJobEnqueueMixin, admin.ModelAdmin):
     save_on_top = True
     change_list_template = "admin/email/page.html"
 
@@ -44,9 +44,13 @@ class FacebookPageDataAdmin(admin.ModelAdmin):
         return custom_urls + urls
 
     def sync_insta_page(self, request):
-        SyncService.sync_facebook_pages()
-        self.message_user(request, _("Instagram pages synchronized successfully."))
-        change_list_url = reverse(
-            f"admin:{self.model._meta.app_label}_{self.model._meta.model_name}_changelist"
-        )
-        return redirect(change_list_url)
+        """Queues a background sync of Facebook pages.
+
+        Args:
+            request (HttpRequest): The current request object.
+
+        Returns:
+            HttpResponse: A redirect to the job status page.
+
+        """
+        return self.enqueue_sync(request, SyncJobKindEnum.pages)
@@ -1,20 +1,21 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
-from django.urls import path, reverse
-from django.shortcuts import redirect
+from django.urls import path
 
+from django_sage_meta.admin.job import SyncJobEnqueueMixin
+from django_sage_meta.helper.choice import SyncJobKindEnum
 from django_sage_meta.models import Story
-from django_sage_meta.repository import SyncService, PublisherService
+from django_sage_meta.repository import PublisherService
 
 
 @admin.register(Story)
-class StoryAdmin(admin.ModelAdmin):
+class StoryAdmin(SyncJobEnqueueMixin, admin.ModelAdmin):
     change_list_template = "admin/email/story.html"
     save_on_top = True
-    list_display = ("id", "story_id", "media_type", "media_url", "timestamp")
+    list_display = ("id", "story_id", "media_type", "media_url", "published_at")
     search_fields = ("story_id", "media_type", "media_url")
     search_help_text = _("Search by Story ID, Media Type, or Media URL")
-    list_filter = ("media_type", "timestamp")
+    list_filter = ("media_type", "published_at")
     ordering = ("id",)
     fieldsets = (
         ("Content", {"fields": ("story_id", "media_type", "media_url", "timestamp")}),
@@ -40,28 +41,16 @@ class StoryAdmin(admin.ModelAdmin):
         return custom_urls + urls
 
     def sync_insta_story(self, request):
-        """Synchronizes stories by calling the SyncService.
-
-        This method attempts to synchronize stories and returns an appropriate HttpResponse.
+        """Queues a background sync of stories.
 
         Args:
             request (HttpRequest): The current request object.
 
         Returns:
-            HttpResponse: An HttpResponse indicating success or failure.
+            HttpResponse: A redirect to the job status page.
 
         """
-        try:
-            SyncService.sync_stories()
-            self.message_user(
-                request, _("Instagram accounts synchronized successfully.")
-            )
-            change_list_url = reverse(
-                f"admin:{self.model._meta.app_label}_{self.model._meta.model_name}_changelist"
-            )
-            return redirect(change_list_url)
-        except Exception as e:
-            self.message_user(request, _(f"An error occurred: {e}"), level="error")
+        return self.enqueue_sync(request, SyncJobKindEnum.stories)
 
     def get_fieldsets(self, request, obj=None):
         """Returns the fieldsets for the admin form.
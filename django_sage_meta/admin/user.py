@@ -1,14 +1,14 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
-from django.urls import path, reverse
-from django.shortcuts import redirect
+from django.urls import path
 
+from django_sage_meta.admin.job import SyncJobEnqueueMixin
+from django_sage_meta.helper.choice import SyncJobKindEnum
 from django_sage_meta.models import UserData
-from django_sage_meta.repository import SyncService
 
 
 @admin.register(UserData)
-class UserDataAdmin(admin.ModelAdmin):
+class UserDataAdmin(SyncJobEnqueueMixin, admin.ModelAdmin):
     save_on_top = True
     change_list_template = "admin/email/user.html"
     list_display = ("id", "user_id", "name", "email")
@@ -30,12 +30,13 @@ class UserDataAdmin(admin.ModelAdmin):
         return custom_urls + urls
 
     def sync_insta_user(self, request):
-        try:
-            SyncService.sync_user_data()
-            self.message_user(request, _("Instagram users synchronized successfully."))
-            change_list_url = reverse(
-                f"admin:{self.model._meta.app_label}_{self.model._meta.model_name}_changelist"
-            )
-            return redirect(change_list_url)
-        except Exception as e:
-            self.message_user(request, _(f"An error occurred: {e}"), level="error")
+        """Queues a background sync of user data.
+
+        Args:
+            request (HttpRequest): The current request object.
+
+        Returns:
+            HttpResponse: A redirect to the job status page.
+
+        """
+        return self.enqueue_sync(request, SyncJobKindEnum.users)
@@ -9,3 +9,32 @@ class ContentFileEnum(models.TextChoices):
 class InsightKindEnum(models.TextChoices):
     account = ("account", "ACCOUNT")
     media = ("media", "MEDIA")
+
+
+class SyncResourceEnum(models.TextChoices):
+    media = ("media", "MEDIA")
+    comments = ("comments", "COMMENTS")
+    stories = ("stories", "STORIES")
+    rollups = ("rollups", "ROLLUPS")
+
+
+class RollupGranularityEnum(models.TextChoices):
+    day = ("day", "DAY")
+    week = ("week", "WEEK")
+
+
+class SyncJobKindEnum(models.TextChoices):
+    categories = ("categories", "CATEGORIES")
+    users = ("users", "USERS")
+    accounts = ("accounts", "ACCOUNTS")
+    pages = ("pages", "PAGES")
+    media = ("media", "MEDIA")
+    insights = ("insights", "INSIGHTS")
+    stories = ("stories", "STORIES")
+
+
+class SyncJobStatusEnum(models.TextChoices):
+    queued = ("queued", "QUEUED")
+    running = ("running", "RUNNING")
+    done = ("done", "DONE")
+    failed = ("failed", "FAILED")
@@ -0,0 +1,282 @@
+"""A local stand-in for the Graph API endpoints used by the sync.
+
+It serves the user, its page and Instagram account, and deterministic
+media, comments, insights and stories. It implements batch calls and
+``ETag`` revalidation, so a full sync can run and its throughput be
+measured offline by pointing ``META_GRAPH_URL`` at it.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+VERSION_PREFIX = re.compile(r"^/v\d+(\.\d+)?")
+
+
+class GraphStub:
+    """Deterministic Graph data and request counters.
+
+    Args:
+        account_id (str): The Instagram account the media belong to.
+        username (str): Username reported for media and stories.
+        user_id (str): ID of the user answered for ``me``.
+        page_id (str): The Facebook page linked to the account.
+        media_count (int): Number of media items of the account.
+        comments_per_media (int): Comments returned for every media item.
+        latency (float): Seconds every HTTP request is delayed by.
+        call_budget (int, optional): Graph requests allowed per window
+            before the stub answers with rate limit errors. When set, every
+            response carries an ``X-App-Usage`` header with the share of the
+            budget used.
+        window (float): Length of the usage window in seconds.
+
+    """
+
+    def __init__(
+        self,
+        account_id="stub_account",
+        username="stub",
+        user_id="stub_user",
+        page_id="stub_page",
+        media_count=500,
+        comments_per_media=5,
+        latency=0.0,
+        call_budget=None,
+        window=60.0,
+    ):
+        self.account_id = account_id
+        self.username = username
+        self.user_id = user_id
+        self.page_id = page_id
+        self.media_count = media_count
+        self.comments_per_media = comments_per_media
+        self.latency = latency
+        self.call_budget = call_budget
+        self.window = window
+        self.http_requests = 0
+        self.graph_requests = 0
+        self._window_requests = 0
+        self._window_started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def count(self, http=0, graph=0):
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_started >= self.window:
+                self._window_requests = 0
+                self._window_started = now
+            self.http_requests += http
+            self.graph_requests += graph
+            self._window_requests += graph
+
+    def usage(self):
+        """Return the share of the window's call budget used, in percent."""
+        if not self.call_budget:
+            return 0
+        return min(100, self._window_requests * 100 // self.call_budget)
+
+    def get(self, path, params):
+        """Answer a single Graph GET request.
+
+        Returns:
+            tuple: The HTTP status code and the JSON body.
+
+        """
+        parts = path.strip("/").split("/")
+        if len(parts) not in (1, 2):
+            return 404, {"error": {"message": f"Unknown path {path}"}}
+        if self.call_budget and self._window_requests > self.call_budget:
+            return 400, {
+                "error": {"message": "Application request limit reached", "code": 4}
+            }
+        if len(parts) == 1:
+            return self._object(parts[0])
+        object_id, edge = parts
+        if edge == "accounts" and object_id in ("me", self.user_id):
+            return 200, {"data": [self._page()]}
+        if edge == "media" and object_id == self.account_id:
+            return 200, self._media_page(params)
+        if edge == "comments":
+            return 200, {"data": self._comments(object_id)}
+        if edge == "insights":
+            return 200, {"data": self._insights(object_id, params)}
+        if edge == "stories" and object_id == self.account_id:
+            return 200, {"data": self._stories()}
+        return 404, {"error": {"message": f"Unknown path {path}"}}
+
+    def _object(self, object_id):
+        if object_id in ("me", self.user_id):
+            return 200, {
+                "id": self.user_id,
+                "name": "Stub User",
+                "email": "stub@example.com",
+            }
+        if object_id == self.page_id:
+            return 200, {
+                "id": self.page_id,
+                "instagram_business_account": {"id": self.account_id},
+            }
+        if object_id == self.account_id:
+            return 200, {
+                "id": self.account_id,
+                "username": self.username,
+                "follows_count": 10,
+                "followers_count": 100,
+                "media_count": self.media_count,
+                "biography": "Served by the Graph stub",
+            }
+        return 404, {"error": {"message": f"Unknown object {object_id}"}}
+
+    def _page(self):
+        return {
+            "id": self.page_id,
+            "name": "Stub Page",
+            "category": "Brand",
+            "category_list": [{"id": "stub_category", "name": "Brand"}],
+            "tasks": ["ANALYZE", "CREATE_CONTENT"],
+            "access_token": "stub_page_token",
+        }
+
+    def _media_page(self, params):
+        limit = int(params.get("limit", 25))
+        start = int(params.get("after") or 0)
+        end = min(start + limit, self.media_count)
+        payload = {
+            "data": [
+                {
+                    "id": f"{self.account_id}_m{index}",
+                    "username": self.username,
+                    "caption": f"Caption {index}",
+                    "media_type": "IMAGE",
+                    "media_url": f"https://example.com/{index}.jpg",
+                    "timestamp": self._timestamp(index),
+                    "like_count": index,
+                    "comments_count": self.comments_per_media,
+                }
+                for index in range(start, end)
+            ],
+            "paging": {"cursors": {"after": str(end)}},
+        }
+        if end < self.media_count:
+            payload["paging"]["next"] = "stub"
+        return payload
+
+    def _comments(self, media_id):
+        return [
+            {
+                "id": f"{media_id}_c{index}",
+                "text": f"Comment {index}",
+                "username": "commenter",
+                "like_count": index,
+                "timestamp": "2024-01-01T00:00:00+0000",
+            }
+            for index in range(self.comments_per_media)
+        ]
+
+    def _insights(self, object_id, params):
+        metrics = params.get("metric", "").split(",")
+        period = params.get("period", "lifetime")
+        return [
+            {
+                "id": f"{object_id}/insights/{metric}/{period}",
+                "name": metric,
+                "period": period,
+                "values": [{"value": 1}],
+                "title": metric.title(),
+                "description": "",
+            }
+            for metric in metrics
+            if metric
+        ]
+
+    def _stories(self):
+        return [
+            {
+                "id": f"{self.account_id}_s0",
+                "username": self.username,
+                "media_type": "IMAGE",
+                "media_url": "https://example.com/story.jpg",
+                "timestamp": self._timestamp(0),
+            }
+        ]
+
+    def _timestamp(self, index):
+        return time.strftime(
+            "%Y-%m-%dT%H:%M:%S+0000", time.gmtime(1_700_000_000 - index * 3600)
+        )
+
+
+class GraphStubHandler(BaseHTTPRequestHandler):
+    stub = None
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self._delay()
+        self.stub.count(http=1, graph=1)
+        status, body = self.stub.get(self._strip_version(url.path), _params(url.query))
+        payload = json.dumps(body).encode()
+        etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self._reply(304, None, etag=etag)
+            return
+        self._reply(status, body, etag=etag if status == 200 else None)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        form = _params(self.rfile.read(length).decode())
+        self._delay()
+        if "batch" not in form:
+            self._reply(400, {"error": {"message": "Missing batch parameter"}})
+            return
+
+        batch = json.loads(form["batch"])
+        self.stub.count(http=1, graph=len(batch))
+        results = []
+        for request in batch:
+            url = urlsplit("/" + request["relative_url"].lstrip("/"))
+            status, body = self.stub.get(url.path, _params(url.query))
+            results.append({"code": status, "headers": [], "body": json.dumps(body)})
+        self._reply(200, results)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    def _delay(self):
+        if self.stub.latency:
+            time.sleep(self.stub.latency)
+
+    def _strip_version(self, path):
+        return VERSION_PREFIX.sub("", path)
+
+    def _reply(self, status, body, etag=None):
+        payload = b"" if status == 304 else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if etag:
+            self.send_header("ETag", etag)
+        if self.stub.call_budget:
+            usage = self.stub.usage()
+            self.send_header(
+                "X-App-Usage",
+                json.dumps({"call_count": usage, "total_cputime": 0, "total_time": 0}),
+            )
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def make_server(stub, host="127.0.0.1", port=8765):
+    """Create a threaded HTTP server answering with ``stub``."""
+    handler = type("BoundGraphStubHandler", (GraphStubHandler,), {"stub": stub})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def _params(query):
+    return {key: values[-1] for key, values in parse_qs(query).items()}
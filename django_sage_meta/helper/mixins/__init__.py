@@ -1,3 +1,4 @@
 from .add import AdditionalDataMixin
+from .fingerprint import FingerprintMixin
 
-__all__ = ["AdditionalDataMixin"]
+__all__ = ["AdditionalDataMixin", "FingerprintMixin"]
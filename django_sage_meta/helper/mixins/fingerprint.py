@@ -0,0 +1,25 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class FingerprintMixin(models.Model):
+    """Mixin storing a content fingerprint for synced rows.
+
+    Attributes:
+        fingerprint (str): SHA-256 hash of the normalized Graph payload the
+            row was last synced from.
+
+    """
+
+    fingerprint = models.CharField(
+        _("Fingerprint"),
+        max_length=64,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_("Hash of the synced content, used for change detection"),
+        db_comment="SHA-256 of the normalized Graph payload the row was last synced from",
+    )
+
+    class Meta:
+        abstract = True
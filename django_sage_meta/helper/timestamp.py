@@ -0,0 +1,40 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+GRAPH_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+
+def parse_graph_timestamp(value):
+    """Parse a Graph API timestamp into a timezone-aware datetime.
+
+    The Graph API returns timestamps such as ``2024-07-29T10:11:12+0000``.
+    ISO 8601 variants are accepted as a fallback and naive values are
+    assumed to be UTC.
+
+    Args:
+        value (str | datetime | None): The raw timestamp.
+
+    Returns:
+        datetime | None: The parsed timestamp, or None if it is empty or
+        cannot be parsed.
+
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.strptime(value, GRAPH_TIMESTAMP_FORMAT)
+        except ValueError:
+            try:
+                parsed = parse_datetime(value)
+            except ValueError:
+                return None
+            if parsed is None:
+                return None
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, dt_timezone.utc)
+    return parsed
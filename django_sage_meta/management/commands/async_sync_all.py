@@ -0,0 +1,132 @@
+import asyncio
+import logging
+
+from asgiref.sync import sync_to_async
+from django.core.management.base import BaseCommand, CommandError
+from django_sage_meta.repository.async_service import AsyncSyncService
+from django_sage_meta.repository.client import client_provider
+from django_sage_meta.repository.resolver import SyncResolver
+from django_sage_meta.repository.scheduler import count_rows
+from django_sage_meta.repository.sharding import list_account_targets
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Synchronize all data on a single event loop, fetching media, comments, "
+        "insights and stories with many Graph requests in flight."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only sync media, comments and stories newer than the stored watermark.",
+        )
+        parser.add_argument(
+            "--all-accounts",
+            action="store_true",
+            help=(
+                "Sync media, insights and stories of every Instagram account "
+                "linked to a stored page, each with its page token."
+            ),
+        )
+
+    def show_success_msg(self, msg: str):
+        """
+        Display a success message on the console.
+
+        Args:
+        - msg (str): The success message.
+        """
+        self.stdout.write(self.style.SUCCESS(msg))
+
+    def show_error_msg(self, msg: str):
+        """
+        Display an error message on the console.
+
+        Args:
+        - msg (str): The error message.
+        """
+        self.stdout.write(self.style.ERROR(msg))
+
+    def show_warning_msg(self, msg: str):
+        """
+        Display an error message on the console.
+
+        Args:
+        - msg (str): The error message.
+        """
+        self.stdout.write(self.style.WARNING(msg))
+
+    async def run(self, incremental):
+        service = AsyncSyncService()
+        async with service.transport:
+            return await service.sync_all(incremental=incremental)
+
+    async def run_all_accounts(self, incremental):
+        """
+        Run the shared stages once, then the stages of every account.
+
+        Accounts run concurrently on the event loop and share the Graph
+        throttle. An account that fails is logged and does not stop the
+        others.
+
+        Args:
+        - incremental (bool): Whether media and stories sync incrementally.
+
+        Returns:
+        - tuple: A dict mapping stage names, prefixed with the account ID
+          for account stages, to their results, and the failed account IDs.
+        """
+        resolver = SyncResolver()
+        service = AsyncSyncService(resolver=resolver)
+        async with service.transport:
+            results = await service.sync_shared()
+
+        async def sync_target(target):
+            account = AsyncSyncService(
+                resolver=resolver,
+                insta_id=target.account_id,
+                access_token=target.access_token,
+            )
+            async with account.transport:
+                return await account.sync_account(incremental=incremental)
+
+        targets = await sync_to_async(list_account_targets)()
+        reports = await asyncio.gather(
+            *(sync_target(target) for target in targets), return_exceptions=True
+        )
+        failed = []
+        for target, report in zip(targets, reports):
+            if isinstance(report, Exception):
+                logger.error(f"Async sync of {target.account_id} failed: {report}")
+                self.show_error_msg(f"{target.account_id} failed: {report}")
+                failed.append(target.account_id)
+                continue
+            for name, result in report.items():
+                results[f"{target.account_id} {name}"] = result
+        return results, failed
+
+    def handle(self, *args, **kwargs):
+        try:
+            self.show_warning_msg("Starting async synchronization...")
+            client_provider.invalidate()
+            failed = []
+            if kwargs["all_accounts"]:
+                results, failed = asyncio.run(
+                    self.run_all_accounts(kwargs["incremental"])
+                )
+            else:
+                results = asyncio.run(self.run(kwargs["incremental"]))
+            width = max(map(len, results), default=0) + 2
+            for name, result in results.items():
+                self.stdout.write(f"{name:<{width}}{count_rows(result):>10}")
+        except Exception as e:
+            logger.error(f"An error occurred during async synchronization: {e}")
+            raise CommandError(f"An error occurred: {e}") from e
+
+        if failed:
+            raise CommandError(f"Accounts failed: {', '.join(failed)}.")
+        self.show_success_msg("All data synchronized successfully.")
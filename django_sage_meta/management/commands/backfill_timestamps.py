@@ -0,0 +1,36 @@
+import logging
+
+from django.core.management.base import BaseCommand
+from django_sage_meta.models import Comment, Media, Story
+from django_sage_meta.repository.backfill import backfill_published_at
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Parse the raw Graph timestamps of stored media, comments and stories "
+        "into their published_at columns, in chunks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help="Rows updated per query. Defaults to META_BACKFILL_CHUNK_SIZE.",
+        )
+
+    def show_success_msg(self, msg: str):
+        """
+        Display a success message on the console.
+
+        Args:
+        - msg (str): The success message.
+        """
+        self.stdout.write(self.style.SUCCESS(msg))
+
+    def handle(self, *args, **kwargs):
+        for model in (Media, Comment, Story):
+            updated = backfill_published_at(model, kwargs["chunk_size"])
+            self.show_success_msg(f"{model.__name__}: {updated} rows backfilled.")
@@ -0,0 +1,84 @@
+from django.core.management.base import BaseCommand
+from django_sage_meta.helper.graph_stub import GraphStub, make_server
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve a local stand-in for the Graph API, including batch calls, to "
+        "run a sync and measure its throughput offline. Point META_GRAPH_URL "
+        "at it and set INSTA_ID to the account ID."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1", help="Interface to bind.")
+        parser.add_argument("--port", type=int, default=8765, help="Port to bind.")
+        parser.add_argument(
+            "--account-id",
+            default="stub_account",
+            help="Instagram account ID the media belong to (use as INSTA_ID).",
+        )
+        parser.add_argument(
+            "--username",
+            default="stub",
+            help="Username reported for media and stories.",
+        )
+        parser.add_argument(
+            "--user-id", default="stub_user", help="ID of the user answered for me."
+        )
+        parser.add_argument(
+            "--page-id",
+            default="stub_page",
+            help="ID of the Facebook page linked to the account.",
+        )
+        parser.add_argument(
+            "--media", type=int, default=500, help="Number of media items served."
+        )
+        parser.add_argument(
+            "--comments", type=int, default=5, help="Comments served per media item."
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.0,
+            help="Seconds every HTTP request is delayed by, to emulate network latency.",
+        )
+        parser.add_argument(
+            "--call-budget",
+            type=int,
+            default=None,
+            help="Graph requests allowed per window before answering with rate limit errors.",
+        )
+        parser.add_argument(
+            "--window",
+            type=float,
+            default=60.0,
+            help="Length of the call budget window in seconds.",
+        )
+
+    def handle(self, *args, **kwargs):
+        stub = GraphStub(
+            account_id=kwargs["account_id"],
+            username=kwargs["username"],
+            user_id=kwargs["user_id"],
+            page_id=kwargs["page_id"],
+            media_count=kwargs["media"],
+            comments_per_media=kwargs["comments"],
+            latency=kwargs["latency"],
+            call_budget=kwargs["call_budget"],
+            window=kwargs["window"],
+        )
+        server = make_server(stub, kwargs["host"], kwargs["port"])
+        self.stdout.write(
+            f"Graph stub listening, set META_GRAPH_URL = "
+            f"'http://{kwargs['host']}:{kwargs['port']}/v20.0'."
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.stdout.write(
+                f"Served {stub.graph_requests} Graph requests in "
+                f"{stub.http_requests} HTTP requests."
+            )
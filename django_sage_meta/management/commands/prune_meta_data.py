@@ -0,0 +1,100 @@
+import logging
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django_sage_meta.repository.retention import (
+    DEFAULT_ARCHIVE_DIR,
+    POLICIES,
+    get_retention,
+    prune,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete stories, comments and insights older than their retention "
+        "window in chunks, archiving them to gzip compressed JSON lines files."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--only",
+            nargs="+",
+            choices=[policy.name for policy in POLICIES],
+            help="Prune only these policies.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help="Rows deleted per transaction. Defaults to META_PRUNE_CHUNK_SIZE.",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            default=None,
+            help="Directory of the archive files. Defaults to META_ARCHIVE_DIR.",
+        )
+        parser.add_argument(
+            "--no-archive",
+            action="store_true",
+            help="Delete aged rows without archiving them.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the rows that would be pruned.",
+        )
+
+    def show_success_msg(self, msg: str):
+        """
+        Display a success message on the console.
+
+        Args:
+        - msg (str): The success message.
+        """
+        self.stdout.write(self.style.SUCCESS(msg))
+
+    def show_warning_msg(self, msg: str):
+        """
+        Display a warning message on the console.
+
+        Args:
+        - msg (str): The warning message.
+        """
+        self.stdout.write(self.style.WARNING(msg))
+
+    def handle(self, *args, **kwargs):
+        archive_dir = None
+        if not kwargs["no_archive"]:
+            archive_dir = kwargs["archive_dir"] or getattr(
+                settings, "META_ARCHIVE_DIR", DEFAULT_ARCHIVE_DIR
+            )
+        now = timezone.now()
+        for policy in POLICIES:
+            if kwargs["only"] and policy.name not in kwargs["only"]:
+                continue
+            retention = get_retention(policy.name)
+            if retention is None:
+                self.show_warning_msg(f"{policy.name}: kept forever, skipped.")
+                continue
+
+            rows, path = prune(
+                policy,
+                now - retention,
+                chunk_size=kwargs["chunk_size"],
+                archive_dir=archive_dir,
+                dry_run=kwargs["dry_run"],
+            )
+            if kwargs["dry_run"]:
+                self.show_warning_msg(
+                    f"{policy.name}: {rows} rows older than {retention.days} days."
+                )
+            elif path:
+                self.show_success_msg(
+                    f"{policy.name}: {rows} rows pruned, archived to {path}."
+                )
+            else:
+                self.show_success_msg(f"{policy.name}: {rows} rows pruned.")
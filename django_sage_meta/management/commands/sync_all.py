@@ -1,12 +1,154 @@
 import logging
 
-from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django_sage_meta.repository.checkpoint import (
+    clear_checkpoints,
+    complete_stage,
+    completed_stages,
+)
+from django_sage_meta.repository.cache import graph_cache
+from django_sage_meta.repository.client import client_provider
+from django_sage_meta.repository.resolver import SyncResolver
+from django_sage_meta.repository.rollups import refresh_insight_rollups
+from django_sage_meta.repository.scheduler import Stage, StageScheduler
 from django_sage_meta.repository.service import SyncService
+from django_sage_meta.repository.sharding import (
+    ACCOUNT_STAGES,
+    list_account_targets,
+    sync_accounts,
+)
+from django_sage_meta.repository.throttle import graph_throttle
 
 logger = logging.getLogger(__name__)
 
+# Stages run by the scheduler. The rollup refresh needs the values of
+# every stage and account, so it runs as a plain step after all of them.
+SCHEDULED_STAGES = (
+    "categories",
+    "users",
+    "accounts",
+    "pages",
+    "media",
+    "insights",
+    "stories",
+)
+STAGE_NAMES = SCHEDULED_STAGES + ("rollups",)
+
+
 class Command(BaseCommand):
-    help = 'Synchronize all data in the specified order: Categories, Users, Instagram Accounts, Facebook Pages, Media, Insights, Stories.'
+    help = (
+        "Synchronize all data: Categories, Users, Instagram Accounts, Facebook Pages, "
+        "Media, Insights, Stories, then refresh the insight rollups. Independent "
+        "stages can run in parallel."
+    )
+
+    def add_arguments(self, parser):
+        mode = parser.add_mutually_exclusive_group()
+        mode.add_argument(
+            "--full",
+            action="store_false",
+            dest="incremental",
+            help="Refetch and re-diff the whole history (default).",
+        )
+        mode.add_argument(
+            "--incremental",
+            action="store_true",
+            dest="incremental",
+            help="Only sync media, comments and stories newer than the stored watermark.",
+        )
+        mode.add_argument(
+            "--counters-only",
+            action="store_true",
+            help=(
+                "Only refresh the like and comment counts of recent media, "
+                "requesting nothing else from the Graph API."
+            ),
+        )
+        parser.set_defaults(incremental=False)
+        parser.add_argument(
+            "--max-parallel",
+            type=int,
+            default=1,
+            help="Maximum number of independent stages to run at the same time.",
+        )
+        parser.add_argument(
+            "--only",
+            nargs="+",
+            choices=STAGE_NAMES,
+            help="Run only these stages.",
+        )
+        parser.add_argument(
+            "--skip",
+            nargs="+",
+            choices=STAGE_NAMES,
+            default=[],
+            help="Do not run these stages.",
+        )
+        parser.add_argument(
+            "--all-accounts",
+            action="store_true",
+            help=(
+                "Sync media, insights and stories of every Instagram account linked "
+                "to a stored page, each with its own page token."
+            ),
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes the accounts are spread over with --all-accounts.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help=(
+                "Continue an interrupted run: skip the stages it completed and "
+                "resume media from the last saved page."
+            ),
+        )
+
+    def get_stages(self, incremental, resolver, resume=False):
+        """
+        Build the sync stages and their dependencies.
+
+        Args:
+        - incremental (bool): Whether media and stories sync incrementally.
+        - resolver (SyncResolver): The foreign key resolver shared by all stages.
+        - resume (bool): Whether media resumes from its checkpoint.
+        """
+        return [
+            Stage("categories", lambda: SyncService.sync_categories(resolver=resolver)),
+            Stage("users", lambda: SyncService.sync_user_data(resolver=resolver)),
+            Stage(
+                "accounts",
+                lambda: SyncService.sync_instagram_accounts(resolver=resolver),
+            ),
+            Stage(
+                "pages",
+                lambda: SyncService.sync_facebook_pages(resolver=resolver),
+                depends_on=("categories", "users", "accounts"),
+            ),
+            Stage(
+                "media",
+                lambda: SyncService.sync_media(
+                    incremental=incremental, resolver=resolver, resume=resume
+                ),
+                depends_on=("accounts",),
+            ),
+            Stage(
+                "insights",
+                lambda: SyncService.sync_insights(resolver=resolver),
+                depends_on=("accounts",),
+            ),
+            Stage(
+                "stories",
+                lambda: SyncService.sync_stories(
+                    incremental=incremental, resolver=resolver
+                ),
+                depends_on=("accounts",),
+            ),
+        ]
 
     def show_success_msg(self, msg: str):
         """
@@ -35,40 +177,220 @@ class Command(BaseCommand):
         """
         self.stdout.write(self.style.WARNING(msg))
 
-    def handle(self, *args, **kwargs):
-        try:
-            self.show_warning_msg('Starting synchronization...')
+    def show_summary(self, reports):
+        """
+        Display the wall-clock time and row count of every stage.
+
+        Args:
+        - reports (list): The StageReport of every selected stage.
+        """
+        self.stdout.write(f"{'Stage':<12}{'Status':<10}{'Seconds':>10}{'Rows':>10}")
+        for report in reports:
+            self.stdout.write(
+                f"{report.name:<12}{report.status:<10}"
+                f"{report.duration:>10.2f}{report.rows:>10}"
+            )
+
+    def show_usage(self):
+        """
+        Display the Graph API usage reported by Meta, the throttle state and
+        the response cache hits.
+        """
+        metrics = graph_throttle.metrics()
+        self.stdout.write(
+            f"Graph usage {metrics['usage']}%, {metrics['requests']} requests, "
+            f"{metrics['rate']} req/s allowed, {metrics['waited']}s throttled, "
+            f"{metrics['rate_limited']} rate limit errors."
+        )
+        logger.info(f"Graph throttle metrics: {metrics}")
+        cache_metrics = graph_cache.metrics()
+        self.stdout.write(
+            f"Graph cache {cache_metrics['hits']} hits, "
+            f"{cache_metrics['revalidated']} revalidated, "
+            f"{cache_metrics['misses']} misses."
+        )
+
+    def on_account_finish(self, report):
+        if report.status == "done":
+            self.show_success_msg(
+                f"Account {report.account_id} synced in {report.duration:.2f}s, "
+                f"{report.rows} rows."
+            )
+        else:
+            self.show_error_msg(f"Account {report.account_id} failed: {report.error}")
+
+    def run_all_accounts(self, incremental, workers, stages, resume=False):
+        """
+        Sync the per-account stages of every stored Instagram account.
+
+        Args:
+        - incremental (bool): Whether media and stories sync incrementally.
+        - workers (int): Number of worker processes.
+        - stages (list): The per-account stages to run.
+        - resume (bool): Whether each account resumes from its checkpoints.
+        """
+        targets = list_account_targets()
+        self.show_warning_msg(
+            f"Syncing {len(targets)} accounts with {workers} workers..."
+        )
+        reports = sync_accounts(
+            targets,
+            workers=workers,
+            incremental=incremental,
+            stages=stages,
+            on_finish=self.on_account_finish,
+            resume=resume,
+        )
+        failed = [report for report in reports if report.status != "done"]
+        if failed:
+            self.show_error_msg(f"{len(failed)} of {len(reports)} accounts failed.")
+        return not failed
 
-            self.show_warning_msg('Syncing Categories...')
-            SyncService.sync_categories()
-            self.show_success_msg('Categories synced successfully.')
+    def refresh_counters(self, all_accounts):
+        """
+        Refresh the like and comment counts of recent media.
+
+        Args:
+        - all_accounts (bool): Refresh every stored account with its page
+          token instead of the configured one.
+        """
+        targets = list_account_targets() if all_accounts else [None]
+        for target in targets:
+            account_id = target.account_id if target else settings.INSTA_ID
+            result = SyncService.refresh_media_counters(
+                insta_id=account_id,
+                access_token=target.access_token if target else None,
+            )
+            self.show_success_msg(
+                f"Counters refreshed for {account_id}: {result.updated} media changed."
+            )
 
-            self.show_warning_msg('Syncing Users...')
-            SyncService.sync_user_data()
-            self.show_success_msg('Users synced successfully.')
+    def on_stage_finish(self, report):
+        if report.status == "done":
+            complete_stage(report.name, settings.INSTA_ID)
+            self.show_success_msg(f"{report.name.capitalize()} synced successfully.")
+        elif report.status == "blocked":
+            self.show_warning_msg(
+                f"{report.name.capitalize()} skipped because a dependency failed."
+            )
+        else:
+            # The scheduler already logged the failure.
+            self.show_error_msg(f"{report.name.capitalize()} failed: {report.error}")
 
-            self.show_warning_msg('Syncing Instagram Accounts...')
-            SyncService.sync_instagram_accounts()
-            self.show_success_msg('Instagram Accounts synced successfully.')
+    def select_stages(self, only, skip, all_accounts):
+        """
+        Split the selected stages between the scheduler, the per-account
+        run and the rollup refresh.
 
-            self.show_warning_msg('Syncing Facebook Pages...')
-            SyncService.sync_facebook_pages()
-            self.show_success_msg('Facebook Pages synced successfully.')
+        Args:
+        - only (list): The stages given with --only, or None for all.
+        - skip (list): The stages given with --skip.
+        - all_accounts (bool): Whether account stages run per account.
 
-            self.show_warning_msg('Syncing Media...')
-            SyncService.sync_media()
-            self.show_success_msg('Media synced successfully.')
+        Returns:
+        - tuple: The stages the scheduler skips, the per-account stages and
+          whether the rollups are refreshed.
+        """
+        selected = [name for name in only or STAGE_NAMES if name not in skip]
+        account_stages = []
+        if all_accounts:
+            account_stages = [name for name in ACCOUNT_STAGES if name in selected]
+        skipped = [
+            name
+            for name in SCHEDULED_STAGES
+            if name not in selected or name in account_stages
+        ]
+        return skipped, account_stages, "rollups" in selected
 
-            self.show_warning_msg('Syncing Insights...')
-            SyncService.sync_insights()
-            self.show_success_msg('Insights synced successfully.')
+    def resumed_stages(self, resume):
+        """
+        Return the stages an interrupted run completed, and forget them
+        when not resuming.
 
-            self.show_warning_msg('Syncing Stories...')
-            SyncService.sync_stories()
-            self.show_success_msg('Stories synced successfully.')
+        Args:
+        - resume (bool): Whether the run resumes.
+        """
+        if not resume:
+            clear_checkpoints()
+            return set()
+        # The rollups always rerun, so only scheduler stages are skipped.
+        done = completed_stages(settings.INSTA_ID) & set(SCHEDULED_STAGES)
+        if done:
+            self.show_warning_msg(
+                f"Resuming, skipping completed stages: {', '.join(sorted(done))}."
+            )
+        return done
 
-            self.show_success_msg('All data synchronized successfully.')
+    def refresh_rollups(self, succeeded):
+        """
+        Refresh the insight rollups unless an earlier stage failed.
+
+        Args:
+        - succeeded (bool): Whether every stage and account succeeded.
+        """
+        if not succeeded:
+            self.show_warning_msg("Rollups skipped because a stage failed.")
+            return
+        self.show_warning_msg("Syncing rollups...")
+        result = refresh_insight_rollups()
+        self.show_success_msg(f"Rollups refreshed, {result.created} rows written.")
+
+    def handle(self, *args, **kwargs):
+        incremental = kwargs["incremental"]
+        all_accounts = kwargs["all_accounts"]
+        resume = kwargs["resume"]
+        if kwargs["workers"] < 1:
+            raise CommandError("--workers must be at least 1.")
+        if kwargs["workers"] > 1 and not all_accounts:
+            raise CommandError("--workers requires --all-accounts.")
+
+        skip, account_stages, refresh_rollups = self.select_stages(
+            kwargs["only"], kwargs["skip"], all_accounts
+        )
+        try:
+            if kwargs["counters_only"]:
+                client_provider.invalidate()
+                self.refresh_counters(all_accounts)
+                self.show_usage()
+                return
+
+            skip.extend(self.resumed_stages(resume))
+            mode = "incremental" if incremental else "full"
+            self.show_warning_msg(f"Starting {mode} synchronization...")
+            client_provider.invalidate()
+            resolver = SyncResolver()
+
+            scheduler = StageScheduler(
+                self.get_stages(incremental, resolver, resume),
+                max_parallel=kwargs["max_parallel"],
+            )
+            reports = scheduler.run(
+                skip=skip,
+                on_start=lambda name: self.show_warning_msg(f"Syncing {name}..."),
+                on_finish=self.on_stage_finish,
+            )
+            self.show_summary(reports)
+            succeeded = all(report.status == "done" for report in reports)
+
+            if account_stages:
+                succeeded = (
+                    self.run_all_accounts(
+                        incremental, kwargs["workers"], account_stages, resume
+                    )
+                    and succeeded
+                )
+            if refresh_rollups:
+                self.refresh_rollups(succeeded)
+
+            self.show_usage()
 
         except Exception as e:
             logger.error(f"An error occurred during synchronization: {e}")
-            self.show_error_msg(f"An error occurred: {e}")
+            raise CommandError(f"An error occurred: {e}") from e
+
+        if not succeeded:
+            raise CommandError("Synchronization finished with errors.")
+        # A finished run leaves nothing to resume, so the next --resume
+        # starts afresh instead of skipping every stage.
+        clear_checkpoints()
+        self.show_success_msg("All data synchronized successfully.")
@@ -0,0 +1,78 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django_sage_meta.repository.jobs import (
+    claim_job,
+    default_worker_name,
+    fail_stale_jobs,
+    run_job,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued sync jobs. Several workers can run side by side; each job "
+        "is claimed by exactly one of them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit as soon as the queue is empty.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait before polling an empty queue again.",
+        )
+        parser.add_argument(
+            "--name",
+            default=None,
+            help="Worker name recorded on claimed jobs. Defaults to host:pid.",
+        )
+
+    def show_success_msg(self, msg: str):
+        """
+        Display a success message on the console.
+
+        Args:
+        - msg (str): The success message.
+        """
+        self.stdout.write(self.style.SUCCESS(msg))
+
+    def show_error_msg(self, msg: str):
+        """
+        Display an error message on the console.
+
+        Args:
+        - msg (str): The error message.
+        """
+        self.stdout.write(self.style.ERROR(msg))
+
+    def handle(self, *args, **kwargs):
+        worker = kwargs["name"] or default_worker_name()
+        self.stdout.write(f"Sync worker {worker} started.")
+        try:
+            while True:
+                fail_stale_jobs()
+                job = claim_job(worker)
+                if job is None:
+                    if kwargs["once"]:
+                        break
+                    time.sleep(kwargs["poll_interval"])
+                    continue
+
+                self.stdout.write(f"Running {job}...")
+                job = run_job(job)
+                if job.error:
+                    self.show_error_msg(f"{job} failed: {job.error}")
+                else:
+                    self.show_success_msg(f"{job} finished, {job.rows} rows.")
+        except KeyboardInterrupt:
+            logger.info(f"Sync worker {worker} stopped.")
+        self.stdout.write(f"Sync worker {worker} stopped.")
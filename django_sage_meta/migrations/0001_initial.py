@@ -0,0 +1,257 @@
+# Generated by Django 5.1.15 on 2026-10-18 11:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('additional_data', models.JSONField(blank=True, db_comment='Any extra information that is not captured by other fields.', default=dict, help_text='Any extra information that is not captured by other fields.', verbose_name='Additional Data')),
+                ('category_id', models.CharField(db_comment='Primary key for the category', help_text='Unique identifier for the category', max_length=255, unique=True, verbose_name='Category ID')),
+                ('name', models.CharField(db_comment='The name of the category', help_text='Name of the category', max_length=255, verbose_name='Name')),
+            ],
+            options={
+                'verbose_name': 'Category',
+                'verbose_name_plural': 'Categories',
+                'indexes': [models.Index(fields=['name'], name='category_name_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='InstagramAccount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('additional_data', models.JSONField(blank=True, db_comment='Any extra information that is not captured by other fields.', default=dict, help_text='Any extra information that is not captured by other fields.', verbose_name='Additional Data')),
+                ('fingerprint', models.CharField(blank=True, db_comment='SHA-256 of the normalized Graph payload the row was last synced from', editable=False, help_text='Hash of the synced content, used for change detection', max_length=64, null=True, verbose_name='Fingerprint')),
+                ('account_id', models.CharField(db_comment='Primary key for the Instagram account', help_text='Unique identifier for the account', max_length=255, unique=True, verbose_name='Account ID')),
+                ('username', models.CharField(db_comment='The handle or username of the Instagram account', help_text='Username of the account', max_length=255, verbose_name='Username')),
+                ('follows_counts', models.IntegerField(db_comment='The total number of accounts followed by this Instagram account', help_text='Number of accounts this account follows', verbose_name='Follows Counts')),
+                ('followers_counts', models.IntegerField(db_comment='The total number of followers of this Instagram account', help_text='Number of followers of this account', verbose_name='Followers Count')),
+                ('media_counts', models.IntegerField(db_comment='The total number of media items posted by this Instagram account', help_text='Number of media items posted by this account', verbose_name='Media Counts')),
+                ('profile_picture_url', models.CharField(blank=True, db_comment='The URL of the profile picture of the Instagram account', help_text='URL of the profile picture', max_length=255, null=True, verbose_name='Profile Picture URL')),
+                ('website', models.CharField(blank=True, db_comment='The website linked in the Instagram account', help_text='Website associated with the account', max_length=255, null=True, verbose_name='Website')),
+                ('biography', models.TextField(blank=True, db_comment='The biography or bio of the Instagram account', help_text='Biography of the account', null=True, verbose_name='Biography')),
+            ],
+            options={
+                'verbose_name': 'Instagram Account',
+                'verbose_name_plural': 'Instagram Accounts',
+                'indexes': [models.Index(fields=['username'], name='insta_account_username_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Media',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('additional_data', models.JSONField(blank=True, db_comment='Any extra information that is not captured by other fields.', default=dict, help_text='Any extra information that is not captured by other fields.', verbose_name='Additional Data')),
+                ('fingerprint', models.CharField(blank=True, db_comment='SHA-256 of the normalized Graph payload the row was last synced from', editable=False, help_text='Hash of the synced content, used for change detection', max_length=64, null=True, verbose_name='Fingerprint')),
+                ('media_id', models.CharField(db_comment='Primary key for the media', help_text='Unique identifier for the media', max_length=255, unique=True, verbose_name='Media ID')),
+                ('username', models.CharField(db_comment='The handle or username of the Instagram account', help_text='Username of the account', max_length=255, verbose_name='Username')),
+                ('caption', models.TextField(blank=True, db_comment='The caption or description of the media content', help_text='Caption for the media', null=True, verbose_name='Caption')),
+                ('media_url', models.TextField(blank=True, db_comment='List of URLs where the media files are stored', help_text='URLs for the media content', verbose_name='Media URLs')),
+                ('timestamp', models.CharField(blank=True, db_comment='Timestamp indicating when the media content was created or published', help_text='When the media was created or published', max_length=255, null=True, verbose_name='Timestamp')),
+                ('published_at', models.DateTimeField(blank=True, db_comment='Timezone-aware publish time parsed from the Graph timestamp', db_index=True, help_text='When the media was published, parsed from the timestamp', null=True, verbose_name='Published At')),
+                ('like_counts', models.IntegerField(blank=True, db_comment='The total number of likes the media has received', help_text='Number of likes on the media', null=True, verbose_name='Like Counts')),
+                ('comments_counts', models.IntegerField(blank=True, db_comment='The total number of comments on the media', help_text='Number of comments on the media', null=True, verbose_name='Comments Counts')),
+                ('kind', models.CharField(blank=True, choices=[('image', 'IMAGE'), ('videos', 'VIDEOS')], db_comment='What kind of media is saving in db', help_text='Media kind', max_length=10, null=True, verbose_name='Kind')),
+                ('carousel', models.BooleanField(db_comment='Media is a gallery', default=False, help_text='Is this media a gallery', verbose_name='Carousel')),
+                ('account', models.ForeignKey(blank=True, db_comment='Medias posted by this Instagram account', help_text='List of medias posted by this account', on_delete=django.db.models.deletion.CASCADE, related_name='medias', to='django_sage_meta.instagramaccount', verbose_name='Instagram account')),
+            ],
+            options={
+                'verbose_name': 'media',
+                'verbose_name_plural': 'medias',
+            },
+        ),
+        migrations.CreateModel(
+            name='Insight',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('additional_data', models.JSONField(blank=True, db_comment='Any extra information that is not captured by other fields.', default=dict, help_text='Any extra information that is not captured by other fields.', verbose_name='Additional Data')),
+                ('fingerprint', models.CharField(blank=True, db_comment='SHA-256 of the normalized Graph payload the row was last synced from', editable=False, help_text='Hash of the synced content, used for change detection', max_length=64, null=True, verbose_name='Fingerprint')),
+                ('insight_id', models.CharField(db_comment='Primary key for the insight', help_text='Unique identifier for the insight', max_length=255, unique=True, verbose_name='Insight ID')),
+                ('name', models.CharField(db_comment='The name of the insight', help_text='Name of the insight', max_length=255, verbose_name='Name')),
+                ('period', models.CharField(db_comment='The period covered by the insight', help_text='Period of the insight', max_length=255, verbose_name='Period')),
+                ('values', models.JSONField(blank=True, db_comment='The data values associated with the insight', default=list, help_text='List of values for the insight', verbose_name='Values')),
+                ('title', models.CharField(blank=True, db_comment='The title or headline of the insight', help_text='Title of the insight', max_length=255, null=True, verbose_name='Title')),
+                ('description', models.CharField(blank=True, db_comment='A detailed description of the insight', help_text='Description of the insight', max_length=255, null=True, verbose_name='Description')),
+                ('kind', models.CharField(blank=True, choices=[('account', 'ACCOUNT'), ('media', 'MEDIA')], db_comment='What kind of insight is saving in db', help_text='Insight kind', max_length=10, null=True, verbose_name='Kind')),
+                ('account', models.ForeignKey(blank=True, db_comment='Insights related to the Instagram account', help_text='List of insights for this account', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='insights', to='django_sage_meta.instagramaccount', verbose_name='account')),
+                ('media', models.ForeignKey(blank=True, db_comment='Insights related to the media obj', help_text='Media that this insight belongs to it', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='insights', to='django_sage_meta.media', verbose_name='media')),
+            ],
+            options={
+                'verbose_name': 'Insight',
+                'verbose_name_plural': 'Insights',
+            },
+        ),
+        migrations.CreateModel(
+            name='Comment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('additional_data', models.JSONField(blank=True, db_comment='Any extra information that is not captured by other fields.', default=dict, help_text='Any extra information that is not captured by other fields.', verbose_name='Additional Data')),
+                ('fingerprint', models.CharField(blank=True, db_comment='SHA-256 of the normalized Graph payload the row was last synced from', editable=False, help_text='Hash of the synced content, used for change detection', max_length=64, null=True, verbose_name='Fingerprint')),
+                ('comment_id', models.CharField(db_comment='Primary key for the comment', help_text='Unique identifier for the comment', max_length=255, unique=True, verbose_name='Comment ID')),
+                ('text', models.TextField(blank=True, db_comment='The content of the comment', help_text='Text of the comment', null=True, verbose_name='Text')),
+                ('username', models.CharField(blank=True, db_comment='The username of the person who made the comment', help_text='Username of the commenter', max_length=255, null=True, verbose_name='Username')),
+                ('like_counts', models.IntegerField(blank=True, db_comment='The total number of likes the comment has received', help_text='Number of likes on the comment', null=True, verbose_name='Like Counts')),
+                ('timestamp', models.CharField(blank=True, db_comment='Timestamp indicating when the comment was made', help_text='Timestamp of the comment', max_length=255, null=True, verbose_name='Timestamp')),
+                ('published_at', models.DateTimeField(blank=True, db_comment='Timezone-aware time the comment was made, parsed from the Graph timestamp', db_index=True, help_text='When the comment was made, parsed from the timestamp', null=True, verbose_name='Published At')),
+                ('media', models.ForeignKey(blank=True, db_comment='The media this comment is associated with', help_text='The media this comment is associated with', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='django_sage_meta.media', verbose_name='Media')),
+            ],
+            options={
+                'verbose_name': 'Comment',
+                'verbose_name_plural': 'Comments',
+            },
+        ),
+        migrations.CreateModel(
+            name='Story',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('additional_data', models.JSONField(blank=True, db_comment='Any extra information that is not captured by other fields.', default=dict, help_text='Any extra information that is not captured by other fields.', verbose_name='Additional Data')),
+                ('fingerprint', models.CharField(blank=True, db_comment='SHA-256 of the normalized Graph payload the row was last synced from', editable=False, help_text='Hash of the synced content, used for change detection', max_length=64, null=True, verbose_name='Fingerprint')),
+                ('story_id', models.CharField(db_comment='Primary key for the story', help_text='Unique identifier for the story', max_length=255, unique=True, verbose_name='Story ID')),
+                ('media_type', models.CharField(blank=True, db_comment='The media type of the story (e.g., image, video)', help_text='Type of media content in the story', max_length=255, null=True, verbose_name='Media Type')),
+                ('media_url', models.CharField(blank=True, db_comment='The URL where the media is stored', help_text='URL of the media content', max_length=255, null=True, verbose_name='Media URL')),
+                ('timestamp', models.CharField(blank=True, db_comment='Timestamp indicating when the story was created', help_text='When the story was created', max_length=255, null=True, verbose_name='Timestamp')),
+                ('published_at', models.DateTimeField(blank=True, db_comment='Timezone-aware creation time parsed from the Graph timestamp', db_index=True, help_text='When the story was created, parsed from the timestamp', null=True, verbose_name='Published At')),
+                ('account', models.ForeignKey(blank=True, db_comment='Stories posted by this Instagram account', help_text='List of stories posted by this account', on_delete=django.db.models.deletion.CASCADE, related_name='instagram_account', to='django_sage_meta.instagramaccount', verbose_name='Instagram Account')),
+            ],
+            options={
+                'verbose_name': 'Story',
+                'verbose_name_plural': 'Stories',
+            },
+        ),
+        migrations.CreateModel(
+            name='SyncCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stage', models.CharField(choices=[('categories', 'CATEGORIES'), ('users', 'USERS'), ('accounts', 'ACCOUNTS'), ('pages', 'PAGES'), ('media', 'MEDIA'), ('insights', 'INSIGHTS'), ('stories', 'STORIES')], db_comment='The sync stage the checkpoint belongs to', help_text='Sync stage', max_length=20, verbose_name='Stage')),
+                ('account_id', models.CharField(db_comment='The Instagram account ID the stage runs for', help_text='Instagram account this checkpoint belongs to', max_length=255, verbose_name='Account ID')),
+                ('cursor', models.CharField(blank=True, db_comment='Graph pagination cursor to resume from', help_text='Pagination cursor of the next page', max_length=255, null=True, verbose_name='Cursor')),
+                ('processed', models.PositiveIntegerField(db_comment='Number of items the stage has processed so far', default=0, help_text='Items processed so far', verbose_name='Processed')),
+                ('marks', models.JSONField(blank=True, db_comment='Newest item timestamp seen per resource, as ISO 8601 strings', default=dict, help_text='Newest timestamp seen per resource', verbose_name='Marks')),
+                ('completed', models.BooleanField(db_comment='Whether the stage finished and needs no resume', default=False, help_text='Whether the stage finished', verbose_name='Completed')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_comment='When the checkpoint was last saved', help_text='When the checkpoint was last saved', verbose_name='Updated At')),
+            ],
+            options={
+                'verbose_name': 'Sync Checkpoint',
+                'verbose_name_plural': 'Sync Checkpoints',
+                'constraints': [models.UniqueConstraint(fields=('stage', 'account_id'), name='unique_sync_checkpoint')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SyncDeadLetter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stage', models.CharField(choices=[('categories', 'CATEGORIES'), ('users', 'USERS'), ('accounts', 'ACCOUNTS'), ('pages', 'PAGES'), ('media', 'MEDIA'), ('insights', 'INSIGHTS'), ('stories', 'STORIES')], db_comment='The sync stage that made the failing request', help_text='Sync stage that made the request', max_length=20, verbose_name='Stage')),
+                ('account_id', models.CharField(db_comment='The Instagram account ID being synced', help_text='Instagram account being synced', max_length=255, verbose_name='Account ID')),
+                ('object_id', models.CharField(db_comment='The Graph object ID the failing request was for', help_text='Graph object the request was for', max_length=255, verbose_name='Object ID')),
+                ('request', models.CharField(db_comment='The edge or resource that was requested, e.g. comments', help_text='What was requested', max_length=50, verbose_name='Request')),
+                ('error', models.TextField(blank=True, db_comment='The error message of the last attempt', help_text='Error of the last attempt', verbose_name='Error')),
+                ('attempts', models.PositiveIntegerField(db_comment='Total number of attempts across syncs', default=0, help_text='How many times the request was tried', verbose_name='Attempts')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_comment='When the request was first parked', help_text='When the request first failed for good', verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_comment='When the request last failed', help_text='When the request last failed', verbose_name='Updated At')),
+            ],
+            options={
+                'verbose_name': 'Sync Dead Letter',
+                'verbose_name_plural': 'Sync Dead Letters',
+                'constraints': [models.UniqueConstraint(fields=('object_id', 'request'), name='unique_sync_dead_letter')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SyncJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('categories', 'CATEGORIES'), ('users', 'USERS'), ('accounts', 'ACCOUNTS'), ('pages', 'PAGES'), ('media', 'MEDIA'), ('insights', 'INSIGHTS'), ('stories', 'STORIES')], db_comment='The sync stage the job runs', help_text='Sync stage run by the job', max_length=20, verbose_name='Kind')),
+                ('status', models.CharField(choices=[('queued', 'QUEUED'), ('running', 'RUNNING'), ('done', 'DONE'), ('failed', 'FAILED')], db_comment='Whether the job is queued, running, done or failed', default='queued', help_text='Current state of the job', max_length=10, verbose_name='Status')),
+                ('processed', models.PositiveIntegerField(db_comment='Number of items the job has processed so far', default=0, help_text='Items processed so far', verbose_name='Processed')),
+                ('total', models.PositiveIntegerField(blank=True, db_comment='Number of items the job expects to process, when known', help_text='Items expected, if known', null=True, verbose_name='Total')),
+                ('rows', models.PositiveIntegerField(db_comment='Number of rows created or updated by the job', default=0, help_text='Rows written by the job', verbose_name='Rows')),
+                ('error', models.TextField(blank=True, db_comment='The error that made the job fail', help_text='Error message of a failed job', verbose_name='Error')),
+                ('worker', models.CharField(blank=True, db_comment='Name of the worker process that claimed the job', help_text='Worker that claimed the job', max_length=255, verbose_name='Worker')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_comment='When the job was enqueued', help_text='When the job was enqueued', verbose_name='Created At')),
+                ('started_at', models.DateTimeField(blank=True, db_comment='When a worker claimed the job', help_text='When a worker claimed the job', null=True, verbose_name='Started At')),
+                ('heartbeat_at', models.DateTimeField(blank=True, db_comment='When the running job last reported progress', help_text='When the job last reported progress', null=True, verbose_name='Heartbeat At')),
+                ('finished_at', models.DateTimeField(blank=True, db_comment='When the job finished or failed', help_text='When the job finished', null=True, verbose_name='Finished At')),
+            ],
+            options={
+                'verbose_name': 'Sync Job',
+                'verbose_name_plural': 'Sync Jobs',
+                'ordering': ('-created_at',),
+                'indexes': [models.Index(fields=['status', 'created_at'], name='sync_job_status_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status__in', ('queued', 'running'))), fields=('kind',), name='unique_active_sync_job')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SyncWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('account_id', models.CharField(db_comment='The Instagram account ID the watermark is tracked for', help_text='Instagram account this watermark belongs to', max_length=255, verbose_name='Account ID')),
+                ('resource', models.CharField(choices=[('media', 'MEDIA'), ('comments', 'COMMENTS'), ('stories', 'STORIES')], db_comment='The kind of resource the watermark is tracked for', help_text='Synced resource', max_length=20, verbose_name='Resource')),
+                ('last_timestamp', models.DateTimeField(blank=True, db_comment='Creation time of the newest item seen by a sync', help_text='Timestamp of the newest synced item', null=True, verbose_name='Last Timestamp')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_comment='When the watermark was last advanced', help_text='When the watermark was last advanced', verbose_name='Updated At')),
+            ],
+            options={
+                'verbose_name': 'Sync Watermark',
+                'verbose_name_plural': 'Sync Watermarks',
+                'constraints': [models.UniqueConstraint(fields=('account_id', 'resource'), name='unique_sync_watermark')],
+            },
+        ),
+        migrations.CreateModel(
+            name='UserData',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('additional_data', models.JSONField(blank=True, db_comment='Any extra information that is not captured by other fields.', default=dict, help_text='Any extra information that is not captured by other fields.', verbose_name='Additional Data')),
+                ('user_id', models.CharField(db_comment='Primary key for the user', help_text='Unique identifier for the user', max_length=255, unique=True, verbose_name='User ID')),
+                ('name', models.CharField(db_comment='The full name of the user', help_text='Name of the user', max_length=255, verbose_name='Name')),
+                ('email', models.EmailField(blank=True, db_comment='The email address of the user', help_text='Email of the user', max_length=254, null=True, verbose_name='Email')),
+            ],
+            options={
+                'verbose_name': 'User Data',
+                'verbose_name_plural': 'User Datas',
+                'indexes': [models.Index(fields=['name'], name='user_data_name_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='FacebookPageData',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('additional_data', models.JSONField(blank=True, db_comment='Any extra information that is not captured by other fields.', default=dict, help_text='Any extra information that is not captured by other fields.', verbose_name='Additional Data')),
+                ('fingerprint', models.CharField(blank=True, db_comment='SHA-256 of the normalized Graph payload the row was last synced from', editable=False, help_text='Hash of the synced content, used for change detection', max_length=64, null=True, verbose_name='Fingerprint')),
+                ('page_id', models.CharField(db_comment='Primary key for the Facebook page', help_text='Unique identifier for the Facebook page', max_length=255, unique=True, verbose_name='Page ID')),
+                ('name', models.CharField(db_comment='The name of the Facebook page', help_text='Name of the Facebook page', max_length=255, verbose_name='Name')),
+                ('access_token', models.CharField(db_comment='The token used to access the Facebook page API and without it we can not access the to database', help_text='Access token for the Facebook page for access the graph api endpoint', max_length=255, verbose_name='Access Token')),
+                ('tasks', models.JSONField(blank=True, db_comment='Tasks that can be performed on the Facebook page', default=list, help_text='List of tasks for the Facebook page', verbose_name='Tasks')),
+                ('categories', models.ManyToManyField(blank=True, db_comment='Categories associated with the Facebook page', help_text='List of categories for the Facebook page', related_name='pages', to='django_sage_meta.category', verbose_name='Category List')),
+                ('instagram_business_account', models.OneToOneField(blank=True, db_comment='The Instagram business account linked to this Facebook page', help_text='Instagram business account associated with the Facebook page', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='page', to='django_sage_meta.instagramaccount', verbose_name='Instagram Business Account')),
+                ('user', models.ForeignKey(blank=True, db_comment='user linked to this page', help_text='user associated with this page', on_delete=django.db.models.deletion.CASCADE, related_name='pages', to='django_sage_meta.userdata', verbose_name='user')),
+            ],
+            options={
+                'verbose_name': 'Facebook Page Data',
+                'verbose_name_plural': 'Facebook Page Datas',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='media',
+            index=models.Index(fields=['account', '-published_at'], name='media_account_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='insight',
+            index=models.Index(fields=['kind', 'name', 'period'], name='insight_kind_name_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['media', '-published_at'], name='comment_media_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='story',
+            index=models.Index(fields=['account', '-published_at'], name='story_account_published_idx'),
+        ),
+    ]
@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+
+from django.db import migrations
+from django.utils.dateparse import parse_datetime
+
+# The backfill is copied here rather than imported from the app, so later
+# changes to the code cannot alter what this migration does.
+CHUNK_SIZE = 1000
+
+
+def parse_timestamp(value):
+    """Parse a Graph timestamp such as ``2024-07-29T10:11:12+0000``."""
+    try:
+        parsed = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
+    except ValueError:
+        try:
+            parsed = parse_datetime(value)
+        except ValueError:
+            return None
+        if parsed is None:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def backfill(apps, schema_editor):
+    for model_name in ("Media", "Comment", "Story"):
+        model = apps.get_model("django_sage_meta", model_name)
+        rows = model.objects.filter(
+            published_at__isnull=True, timestamp__isnull=False
+        ).order_by("pk")
+        last_pk = None
+        while True:
+            chunk = rows if last_pk is None else rows.filter(pk__gt=last_pk)
+            chunk = list(chunk.only("pk", "timestamp")[:CHUNK_SIZE])
+            if not chunk:
+                break
+            last_pk = chunk[-1].pk
+
+            parsed = []
+            for row in chunk:
+                row.published_at = parse_timestamp(row.timestamp)
+                if row.published_at is not None:
+                    parsed.append(row)
+            model.objects.bulk_update(parsed, ["published_at"])
+
+
+class Migration(migrations.Migration):
+
+    # Each chunk commits on its own instead of one transaction holding
+    # every row of the table.
+    atomic = False
+
+    dependencies = [
+        ("django_sage_meta", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
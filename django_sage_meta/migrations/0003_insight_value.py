@@ -0,0 +1,31 @@
+# Generated by Django 5.1.15 on 2026-10-18 11:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_sage_meta', '0002_backfill_published_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InsightValue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(db_comment='The metric name, copied from the insight', help_text='Metric name', max_length=255, verbose_name='Metric')),
+                ('period', models.CharField(db_comment='The period of the metric, copied from the insight', help_text='Period of the metric', max_length=255, verbose_name='Period')),
+                ('end_time', models.DateTimeField(blank=True, db_comment='End of the period the value covers, empty for lifetime values', help_text='End of the period the value covers', null=True, verbose_name='End Time')),
+                ('key', models.CharField(blank=True, db_comment='Breakdown key of mapping values, empty for plain values', default='', help_text='Breakdown key, such as a city or an age group', max_length=255, verbose_name='Key')),
+                ('value', models.FloatField(db_comment='The numeric value of the data point', help_text='Numeric value', verbose_name='Value')),
+                ('insight', models.ForeignKey(db_comment='The insight the data point was taken from', help_text='Insight this value belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='data_points', to='django_sage_meta.insight', verbose_name='insight')),
+            ],
+            options={
+                'verbose_name': 'Insight Value',
+                'verbose_name_plural': 'Insight Values',
+                'indexes': [models.Index(fields=['metric', 'end_time'], name='insight_value_metric_time_idx')],
+            },
+        ),
+    ]
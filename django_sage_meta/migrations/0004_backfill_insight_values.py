@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+from numbers import Number
+
+from django.db import migrations
+from django.utils.dateparse import parse_datetime
+
+# The backfill is copied here rather than imported from the app, so later
+# changes to the code cannot alter what this migration does.
+CHUNK_SIZE = 1000
+
+
+def parse_timestamp(value):
+    """Parse a Graph timestamp such as ``2024-07-29T10:11:12+0000``."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
+    except ValueError:
+        try:
+            parsed = parse_datetime(value)
+        except ValueError:
+            return None
+        if parsed is None:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def is_number(value):
+    return isinstance(value, Number) and not isinstance(value, bool)
+
+
+def iter_data_points(values):
+    """Yield ``(end_time, key, value)`` for the numeric points of a blob."""
+    for entry in values or []:
+        if not isinstance(entry, dict):
+            continue
+        end_time = parse_timestamp(entry.get("end_time"))
+        value = entry.get("value")
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if is_number(item):
+                    yield end_time, str(key), float(item)
+        elif is_number(value):
+            yield end_time, "", float(value)
+
+
+def backfill(apps, schema_editor):
+    Insight = apps.get_model("django_sage_meta", "Insight")
+    InsightValue = apps.get_model("django_sage_meta", "InsightValue")
+    # Insights that already have value rows are skipped, so the backfill
+    # continues where it stopped when run again.
+    insights = Insight.objects.filter(data_points__isnull=True).order_by("pk")
+    last_pk = None
+    while True:
+        chunk = insights if last_pk is None else insights.filter(pk__gt=last_pk)
+        chunk = list(chunk.only("pk", "name", "period", "values")[:CHUNK_SIZE])
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+
+        InsightValue.objects.bulk_create(
+            InsightValue(
+                insight_id=insight.pk,
+                metric=insight.name,
+                period=insight.period,
+                end_time=end_time,
+                key=key,
+                value=value,
+            )
+            for insight in chunk
+            for end_time, key, value in iter_data_points(insight.values)
+        )
+
+
+class Migration(migrations.Migration):
+
+    # Each chunk commits on its own instead of one transaction holding
+    # every row of the table.
+    atomic = False
+
+    dependencies = [
+        ("django_sage_meta", "0003_insight_value"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.1.15 on 2026-10-18 11:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_sage_meta', '0004_backfill_insight_values'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='insightvalue',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_comment='When the value was last created or changed by a sync', db_index=True, help_text='When the value was last written', verbose_name='Updated At'),
+        ),
+        migrations.AlterField(
+            model_name='syncwatermark',
+            name='resource',
+            field=models.CharField(choices=[('media', 'MEDIA'), ('comments', 'COMMENTS'), ('stories', 'STORIES'), ('rollups', 'ROLLUPS')], db_comment='The kind of resource the watermark is tracked for', help_text='Synced resource', max_length=20, verbose_name='Resource'),
+        ),
+        migrations.CreateModel(
+            name='InsightRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('day', 'DAY'), ('week', 'WEEK')], db_comment='Bucket size of the rollup, day or week', help_text='Bucket size', max_length=10, verbose_name='Granularity')),
+                ('bucket', models.DateField(db_comment='First day of the bucket, Monday for weeks', help_text='First day of the bucket', verbose_name='Bucket')),
+                ('metric', models.CharField(db_comment='The aggregated metric name', help_text='Metric name', max_length=255, verbose_name='Metric')),
+                ('period', models.CharField(db_comment='The period of the aggregated insight values', help_text='Period of the aggregated values', max_length=255, verbose_name='Period')),
+                ('key', models.CharField(blank=True, db_comment='Breakdown key of mapping values, empty for plain values', default='', help_text='Breakdown key, such as a city or an age group', max_length=255, verbose_name='Key')),
+                ('total', models.FloatField(db_comment='Sum of the values in the bucket', help_text='Sum of the values', verbose_name='Total')),
+                ('samples', models.PositiveIntegerField(db_comment='Number of values in the bucket', help_text='Number of values', verbose_name='Samples')),
+                ('minimum', models.FloatField(db_comment='Smallest value in the bucket', help_text='Smallest value', verbose_name='Minimum')),
+                ('maximum', models.FloatField(db_comment='Largest value in the bucket', help_text='Largest value', verbose_name='Maximum')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_comment='When the bucket was last recomputed', help_text='When the bucket was last recomputed', verbose_name='Updated At')),
+                ('account', models.ForeignKey(blank=True, db_comment='The Instagram account, also set for media rollups', help_text='Account the values belong to', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='insight_rollups', to='django_sage_meta.instagramaccount', verbose_name='account')),
+                ('media', models.ForeignKey(blank=True, db_comment='The media item, empty for account insight rollups', help_text='Media the values belong to', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='insight_rollups', to='django_sage_meta.media', verbose_name='media')),
+            ],
+            options={
+                'verbose_name': 'Insight Rollup',
+                'verbose_name_plural': 'Insight Rollups',
+                'indexes': [models.Index(fields=['granularity', 'metric', 'bucket'], name='rollup_metric_bucket_idx'), models.Index(fields=['account', 'granularity', 'metric', 'bucket'], name='rollup_account_bucket_idx'), models.Index(fields=['media', 'granularity', 'metric', 'bucket'], name='rollup_media_bucket_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,156 @@
+from django.db import migrations
+
+# The statements are spelled out instead of built from the app's search
+# module, so later changes to the code cannot alter this migration.
+#
+# PostgreSQL: a generated tsvector column, kept current by the database on
+# every insert and update, indexed with GIN. SQLite: an external content
+# FTS5 table kept current by triggers. SQLite rebuilds a table for most
+# ALTER TABLE operations, which drops its triggers, so the index has to be
+# recreated after such a migration on local databases. Other databases get
+# no index and search falls back to LIKE.
+CREATE_SEARCH_INDEX = {
+    "postgresql": [
+        """
+        ALTER TABLE "django_sage_meta_media"
+        ADD COLUMN IF NOT EXISTS "search_vector" tsvector GENERATED ALWAYS AS (
+            to_tsvector('simple'::regconfig, coalesce("caption", ''))
+        ) STORED
+        """,
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS "django_sage_meta_media_search"
+        ON "django_sage_meta_media" USING gin ("search_vector")
+        """,
+        """
+        ALTER TABLE "django_sage_meta_comment"
+        ADD COLUMN IF NOT EXISTS "search_vector" tsvector GENERATED ALWAYS AS (
+            to_tsvector(
+                'simple'::regconfig,
+                coalesce("text", '') || ' ' || coalesce("username", '')
+            )
+        ) STORED
+        """,
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS "django_sage_meta_comment_search"
+        ON "django_sage_meta_comment" USING gin ("search_vector")
+        """,
+    ],
+    "sqlite": [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS "django_sage_meta_media_fts"
+        USING fts5(
+            "caption", content='django_sage_meta_media', content_rowid='id'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS "django_sage_meta_media_fts_insert"
+        AFTER INSERT ON "django_sage_meta_media" BEGIN
+            INSERT INTO "django_sage_meta_media_fts"(rowid, "caption")
+            VALUES (new.id, new."caption");
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS "django_sage_meta_media_fts_delete"
+        AFTER DELETE ON "django_sage_meta_media" BEGIN
+            INSERT INTO "django_sage_meta_media_fts"(
+                "django_sage_meta_media_fts", rowid, "caption"
+            ) VALUES ('delete', old.id, old."caption");
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS "django_sage_meta_media_fts_update"
+        AFTER UPDATE OF "caption" ON "django_sage_meta_media" BEGIN
+            INSERT INTO "django_sage_meta_media_fts"(
+                "django_sage_meta_media_fts", rowid, "caption"
+            ) VALUES ('delete', old.id, old."caption");
+            INSERT INTO "django_sage_meta_media_fts"(rowid, "caption")
+            VALUES (new.id, new."caption");
+        END
+        """,
+        """
+        INSERT INTO "django_sage_meta_media_fts"("django_sage_meta_media_fts")
+        VALUES ('rebuild')
+        """,
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS "django_sage_meta_comment_fts"
+        USING fts5(
+            "text",
+            "username",
+            content='django_sage_meta_comment',
+            content_rowid='id'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS "django_sage_meta_comment_fts_insert"
+        AFTER INSERT ON "django_sage_meta_comment" BEGIN
+            INSERT INTO "django_sage_meta_comment_fts"(rowid, "text", "username")
+            VALUES (new.id, new."text", new."username");
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS "django_sage_meta_comment_fts_delete"
+        AFTER DELETE ON "django_sage_meta_comment" BEGIN
+            INSERT INTO "django_sage_meta_comment_fts"(
+                "django_sage_meta_comment_fts", rowid, "text", "username"
+            ) VALUES ('delete', old.id, old."text", old."username");
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS "django_sage_meta_comment_fts_update"
+        AFTER UPDATE OF "text", "username" ON "django_sage_meta_comment" BEGIN
+            INSERT INTO "django_sage_meta_comment_fts"(
+                "django_sage_meta_comment_fts", rowid, "text", "username"
+            ) VALUES ('delete', old.id, old."text", old."username");
+            INSERT INTO "django_sage_meta_comment_fts"(rowid, "text", "username")
+            VALUES (new.id, new."text", new."username");
+        END
+        """,
+        """
+        INSERT INTO "django_sage_meta_comment_fts"("django_sage_meta_comment_fts")
+        VALUES ('rebuild')
+        """,
+    ],
+}
+
+DROP_SEARCH_INDEX = {
+    "postgresql": [
+        'DROP INDEX IF EXISTS "django_sage_meta_media_search"',
+        'ALTER TABLE "django_sage_meta_media" DROP COLUMN IF EXISTS "search_vector"',
+        'DROP INDEX IF EXISTS "django_sage_meta_comment_search"',
+        'ALTER TABLE "django_sage_meta_comment" DROP COLUMN IF EXISTS "search_vector"',
+    ],
+    "sqlite": [
+        'DROP TRIGGER IF EXISTS "django_sage_meta_media_fts_insert"',
+        'DROP TRIGGER IF EXISTS "django_sage_meta_media_fts_delete"',
+        'DROP TRIGGER IF EXISTS "django_sage_meta_media_fts_update"',
+        'DROP TABLE IF EXISTS "django_sage_meta_media_fts"',
+        'DROP TRIGGER IF EXISTS "django_sage_meta_comment_fts_insert"',
+        'DROP TRIGGER IF EXISTS "django_sage_meta_comment_fts_delete"',
+        'DROP TRIGGER IF EXISTS "django_sage_meta_comment_fts_update"',
+        'DROP TABLE IF EXISTS "django_sage_meta_comment_fts"',
+    ],
+}
+
+
+def create_search_index(apps, schema_editor):
+    for sql in CREATE_SEARCH_INDEX.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    for sql in DROP_SEARCH_INDEX.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    # PostgreSQL cannot build an index concurrently inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("django_sage_meta", "0005_insight_rollup"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
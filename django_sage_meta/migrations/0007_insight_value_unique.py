@@ -0,0 +1,39 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:15
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def remove_duplicates(apps, schema_editor):
+    # Concurrent syncs could insert the same data point twice before the
+    # constraints existed. The latest row of each point is kept.
+    InsightValue = apps.get_model('django_sage_meta', 'InsightValue')
+    duplicates = (
+        InsightValue.objects.values('insight', 'end_time', 'key')
+        .annotate(keep=Max('pk'), rows=Count('pk'))
+        .filter(rows__gt=1)
+        .order_by()
+    )
+    for point in duplicates.iterator():
+        InsightValue.objects.filter(
+            insight=point['insight'], end_time=point['end_time'], key=point['key']
+        ).exclude(pk=point['keep']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_sage_meta', '0006_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='insightvalue',
+            constraint=models.UniqueConstraint(fields=('insight', 'end_time', 'key'), name='unique_insight_value'),
+        ),
+        migrations.AddConstraint(
+            model_name='insightvalue',
+            constraint=models.UniqueConstraint(condition=models.Q(('end_time__isnull', True)), fields=('insight', 'key'), name='unique_lifetime_insight_value'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_sage_meta', '0007_insight_value_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='insightrollup',
+            name='stale',
+            field=models.BooleanField(db_comment='Whether the bucket lost values and has to be recomputed', default=False, help_text='Values of the bucket were deleted since it was computed', verbose_name='Stale'),
+        ),
+    ]
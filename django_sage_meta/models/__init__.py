@@ -1,23 +1,35 @@
 from .category import Category
+from .checkpoint import SyncCheckpoint
 from .comments import Comment
+from .dead_letter import SyncDeadLetter
 from .insight import Insight
+from .insight_rollup import InsightRollup
+from .insight_value import InsightValue
+from .job import SyncJob
 from .instagram_account import InstagramAccount
 from .media import Media
 from .page import FacebookPageData
 from .story import Story
 from .user import UserData
+from .watermark import SyncWatermark
 
 __all__ = [
     "AccountInsight",
     "Category",
     "Comment",
     "Insight",
+    "InsightValue",
+    "InsightRollup",
     "InstagramAccount",
     "Media",
     "FacebookPageData",
     "Settings",
     "Story",
     "UserData",
+    "SyncWatermark",
+    "SyncJob",
+    "SyncCheckpoint",
+    "SyncDeadLetter",
     "StoryPublisher",
     "CommentPublisher",
     "PostPublisher",
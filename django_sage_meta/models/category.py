@@ -35,3 +35,6 @@ class Category(AdditionalDataMixin):
     class Meta:
         verbose_name = _("Category")
         verbose_name_plural = _("Categories")
+        indexes = [
+            models.Index(fields=["name"], name="category_name_idx"),
+        ]
@@ -0,0 +1,83 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from django_sage_meta.helper.choice import SyncJobKindEnum
+
+
+class SyncCheckpoint(models.Model):
+    """Model recording how far a sync stage got for an account.
+
+    Attributes:
+        stage (str): The sync stage.
+        account_id (str): The Instagram account the stage runs for.
+        cursor (str): Pagination cursor of the next page to fetch.
+        processed (int): Items processed so far.
+        marks (dict): Newest timestamp seen per resource, used to advance
+            the watermarks once the stage completes.
+        completed (bool): Whether the stage finished.
+        updated_at (datetime): When the checkpoint was last saved.
+
+    """
+
+    stage = models.CharField(
+        _("Stage"),
+        max_length=20,
+        choices=SyncJobKindEnum.choices,
+        help_text=_("Sync stage"),
+        db_comment="The sync stage the checkpoint belongs to",
+    )
+    account_id = models.CharField(
+        _("Account ID"),
+        max_length=255,
+        help_text=_("Instagram account this checkpoint belongs to"),
+        db_comment="The Instagram account ID the stage runs for",
+    )
+    cursor = models.CharField(
+        _("Cursor"),
+        max_length=255,
+        null=True,
+        blank=True,
+        help_text=_("Pagination cursor of the next page"),
+        db_comment="Graph pagination cursor to resume from",
+    )
+    processed = models.PositiveIntegerField(
+        _("Processed"),
+        default=0,
+        help_text=_("Items processed so far"),
+        db_comment="Number of items the stage has processed so far",
+    )
+    marks = models.JSONField(
+        _("Marks"),
+        default=dict,
+        blank=True,
+        help_text=_("Newest timestamp seen per resource"),
+        db_comment="Newest item timestamp seen per resource, as ISO 8601 strings",
+    )
+    completed = models.BooleanField(
+        _("Completed"),
+        default=False,
+        help_text=_("Whether the stage finished"),
+        db_comment="Whether the stage finished and needs no resume",
+    )
+    updated_at = models.DateTimeField(
+        _("Updated At"),
+        auto_now=True,
+        help_text=_("When the checkpoint was last saved"),
+        db_comment="When the checkpoint was last saved",
+    )
+
+    def __repr__(self):
+        return f"<SyncCheckpoint(stage={self.stage}, account_id={self.account_id}, cursor={self.cursor}, completed={self.completed})>"
+
+    def __str__(self):
+        return f"{self.account_id} - {self.stage}"
+
+    class Meta:
+        verbose_name = _("Sync Checkpoint")
+        verbose_name_plural = _("Sync Checkpoints")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["stage", "account_id"],
+                name="unique_sync_checkpoint",
+            )
+        ]
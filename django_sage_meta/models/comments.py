@@ -1,9 +1,9 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from django_sage_meta.helper.mixins import AdditionalDataMixin
+from django_sage_meta.helper.mixins import AdditionalDataMixin, FingerprintMixin
 
 
-class Comment(AdditionalDataMixin):
+class Comment(FingerprintMixin, AdditionalDataMixin):
     """Model representing a comment.
 
     Attributes:
@@ -12,6 +12,7 @@ class Comment(AdditionalDataMixin):
         username (str): The username of the commenter.
         like_count (int): The number of likes on the comment.
         timestamp (str): The timestamp of the comment.
+        published_at (datetime): The parsed timestamp of the comment.
 
     """
 
@@ -52,6 +53,14 @@ class Comment(AdditionalDataMixin):
         help_text=_("Timestamp of the comment"),
         db_comment="Timestamp indicating when the comment was made",
     )
+    published_at = models.DateTimeField(
+        verbose_name=_("Published At"),
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text=_("When the comment was made, parsed from the timestamp"),
+        db_comment="Timezone-aware time the comment was made, parsed from the Graph timestamp",
+    )
     media = models.ForeignKey(
         "Media",
         verbose_name=_("Media"),
@@ -72,3 +81,8 @@ class Comment(AdditionalDataMixin):
     class Meta:
         verbose_name = _("Comment")
         verbose_name_plural = _("Comments")
+        indexes = [
+            models.Index(
+                fields=["media", "-published_at"], name="comment_media_published_idx"
+            ),
+        ]
@@ -0,0 +1,86 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from django_sage_meta.helper.choice import SyncJobKindEnum
+
+
+class SyncDeadLetter(models.Model):
+    """Model parking a Graph request that kept failing during a sync.
+
+    Attributes:
+        stage (str): The sync stage that made the request.
+        account_id (str): The Instagram account being synced.
+        object_id (str): The Graph object the request was for.
+        request (str): What was requested, e.g. ``comments``.
+        error (str): The error of the last attempt.
+        attempts (int): How many times the request was tried.
+        created_at (datetime): When the request first failed for good.
+        updated_at (datetime): When it last failed.
+
+    """
+
+    stage = models.CharField(
+        _("Stage"),
+        max_length=20,
+        choices=SyncJobKindEnum.choices,
+        help_text=_("Sync stage that made the request"),
+        db_comment="The sync stage that made the failing request",
+    )
+    account_id = models.CharField(
+        _("Account ID"),
+        max_length=255,
+        help_text=_("Instagram account being synced"),
+        db_comment="The Instagram account ID being synced",
+    )
+    object_id = models.CharField(
+        _("Object ID"),
+        max_length=255,
+        help_text=_("Graph object the request was for"),
+        db_comment="The Graph object ID the failing request was for",
+    )
+    request = models.CharField(
+        _("Request"),
+        max_length=50,
+        help_text=_("What was requested"),
+        db_comment="The edge or resource that was requested, e.g. comments",
+    )
+    error = models.TextField(
+        _("Error"),
+        blank=True,
+        help_text=_("Error of the last attempt"),
+        db_comment="The error message of the last attempt",
+    )
+    attempts = models.PositiveIntegerField(
+        _("Attempts"),
+        default=0,
+        help_text=_("How many times the request was tried"),
+        db_comment="Total number of attempts across syncs",
+    )
+    created_at = models.DateTimeField(
+        _("Created At"),
+        auto_now_add=True,
+        help_text=_("When the request first failed for good"),
+        db_comment="When the request was first parked",
+    )
+    updated_at = models.DateTimeField(
+        _("Updated At"),
+        auto_now=True,
+        help_text=_("When the request last failed"),
+        db_comment="When the request last failed",
+    )
+
+    def __repr__(self):
+        return f"<SyncDeadLetter(object_id={self.object_id}, request={self.request}, attempts={self.attempts})>"
+
+    def __str__(self):
+        return f"{self.object_id} - {self.request}"
+
+    class Meta:
+        verbose_name = _("Sync Dead Letter")
+        verbose_name_plural = _("Sync Dead Letters")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["object_id", "request"],
+                name="unique_sync_dead_letter",
+            )
+        ]
@@ -1,9 +1,10 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from django_sage_meta.helper.mixins import AdditionalDataMixin
+from django_sage_meta.helper.mixins import AdditionalDataMixin, FingerprintMixin
 from django_sage_meta.helper.choice import InsightKindEnum
 
-class Insight(AdditionalDataMixin):
+
+class Insight(FingerprintMixin, AdditionalDataMixin):
     """Model representing an insight.
 
     Attributes:
@@ -97,3 +98,8 @@ class Insight(AdditionalDataMixin):
     class Meta:
         verbose_name = _("Insight")
         verbose_name_plural = _("Insights")
+        indexes = [
+            models.Index(
+                fields=["kind", "name", "period"], name="insight_kind_name_period_idx"
+            ),
+        ]
@@ -0,0 +1,139 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from django_sage_meta.helper.choice import RollupGranularityEnum
+
+
+class InsightRollup(models.Model):
+    """Model storing insight values aggregated per day or week.
+
+    One row covers one metric of one account or media item in one bucket.
+    Media rows also carry the account of the media, so per-account
+    dashboards over all media read a single index range.
+
+    Attributes:
+        granularity (str): ``day`` or ``week``.
+        bucket (date): First day of the bucket; weeks start on Monday.
+        metric (str): The metric name.
+        period (str): The period of the aggregated values.
+        key (str): Breakdown key, empty for plain values.
+        account (InstagramAccount): The account, for media rows too.
+        media (Media): The media item, empty for account insights.
+        total (float): Sum of the values.
+        samples (int): Number of values.
+        minimum (float): Smallest value.
+        maximum (float): Largest value.
+        stale (bool): Whether values of the bucket were deleted since it
+            was computed.
+        updated_at (datetime): When the bucket was last recomputed.
+
+    """
+
+    granularity = models.CharField(
+        _("Granularity"),
+        max_length=10,
+        choices=RollupGranularityEnum.choices,
+        help_text=_("Bucket size"),
+        db_comment="Bucket size of the rollup, day or week",
+    )
+    bucket = models.DateField(
+        _("Bucket"),
+        help_text=_("First day of the bucket"),
+        db_comment="First day of the bucket, Monday for weeks",
+    )
+    metric = models.CharField(
+        _("Metric"),
+        max_length=255,
+        help_text=_("Metric name"),
+        db_comment="The aggregated metric name",
+    )
+    period = models.CharField(
+        _("Period"),
+        max_length=255,
+        help_text=_("Period of the aggregated values"),
+        db_comment="The period of the aggregated insight values",
+    )
+    key = models.CharField(
+        _("Key"),
+        max_length=255,
+        blank=True,
+        default="",
+        help_text=_("Breakdown key, such as a city or an age group"),
+        db_comment="Breakdown key of mapping values, empty for plain values",
+    )
+    account = models.ForeignKey(
+        "InstagramAccount",
+        verbose_name=_("account"),
+        related_name="insight_rollups",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        help_text=_("Account the values belong to"),
+        db_comment="The Instagram account, also set for media rollups",
+    )
+    media = models.ForeignKey(
+        "Media",
+        verbose_name=_("media"),
+        related_name="insight_rollups",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        help_text=_("Media the values belong to"),
+        db_comment="The media item, empty for account insight rollups",
+    )
+    total = models.FloatField(
+        _("Total"),
+        help_text=_("Sum of the values"),
+        db_comment="Sum of the values in the bucket",
+    )
+    samples = models.PositiveIntegerField(
+        _("Samples"),
+        help_text=_("Number of values"),
+        db_comment="Number of values in the bucket",
+    )
+    minimum = models.FloatField(
+        _("Minimum"),
+        help_text=_("Smallest value"),
+        db_comment="Smallest value in the bucket",
+    )
+    maximum = models.FloatField(
+        _("Maximum"),
+        help_text=_("Largest value"),
+        db_comment="Largest value in the bucket",
+    )
+    stale = models.BooleanField(
+        _("Stale"),
+        default=False,
+        help_text=_("Values of the bucket were deleted since it was computed"),
+        db_comment="Whether the bucket lost values and has to be recomputed",
+    )
+    updated_at = models.DateTimeField(
+        _("Updated At"),
+        auto_now=True,
+        help_text=_("When the bucket was last recomputed"),
+        db_comment="When the bucket was last recomputed",
+    )
+
+    def __repr__(self):
+        return f"<InsightRollup(granularity={self.granularity}, bucket={self.bucket}, metric={self.metric}, total={self.total})>"
+
+    def __str__(self):
+        return f"{self.metric} - {self.granularity} {self.bucket}"
+
+    class Meta:
+        verbose_name = _("Insight Rollup")
+        verbose_name_plural = _("Insight Rollups")
+        indexes = [
+            models.Index(
+                fields=["granularity", "metric", "bucket"],
+                name="rollup_metric_bucket_idx",
+            ),
+            models.Index(
+                fields=["account", "granularity", "metric", "bucket"],
+                name="rollup_account_bucket_idx",
+            ),
+            models.Index(
+                fields=["media", "granularity", "metric", "bucket"],
+                name="rollup_media_bucket_idx",
+            ),
+        ]
@@ -0,0 +1,98 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class InsightValue(models.Model):
+    """Model storing one numeric data point of an insight.
+
+    The ``values`` blob of an ``Insight`` is split into one row per
+    ``end_time``, and per breakdown key for metrics such as
+    ``audience_city`` whose value is a mapping.
+
+    Attributes:
+        insight (Insight): The insight the data point belongs to.
+        metric (str): The metric name, copied from the insight.
+        period (str): The period of the metric, copied from the insight.
+        end_time (datetime): End of the period the value covers.
+        key (str): Breakdown key, empty for plain values.
+        value (float): The numeric value.
+        updated_at (datetime): When the value was last written, used to
+            find the rollup buckets to refresh.
+
+    """
+
+    insight = models.ForeignKey(
+        "Insight",
+        verbose_name=_("insight"),
+        related_name="data_points",
+        on_delete=models.CASCADE,
+        help_text=_("Insight this value belongs to"),
+        db_comment="The insight the data point was taken from",
+    )
+    metric = models.CharField(
+        _("Metric"),
+        max_length=255,
+        help_text=_("Metric name"),
+        db_comment="The metric name, copied from the insight",
+    )
+    period = models.CharField(
+        _("Period"),
+        max_length=255,
+        help_text=_("Period of the metric"),
+        db_comment="The period of the metric, copied from the insight",
+    )
+    end_time = models.DateTimeField(
+        _("End Time"),
+        null=True,
+        blank=True,
+        help_text=_("End of the period the value covers"),
+        db_comment="End of the period the value covers, empty for lifetime values",
+    )
+    key = models.CharField(
+        _("Key"),
+        max_length=255,
+        blank=True,
+        default="",
+        help_text=_("Breakdown key, such as a city or an age group"),
+        db_comment="Breakdown key of mapping values, empty for plain values",
+    )
+    value = models.FloatField(
+        _("Value"),
+        help_text=_("Numeric value"),
+        db_comment="The numeric value of the data point",
+    )
+    updated_at = models.DateTimeField(
+        _("Updated At"),
+        auto_now=True,
+        db_index=True,
+        help_text=_("When the value was last written"),
+        db_comment="When the value was last created or changed by a sync",
+    )
+
+    def __repr__(self):
+        return f"<InsightValue(metric={self.metric}, end_time={self.end_time}, key={self.key}, value={self.value})>"
+
+    def __str__(self):
+        return f"{self.metric} - {self.end_time}"
+
+    class Meta:
+        verbose_name = _("Insight Value")
+        verbose_name_plural = _("Insight Values")
+        indexes = [
+            models.Index(
+                fields=["metric", "end_time"], name="insight_value_metric_time_idx"
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["insight", "end_time", "key"],
+                name="unique_insight_value",
+            ),
+            # NULLs never conflict in the constraint above, so lifetime
+            # values get their own.
+            models.UniqueConstraint(
+                fields=["insight", "key"],
+                condition=models.Q(end_time__isnull=True),
+                name="unique_lifetime_insight_value",
+            ),
+        ]
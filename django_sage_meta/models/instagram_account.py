@@ -1,9 +1,9 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from django_sage_meta.helper.mixins import AdditionalDataMixin
+from django_sage_meta.helper.mixins import AdditionalDataMixin, FingerprintMixin
 
 
-class InstagramAccount(AdditionalDataMixin):
+class InstagramAccount(FingerprintMixin, AdditionalDataMixin):
     account_id = models.CharField(
         _("Account ID"),
         max_length=255,
@@ -65,3 +65,6 @@ class InstagramAccount(AdditionalDataMixin):
     class Meta:
         verbose_name = _("Instagram Account")
         verbose_name_plural = _("Instagram Accounts")
+        indexes = [
+            models.Index(fields=["username"], name="insta_account_username_idx"),
+        ]
@@ -0,0 +1,131 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from django_sage_meta.helper.choice import SyncJobKindEnum, SyncJobStatusEnum
+
+ACTIVE_JOB_STATUSES = (SyncJobStatusEnum.queued, SyncJobStatusEnum.running)
+
+
+class SyncJob(models.Model):
+    """Model representing a queued background sync.
+
+    Attributes:
+        kind (str): The sync stage the job runs.
+        status (str): Queued, running, done or failed.
+        processed (int): Items processed so far.
+        total (int): Items expected, when known up front.
+        rows (int): Rows written by the finished job.
+        error (str): The error message of a failed job.
+        worker (str): Name of the worker that claimed the job.
+        created_at (datetime): When the job was enqueued.
+        started_at (datetime): When a worker claimed the job.
+        heartbeat_at (datetime): When the job last reported progress.
+        finished_at (datetime): When the job finished.
+
+    """
+
+    kind = models.CharField(
+        _("Kind"),
+        max_length=20,
+        choices=SyncJobKindEnum.choices,
+        help_text=_("Sync stage run by the job"),
+        db_comment="The sync stage the job runs",
+    )
+    status = models.CharField(
+        _("Status"),
+        max_length=10,
+        choices=SyncJobStatusEnum.choices,
+        default=SyncJobStatusEnum.queued,
+        help_text=_("Current state of the job"),
+        db_comment="Whether the job is queued, running, done or failed",
+    )
+    processed = models.PositiveIntegerField(
+        _("Processed"),
+        default=0,
+        help_text=_("Items processed so far"),
+        db_comment="Number of items the job has processed so far",
+    )
+    total = models.PositiveIntegerField(
+        _("Total"),
+        null=True,
+        blank=True,
+        help_text=_("Items expected, if known"),
+        db_comment="Number of items the job expects to process, when known",
+    )
+    rows = models.PositiveIntegerField(
+        _("Rows"),
+        default=0,
+        help_text=_("Rows written by the job"),
+        db_comment="Number of rows created or updated by the job",
+    )
+    error = models.TextField(
+        _("Error"),
+        blank=True,
+        help_text=_("Error message of a failed job"),
+        db_comment="The error that made the job fail",
+    )
+    worker = models.CharField(
+        _("Worker"),
+        max_length=255,
+        blank=True,
+        help_text=_("Worker that claimed the job"),
+        db_comment="Name of the worker process that claimed the job",
+    )
+    created_at = models.DateTimeField(
+        _("Created At"),
+        auto_now_add=True,
+        help_text=_("When the job was enqueued"),
+        db_comment="When the job was enqueued",
+    )
+    started_at = models.DateTimeField(
+        _("Started At"),
+        null=True,
+        blank=True,
+        help_text=_("When a worker claimed the job"),
+        db_comment="When a worker claimed the job",
+    )
+    heartbeat_at = models.DateTimeField(
+        _("Heartbeat At"),
+        null=True,
+        blank=True,
+        help_text=_("When the job last reported progress"),
+        db_comment="When the running job last reported progress",
+    )
+    finished_at = models.DateTimeField(
+        _("Finished At"),
+        null=True,
+        blank=True,
+        help_text=_("When the job finished"),
+        db_comment="When the job finished or failed",
+    )
+
+    @property
+    def is_active(self):
+        return self.status in ACTIVE_JOB_STATUSES
+
+    @property
+    def percent(self):
+        if not self.total:
+            return None
+        return min(100, int(self.processed * 100 / self.total))
+
+    def __repr__(self):
+        return f"<SyncJob(id={self.pk}, kind={self.kind}, status={self.status})>"
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.status})"
+
+    class Meta:
+        verbose_name = _("Sync Job")
+        verbose_name_plural = _("Sync Jobs")
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["status", "created_at"], name="sync_job_status_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind"],
+                condition=models.Q(status__in=ACTIVE_JOB_STATUSES),
+                name="unique_active_sync_job",
+            )
+        ]
@@ -1,11 +1,11 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from django_sage_meta.helper.mixins import AdditionalDataMixin
+from django_sage_meta.helper.mixins import AdditionalDataMixin, FingerprintMixin
 
 from django_sage_meta.helper.choice import ContentFileEnum
 
 
-class Media(AdditionalDataMixin):
+class Media(FingerprintMixin, AdditionalDataMixin):
     media_id = models.CharField(
         _("Media ID"),
         max_length=255,
@@ -40,6 +40,14 @@ class Media(AdditionalDataMixin):
         help_text=_("When the media was created or published"),
         db_comment="Timestamp indicating when the media content was created or published",
     )
+    published_at = models.DateTimeField(
+        _("Published At"),
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text=_("When the media was published, parsed from the timestamp"),
+        db_comment="Timezone-aware publish time parsed from the Graph timestamp",
+    )
     like_counts = models.IntegerField(
         _("Like Counts"),
         null=True,
@@ -88,3 +96,8 @@ class Media(AdditionalDataMixin):
     class Meta:
         verbose_name = _("media")
         verbose_name_plural = _("medias")
+        indexes = [
+            models.Index(
+                fields=["account", "-published_at"], name="media_account_published_idx"
+            ),
+        ]
@@ -2,10 +2,10 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 
-from django_sage_meta.helper.mixins import AdditionalDataMixin
+from django_sage_meta.helper.mixins import AdditionalDataMixin, FingerprintMixin
 
 
-class FacebookPageData(AdditionalDataMixin):
+class FacebookPageData(FingerprintMixin, AdditionalDataMixin):
     """Represents a Facebook page within the application, capturing its core
     details and related associations. This model is designed to store key
     information such as the unique identifier for the page, its name, and the
@@ -70,10 +70,10 @@ class FacebookPageData(AdditionalDataMixin):
         help_text=_("List of categories for the Facebook page"),
         db_comment="Categories associated with the Facebook page",
     )
-    user = models.OneToOneField(
+    user = models.ForeignKey(
         "UserData",
         verbose_name=_("user"),
-        related_name="page",
+        related_name="pages",
         blank=True,
         on_delete=models.CASCADE,
         help_text=_("user associated with this page"),
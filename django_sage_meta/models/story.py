@@ -1,10 +1,10 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-from django_sage_meta.helper.mixins import AdditionalDataMixin
+from django_sage_meta.helper.mixins import AdditionalDataMixin, FingerprintMixin
 
 
-class Story(AdditionalDataMixin):
+class Story(FingerprintMixin, AdditionalDataMixin):
     story_id = models.CharField(
         _("Story ID"),
         max_length=255,
@@ -36,6 +36,14 @@ class Story(AdditionalDataMixin):
         help_text=_("When the story was created"),
         db_comment="Timestamp indicating when the story was created",
     )
+    published_at = models.DateTimeField(
+        _("Published At"),
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text=_("When the story was created, parsed from the timestamp"),
+        db_comment="Timezone-aware creation time parsed from the Graph timestamp",
+    )
     account = models.ForeignKey(
         "InstagramAccount",
         verbose_name=_("Instagram Account"),
@@ -55,3 +63,8 @@ class Story(AdditionalDataMixin):
     class Meta:
         verbose_name = _("Story")
         verbose_name_plural = _("Stories")
+        indexes = [
+            models.Index(
+                fields=["account", "-published_at"], name="story_account_published_idx"
+            ),
+        ]
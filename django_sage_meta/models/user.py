@@ -44,3 +44,6 @@ class UserData(AdditionalDataMixin):
     class Meta:
         verbose_name = _("User Data")
         verbose_name_plural = _("User Datas")
+        indexes = [
+            models.Index(fields=["name"], name="user_data_name_idx"),
+        ]
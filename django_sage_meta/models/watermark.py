@@ -0,0 +1,60 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from django_sage_meta.helper.choice import SyncResourceEnum
+
+
+class SyncWatermark(models.Model):
+    """Model recording how far an incremental sync has progressed.
+
+    Attributes:
+        account_id (str): The Instagram account the watermark belongs to.
+        resource (str): The synced resource (media, comments, stories,
+            rollups).
+        last_timestamp (datetime): Timestamp of the newest item seen.
+        updated_at (datetime): When the watermark was last advanced.
+
+    """
+
+    account_id = models.CharField(
+        _("Account ID"),
+        max_length=255,
+        help_text=_("Instagram account this watermark belongs to"),
+        db_comment="The Instagram account ID the watermark is tracked for",
+    )
+    resource = models.CharField(
+        _("Resource"),
+        max_length=20,
+        choices=SyncResourceEnum.choices,
+        help_text=_("Synced resource"),
+        db_comment="The kind of resource the watermark is tracked for",
+    )
+    last_timestamp = models.DateTimeField(
+        _("Last Timestamp"),
+        null=True,
+        blank=True,
+        help_text=_("Timestamp of the newest synced item"),
+        db_comment="Creation time of the newest item seen by a sync",
+    )
+    updated_at = models.DateTimeField(
+        _("Updated At"),
+        auto_now=True,
+        help_text=_("When the watermark was last advanced"),
+        db_comment="When the watermark was last advanced",
+    )
+
+    def __repr__(self):
+        return f"<SyncWatermark(account_id={self.account_id}, resource={self.resource}, last_timestamp={self.last_timestamp})>"
+
+    def __str__(self):
+        return f"{self.account_id} - {self.resource}"
+
+    class Meta:
+        verbose_name = _("Sync Watermark")
+        verbose_name_plural = _("Sync Watermarks")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account_id", "resource"],
+                name="unique_sync_watermark",
+            )
+        ]
@@ -1,4 +1,5 @@
+from .client import ClientProvider, client_provider
 from .service import SyncService, PublisherService
 
 
-__all__ = ["SyncService", "PublisherService"]
+__all__ = ["ClientProvider", "client_provider", "SyncService", "PublisherService"]
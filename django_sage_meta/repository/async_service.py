@@ -0,0 +1,450 @@
+import asyncio
+import json
+import logging
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from django_sage_meta.helper.choice import SyncJobKindEnum, SyncResourceEnum
+from django_sage_meta.models import SyncWatermark
+from django_sage_meta.repository.cache import graph_cache
+from django_sage_meta.repository.checkpoint import record_dead_letter
+from django_sage_meta.repository.graph import (
+    ACCOUNT_INSIGHT_METRICS,
+    COMMENT_FIELDS,
+    INSIGHT_FIELDS,
+    MEDIA_EXPANDED_FIELDS,
+    MEDIA_INSIGHT_METRICS,
+    STORY_FIELDS,
+    get_graph_url,
+    parse_comment,
+    parse_insight,
+    parse_media,
+    parse_story,
+)
+from django_sage_meta.repository.resolver import SyncResolver
+from django_sage_meta.repository.retry import backoff_delay, get_retries, is_transient
+from django_sage_meta.repository.service import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_LOOKBACK,
+    SyncService,
+)
+from django_sage_meta.repository.throttle import (
+    DEFAULT_MAX_RETRIES,
+    graph_throttle,
+    rate_limit_code,
+)
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 64
+DEFAULT_TIMEOUT = 30
+
+
+class AsyncGraphTransport:
+    """Asynchronous transport for Graph API reads.
+
+    Requests go through a shared ``httpx.AsyncClient`` when httpx is
+    installed, and through ``requests`` on worker threads otherwise. A
+    semaphore caps the number of requests in flight at once, and the
+    shared ``graph_throttle`` paces them from Meta's usage headers.
+
+    Args:
+        access_token (str, optional): Graph API token. Defaults to the
+            ``FACEBOOK_ACCESS_TOKEN`` setting.
+        max_concurrency (int, optional): Requests in flight at once.
+            Defaults to the ``META_SYNC_MAX_CONCURRENCY`` setting.
+        timeout (float, optional): Per-request timeout in seconds.
+
+    """
+
+    def __init__(self, access_token=None, max_concurrency=None, timeout=None):
+        if max_concurrency is None:
+            max_concurrency = getattr(
+                settings, "META_SYNC_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY
+            )
+        self.access_token = access_token or settings.FACEBOOK_ACCESS_TOKEN
+        self.timeout = timeout or DEFAULT_TIMEOUT
+        self.graph_url = get_graph_url()
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._client = (
+            httpx.AsyncClient(base_url=self.graph_url, timeout=self.timeout)
+            if httpx is not None
+            else None
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying HTTP client, if any."""
+        if self._client is not None:
+            await self._client.aclose()
+
+    async def get(self, path, **params):
+        """Send a GET request to the Graph API.
+
+        Fresh responses are served from the ``graph_cache`` and stale ones
+        are revalidated with their ``ETag``.
+
+        Args:
+            path (str): Path below the Graph API version, e.g. ``"{id}/media"``.
+            **params: Query string parameters.
+
+        Returns:
+            dict: The decoded JSON payload.
+
+        """
+        params["access_token"] = self.access_token
+        url = f"{self.graph_url}/{path}"
+        entry = None
+        if graph_cache.is_cacheable(url):
+            entry, fresh = await sync_to_async(graph_cache.lookup)(url, params)
+            if fresh:
+                return json.loads(entry["content"])
+        headers = graph_cache.conditional_headers(entry)
+
+        retries = getattr(settings, "META_THROTTLE_MAX_RETRIES", DEFAULT_MAX_RETRIES)
+        for attempt in range(retries + 1):
+            await asyncio.sleep(graph_throttle.reserve())
+            async with self._semaphore:
+                response = await self._send(path, params, headers)
+            graph_throttle.observe(response.headers)
+            code = rate_limit_code(response)
+            if code is None or attempt == retries:
+                break
+            graph_throttle.observe_rate_limit(code)
+        if response.status_code == 304 and entry is not None:
+            await sync_to_async(graph_cache.revalidate)(url, params, entry)
+            return json.loads(entry["content"])
+        response.raise_for_status()
+        if graph_cache.is_cacheable(url):
+            await sync_to_async(graph_cache.store)(
+                url, params, response.status_code, response.headers, response.content
+            )
+        return response.json()
+
+    async def _send(self, path, params, headers=None):
+        if self._client is not None:
+            return await self._client.get(f"/{path}", params=params, headers=headers)
+        return await asyncio.to_thread(
+            requests.get,
+            f"{self.graph_url}/{path}",
+            params=params,
+            headers=headers,
+            timeout=self.timeout,
+        )
+
+    async def iter_pages(self, path, **params):
+        """Yield a paginated Graph connection one page at a time.
+
+        Yields:
+            tuple: ``(items, next_cursor)``. ``next_cursor`` is None on the
+            last page.
+
+        """
+        while True:
+            payload = await self.get(path, **params)
+            paging = payload.get("paging", {})
+            after = (
+                paging.get("cursors", {}).get("after") if paging.get("next") else None
+            )
+            yield payload.get("data", []), after
+            if not after:
+                return
+            params["after"] = after
+
+
+class AsyncSyncService:
+    """Asynchronous variant of ``SyncService`` for the Graph-heavy stages.
+
+    Media pages, comments, insights and stories are fetched with many
+    requests in flight on a single event loop. Diffing and writing reuse
+    the ``SyncService`` helpers through ``sync_to_async``, so both variants
+    store exactly the same rows.
+
+    Args:
+        transport (AsyncGraphTransport, optional): The Graph transport. A new
+            one using ``access_token`` is created when omitted.
+        resolver (SyncResolver, optional): The run's foreign key resolver.
+        insta_id (str, optional): The Instagram account to sync. Defaults
+            to the ``INSTA_ID`` setting.
+        access_token (str, optional): The token used for the account.
+            Defaults to the ``FACEBOOK_ACCESS_TOKEN`` setting.
+
+    """
+
+    def __init__(self, transport=None, resolver=None, insta_id=None, access_token=None):
+        self.insta_id = insta_id or settings.INSTA_ID
+        self.transport = transport or AsyncGraphTransport(access_token)
+        self.resolver = resolver or SyncResolver()
+
+    async def sync_all(self, incremental=False):
+        """Run every sync stage, independent stages concurrently.
+
+        Categories, users and accounts run first. Pages, media, insights and
+        stories only depend on them and run together afterwards.
+
+        Returns:
+            dict: Maps each stage name to its result.
+
+        """
+        results = await self._gather(self._shared_stages())
+        results.update(
+            await self._gather(
+                {
+                    "pages": sync_to_async(SyncService.sync_facebook_pages)(
+                        resolver=self.resolver
+                    ),
+                    **self._account_stages(incremental),
+                }
+            )
+        )
+        return results
+
+    async def sync_shared(self):
+        """Run the stages shared by every account, pages after the others.
+
+        Returns:
+            dict: Maps each stage name to its result.
+
+        """
+        results = await self._gather(self._shared_stages())
+        results["pages"] = await sync_to_async(SyncService.sync_facebook_pages)(
+            resolver=self.resolver
+        )
+        return results
+
+    async def sync_account(self, incremental=False):
+        """Run the media, insights and stories stages of the account.
+
+        Returns:
+            dict: Maps each stage name to its result.
+
+        """
+        return await self._gather(self._account_stages(incremental))
+
+    def _shared_stages(self):
+        return {
+            name: sync_to_async(stage)(resolver=self.resolver)
+            for name, stage in (
+                ("categories", SyncService.sync_categories),
+                ("users", SyncService.sync_user_data),
+                ("accounts", SyncService.sync_instagram_accounts),
+            )
+        }
+
+    def _account_stages(self, incremental):
+        return {
+            "media": self.sync_media(incremental=incremental),
+            "insights": self.sync_insights(),
+            "stories": self.sync_stories(incremental=incremental),
+        }
+
+    @staticmethod
+    async def _gather(stages):
+        return dict(zip(stages, await asyncio.gather(*stages.values())))
+
+    async def sync_media(self, incremental=False, lookback=None, chunk_size=None):
+        """Synchronize media, their comments and insights page by page.
+
+        The comments and insights of a page are requested concurrently and
+        the chunk is written before the next page is processed.
+
+        Args:
+            incremental (bool): Only sync items newer than the watermark.
+            lookback (timedelta, optional): Look-back window for
+                incremental syncs.
+            chunk_size (int, optional): Media items per page. Defaults to
+                the ``META_SYNC_CHUNK_SIZE`` setting.
+
+        Returns:
+            list: The ``UpsertResult`` of every chunk write.
+
+        """
+        logger.info(f"Starting async sync of media, incremental={incremental}...")
+        if chunk_size is None:
+            chunk_size = getattr(settings, "META_SYNC_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+
+        media_since = comments_since = None
+        if incremental:
+            media_since = await self._incremental_since(
+                SyncResourceEnum.media, lookback
+            )
+            comments_since = await self._incremental_since(
+                SyncResourceEnum.comments, lookback
+            )
+
+        write_chunk = sync_to_async(SyncService._write_media_chunk)
+        media_marks, comment_marks, results = [], [], []
+        fetched = 0
+        pages = self.transport.iter_pages(
+            f"{self.insta_id}/media",
+            fields=MEDIA_EXPANDED_FIELDS,
+            limit=chunk_size,
+        )
+        async for items, _ in pages:
+            media_page = [parse_media(item) for item in items]
+            fetched += len(media_page)
+            media_marks.append(SyncService._newest_timestamp(media_page))
+            changed_media = SyncService._filter_since(media_page, media_since)
+
+            media_children = await self._fetch_media_children(changed_media)
+            comments, chunk_results = await write_chunk(
+                changed_media, media_children, self.resolver, comments_since
+            )
+            results.extend(chunk_results)
+            comment_marks.append(SyncService._newest_timestamp(comments))
+            if len(changed_media) < len(media_page):
+                logger.debug("Reached media older than the watermark, stopping.")
+                break
+        await pages.aclose()
+
+        advance = sync_to_async(SyncService._advance_watermark)
+        await advance(SyncResourceEnum.media, *media_marks, insta_id=self.insta_id)
+        await advance(SyncResourceEnum.comments, *comment_marks, insta_id=self.insta_id)
+        logger.info(f"Async media sync completed, {fetched} media items fetched.")
+        return results
+
+    async def sync_insights(self):
+        """Synchronize the account insights, one request per metric and period."""
+        logger.info("Starting async sync of Instagram insights...")
+        metric_periods = [
+            (metric, period)
+            for metric, periods in ACCOUNT_INSIGHT_METRICS.items()
+            for period in periods
+        ]
+        payloads = await asyncio.gather(
+            *(
+                self.transport.get(
+                    f"{self.insta_id}/insights",
+                    metric=metric,
+                    period=period,
+                    fields=INSIGHT_FIELDS,
+                )
+                for metric, period in metric_periods
+            ),
+            return_exceptions=True,
+        )
+
+        insight_pairs = []
+        for (metric, period), payload in zip(metric_periods, payloads):
+            if isinstance(payload, Exception):
+                logger.error(f"Error fetching insight {metric}/{period}: {payload}")
+                continue
+            insight_pairs.extend(
+                (None, parse_insight(item)) for item in payload.get("data", [])
+            )
+
+        result = await sync_to_async(SyncService._ingest_insights)(
+            insight_pairs, self.resolver, 0, self.insta_id
+        )
+        logger.info("Async Instagram insights sync completed.")
+        return result
+
+    async def sync_stories(self, incremental=False, lookback=None):
+        """Synchronize the stories of the Instagram account."""
+        logger.info(f"Starting async sync of stories, incremental={incremental}...")
+        payload = await self.transport.get(
+            f"{self.insta_id}/stories", fields=STORY_FIELDS
+        )
+        stories = [parse_story(item) for item in payload.get("data", [])]
+
+        changed_stories = stories
+        if incremental:
+            changed_stories = SyncService._filter_since(
+                stories,
+                await self._incremental_since(SyncResourceEnum.stories, lookback),
+            )
+
+        story_changes = await sync_to_async(SyncService._process_stories)(
+            changed_stories, self.resolver
+        )
+        result = await sync_to_async(SyncService._bulk_sync_changes)(story_changes)
+        await sync_to_async(SyncService._advance_watermark)(
+            SyncResourceEnum.stories,
+            SyncService._newest_timestamp(stories),
+            insta_id=self.insta_id,
+        )
+        logger.info("Async Instagram stories sync completed.")
+        return result
+
+    async def _fetch_media_children(self, media_list):
+        """Fetch comments and insights of many media items concurrently.
+
+        Returns:
+            dict: Maps each media ID to a ``(comments, insights)`` tuple.
+
+        """
+        children = await asyncio.gather(
+            *(self._fetch_children(media.id) for media in media_list)
+        )
+        return dict(zip((media.id for media in media_list), children))
+
+    async def _fetch_children(self, media_id):
+        comments, insights = await asyncio.gather(
+            self._fetch_child(
+                media_id, "comments", f"{media_id}/comments", fields=COMMENT_FIELDS
+            ),
+            self._fetch_child(
+                media_id,
+                "insights",
+                f"{media_id}/insights",
+                metric=MEDIA_INSIGHT_METRICS,
+                fields=INSIGHT_FIELDS,
+            ),
+        )
+        return (
+            [parse_comment(item) for item in comments],
+            [parse_insight(item) for item in insights],
+        )
+
+    async def _fetch_child(self, media_id, request, path, **params):
+        """Fetch the comments or insights of a media item.
+
+        Transient errors are retried with backoff. Like
+        ``SyncService._fetch_media_children``, a request that still fails is
+        parked as a dead letter and yields no rows.
+
+        Returns:
+            list: The raw items of the connection.
+
+        """
+        retries = get_retries()
+        for attempt in range(retries + 1):
+            try:
+                payload = await self.transport.get(path, **params)
+            except Exception as e:
+                if attempt < retries and is_transient(e):
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
+                await sync_to_async(record_dead_letter)(
+                    SyncJobKindEnum.media,
+                    self.insta_id,
+                    media_id,
+                    request,
+                    e,
+                    attempt + 1,
+                )
+                return []
+            return payload.get("data", [])
+
+    async def _incremental_since(self, resource, lookback=None):
+        """Async counterpart of ``SyncService._incremental_since``."""
+        watermark = await SyncWatermark.objects.filter(
+            account_id=self.insta_id, resource=resource
+        ).afirst()
+        if watermark is None or watermark.last_timestamp is None:
+            return None
+        if lookback is None:
+            lookback = getattr(settings, "META_SYNC_LOOKBACK", DEFAULT_LOOKBACK)
+        return watermark.last_timestamp - lookback
@@ -0,0 +1,55 @@
+import logging
+
+from django.conf import settings
+
+from django_sage_meta.helper.timestamp import parse_graph_timestamp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKFILL_CHUNK_SIZE = 1000
+
+
+def backfill_published_at(model, chunk_size=None):
+    """Fill ``published_at`` from the raw ``timestamp`` of stored rows.
+
+    Rows are walked in primary key order with one query and one
+    ``bulk_update`` per chunk, so no long transaction holds the table and an
+    interrupted backfill continues where it stopped when run again. Rows
+    whose timestamp cannot be parsed are left empty.
+
+    Args:
+        model (Model): ``Media``, ``Comment`` or ``Story``.
+        chunk_size (int, optional): Rows per chunk. Defaults to the
+            ``META_BACKFILL_CHUNK_SIZE`` setting.
+
+    Returns:
+        int: Number of rows updated.
+
+    """
+    if chunk_size is None:
+        chunk_size = getattr(
+            settings, "META_BACKFILL_CHUNK_SIZE", DEFAULT_BACKFILL_CHUNK_SIZE
+        )
+    rows = model.objects.filter(
+        published_at__isnull=True, timestamp__isnull=False
+    ).order_by("pk")
+    last_pk = None
+    updated = 0
+    while True:
+        chunk = rows if last_pk is None else rows.filter(pk__gt=last_pk)
+        chunk = list(chunk.only("pk", "timestamp")[:chunk_size])
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+
+        parsed = []
+        for row in chunk:
+            row.published_at = parse_graph_timestamp(row.timestamp)
+            if row.published_at is not None:
+                parsed.append(row)
+        model.objects.bulk_update(parsed, ["published_at"])
+        updated += len(parsed)
+        logger.debug(f"Backfilled {updated} {model.__name__} timestamps so far.")
+
+    logger.info(f"Backfilled published_at of {updated} {model.__name__} rows.")
+    return updated
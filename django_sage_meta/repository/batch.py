@@ -0,0 +1,166 @@
+import json
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlencode
+
+import facebook
+from django.conf import settings
+
+from django_sage_meta.repository.graph import get_graph_url
+from django_sage_meta.repository.throttle import (
+    DEFAULT_MAX_RETRIES,
+    RATE_LIMIT_CODES,
+    ThrottledSession,
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 50
+DEFAULT_TIMEOUT = 60
+
+
+class GraphBatchError(facebook.GraphAPIError):
+    """A sub-request of a Graph batch call failed.
+
+    Like the SDK's errors, ``code`` holds the Graph error code. ``status``
+    holds the HTTP status of the sub-request, None when Graph did not get
+    to it.
+
+    """
+
+    def __init__(self, status, error):
+        error = dict(error)
+        error.setdefault("message", "Unknown error")
+        if status is None or status >= 500:
+            error.setdefault("is_transient", True)
+        super().__init__({"error": error})
+        Exception.__init__(self, f"{status}: {self.message}")
+        self.status = status
+
+
+class GraphBatch:
+    """Collects Graph GET requests and sends them as batch calls.
+
+    ``get`` queues a request and returns a ``Future``. ``flush`` sends the
+    queued requests in batch calls of up to 50 sub-requests and resolves
+    every future with its own decoded body, or with ``GraphBatchError``
+    when that sub-request failed. Calls are paced by the shared throttle
+    as one request per sub-request, and sub-requests rejected by a rate
+    limit are sent again after the throttle's pause.
+
+    Args:
+        access_token (str): Graph API token used for the batch calls.
+        batch_size (int, optional): Sub-requests per call, at most 50.
+            Defaults to the ``META_GRAPH_BATCH_SIZE`` setting.
+        max_workers (int, optional): Batch calls sent at the same time.
+        session (ThrottledSession, optional): HTTP session to reuse.
+
+    """
+
+    def __init__(self, access_token, batch_size=None, max_workers=1, session=None):
+        if batch_size is None:
+            batch_size = getattr(settings, "META_GRAPH_BATCH_SIZE", MAX_BATCH_SIZE)
+        self.access_token = access_token
+        self.batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+        self.max_workers = max(1, max_workers or 1)
+        self.session = session or ThrottledSession()
+        self.graph_url = get_graph_url()
+        self.calls = 0
+        self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.flush()
+
+    def get(self, path, **params):
+        """Queue a GET request.
+
+        Args:
+            path (str): Path below the Graph API version, e.g.
+                ``"{media_id}/comments"``.
+            **params: Query string parameters.
+
+        Returns:
+            Future: Resolved with the decoded body once flushed.
+
+        """
+        future = Future()
+        relative_url = f"{path}?{urlencode(params)}" if params else path
+        self._pending.append((relative_url, future))
+        return future
+
+    def flush(self):
+        """Send every queued request and resolve their futures."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        chunks = [
+            pending[start : start + self.batch_size]
+            for start in range(0, len(pending), self.batch_size)
+        ]
+        logger.debug(
+            f"Sending {len(pending)} Graph requests in {len(chunks)} batch calls."
+        )
+        if self.max_workers == 1 or len(chunks) == 1:
+            for chunk in chunks:
+                self._send(chunk)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(chunks))
+            ) as executor:
+                list(executor.map(self._send, chunks))
+
+    def _send(self, chunk, attempt=0):
+        try:
+            response = self.session.post(
+                f"{self.graph_url}/",
+                data={
+                    "access_token": self.access_token,
+                    "include_headers": "false",
+                    "batch": json.dumps(
+                        [
+                            {"method": "GET", "relative_url": relative_url}
+                            for relative_url, _ in chunk
+                        ]
+                    ),
+                },
+                timeout=DEFAULT_TIMEOUT,
+                tokens=len(chunk),
+            )
+            response.raise_for_status()
+            results = response.json()
+        except Exception as e:
+            logger.error(f"Graph batch call failed: {e}")
+            for _, future in chunk:
+                future.set_exception(e)
+            return
+        finally:
+            self.calls += 1
+
+        retries = getattr(settings, "META_THROTTLE_MAX_RETRIES", DEFAULT_MAX_RETRIES)
+        rate_limited, limit_code = [], None
+        for entry, result in zip(chunk, results):
+            future = entry[1]
+            if result is None:
+                # Graph returns null for sub-requests it did not get to.
+                continue
+            body = json.loads(result.get("body") or "{}")
+            if result.get("code") == 200:
+                future.set_result(body)
+                continue
+            error = body.get("error", {})
+            if error.get("code") in RATE_LIMIT_CODES and attempt < retries:
+                rate_limited.append(entry)
+                limit_code = error["code"]
+                continue
+            future.set_exception(GraphBatchError(result.get("code"), error))
+
+        if rate_limited:
+            self.session.throttle.observe_rate_limit(limit_code)
+            self._send(rate_limited, attempt + 1)
+        for _, future in chunk:
+            if not future.done():
+                future.set_exception(GraphBatchError(None, {"message": "No response"}))
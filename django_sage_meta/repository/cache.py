@@ -0,0 +1,218 @@
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from django.core.cache import caches
+from requests.structures import CaseInsensitiveDict
+
+from django_sage_meta.repository.throttle import ThrottledSession
+
+logger = logging.getLogger(__name__)
+
+# Seconds a response stays fresh, per Graph edge. ``me`` is the user
+# object and ``object`` any other node read by ID. Endpoints missing here
+# use ``META_GRAPH_CACHE_DEFAULT_TTL``.
+DEFAULT_TTLS = {
+    "me": 3600,
+    "accounts": 3600,
+    "object": 600,
+    "media": 300,
+    "insights": 900,
+    "comments": 120,
+    "stories": 60,
+}
+DEFAULT_TTL = 0
+DEFAULT_MAX_AGE = 24 * 3600
+DEFAULT_MAX_SIZE = 1024 * 1024
+CACHED_HEADERS = ("Content-Type", "ETag")
+
+_VERSION = re.compile(r"^v\d+\.\d+$")
+
+
+class GraphCache:
+    """Cache of Graph API GET responses in a Django cache.
+
+    Responses are keyed by URL and query string, access token included, so
+    tokens never see each other's data. A response younger than its
+    endpoint's TTL is served without a request. An older one is kept for
+    up to ``META_GRAPH_CACHE_MAX_AGE`` seconds when the API sent an
+    ``ETag``; it is then revalidated with ``If-None-Match`` and a
+    ``304 Not Modified`` answer serves the stored body again.
+
+    Entries live in the cache alias named by the ``META_GRAPH_CACHE``
+    setting, ``None`` disabling the cache. The backend bounds the number of
+    entries: ``LocMemCache`` evicts the least recently used ones beyond its
+    ``MAX_ENTRIES`` option, and a shared backend such as Redis lets worker
+    processes and admin requests reuse each other's responses. Responses
+    larger than ``META_GRAPH_CACHE_MAX_SIZE`` bytes are not cached.
+
+    """
+
+    def __init__(self, alias=None, ttls=None):
+        self.alias = alias
+        self.ttls = ttls
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @property
+    def cache(self):
+        alias = self.alias or getattr(settings, "META_GRAPH_CACHE", "default")
+        return caches[alias] if alias else None
+
+    def get_ttl(self, url):
+        """Return the freshness lifetime of responses from ``url``."""
+        ttls = {
+            **DEFAULT_TTLS,
+            **(self.ttls or getattr(settings, "META_GRAPH_CACHE_TTLS", {})),
+        }
+        default = getattr(settings, "META_GRAPH_CACHE_DEFAULT_TTL", DEFAULT_TTL)
+        return ttls.get(endpoint_name(url), default)
+
+    def is_cacheable(self, url):
+        return self.cache is not None and self.get_ttl(url) > 0
+
+    def lookup(self, url, params):
+        """Return the cached entry of a request and whether it is fresh.
+
+        Returns:
+            tuple: ``(entry, fresh)``. ``entry`` is None on a miss.
+
+        """
+        entry = self.cache.get(self._key(url, params))
+        fresh = entry is not None and time.time() - entry["stored_at"] < self.get_ttl(
+            url
+        )
+        with self._lock:
+            if fresh:
+                self.hits += 1
+            elif entry is None:
+                self.misses += 1
+        return entry, fresh
+
+    def store(self, url, params, status_code, headers, content):
+        """Cache a successful response.
+
+        Returns:
+            dict | None: The stored entry, or None if it was not cacheable.
+
+        """
+        if status_code != 200 or len(content) > getattr(
+            settings, "META_GRAPH_CACHE_MAX_SIZE", DEFAULT_MAX_SIZE
+        ):
+            return None
+        entry = {
+            "headers": {
+                name: headers[name] for name in CACHED_HEADERS if name in headers
+            },
+            "content": content,
+            "stored_at": time.time(),
+        }
+        self._set(url, params, entry)
+        return entry
+
+    def revalidate(self, url, params, entry):
+        """Mark an entry as fresh again after a ``304 Not Modified``."""
+        entry = {**entry, "stored_at": time.time()}
+        self._set(url, params, entry)
+        with self._lock:
+            self.revalidated += 1
+        return entry
+
+    def conditional_headers(self, entry):
+        """Return the headers asking the API to revalidate ``entry``."""
+        etag = entry and entry["headers"].get("ETag")
+        return {"If-None-Match": etag} if etag else {}
+
+    def metrics(self):
+        """Return the hit, revalidation and miss counts."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+            }
+
+    def _set(self, url, params, entry):
+        ttl = self.get_ttl(url)
+        if entry["headers"].get("ETag"):
+            max_age = getattr(settings, "META_GRAPH_CACHE_MAX_AGE", DEFAULT_MAX_AGE)
+            ttl = max(ttl, max_age)
+        self.cache.set(self._key(url, params), entry, ttl)
+
+    def _key(self, url, params):
+        payload = json.dumps([url, sorted((params or {}).items())], default=str)
+        return f"meta-graph:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+class CachedGraphSession(ThrottledSession):
+    """A throttled session answering Graph reads from a ``GraphCache``.
+
+    Fresh cache hits cost neither a request nor a throttle token.
+
+    """
+
+    def __init__(self, throttle=None, cache=None):
+        super().__init__(throttle)
+        self.cache = cache or graph_cache
+
+    def request(self, method, url, *args, **kwargs):
+        if method.upper() != "GET" or args or not self.cache.is_cacheable(url):
+            return super().request(method, url, *args, **kwargs)
+
+        params = kwargs.get("params")
+        entry, fresh = self.cache.lookup(url, params)
+        if fresh:
+            return build_response(url, entry)
+
+        kwargs["headers"] = {
+            **(kwargs.get("headers") or {}),
+            **self.cache.conditional_headers(entry),
+        }
+        response = super().request(method, url, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            return build_response(url, self.cache.revalidate(url, params, entry))
+        self.cache.store(
+            url, params, response.status_code, response.headers, response.content
+        )
+        return response
+
+
+def endpoint_name(url):
+    """Return the Graph edge a URL reads, used to pick its TTL.
+
+    ``/v20.0/{id}/media`` reads ``media``, ``/v20.0/me`` reads ``me`` and
+    ``/v20.0/{id}`` reads ``object``.
+
+    """
+    path = urlsplit(url).path
+    segments = [segment for segment in path.split("/") if segment]
+    if segments and _VERSION.match(segments[0]):
+        segments = segments[1:]
+    if len(segments) > 1:
+        return segments[-1]
+    if segments == ["me"]:
+        return "me"
+    return "object"
+
+
+def build_response(url, entry):
+    """Build a ``requests`` response from a cache entry."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response.encoding = "utf-8"
+    response._content = entry["content"]
+    response.from_cache = True
+    return response
+
+
+graph_cache = GraphCache()
@@ -0,0 +1,107 @@
+import logging
+
+from django.db.models import F
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from django_sage_meta.models import SyncCheckpoint, SyncDeadLetter
+
+logger = logging.getLogger(__name__)
+
+
+def load_checkpoint(stage, account_id):
+    """Return the unfinished checkpoint of ``stage``, if any."""
+    return SyncCheckpoint.objects.filter(
+        stage=stage, account_id=account_id, completed=False
+    ).first()
+
+
+def save_checkpoint(stage, account_id, cursor, processed, marks):
+    """Persist the progress of ``stage`` after a flushed chunk.
+
+    Args:
+        stage (str): A ``SyncJobKindEnum`` value.
+        account_id (str): The Instagram account being synced.
+        cursor (str): Cursor of the next page, None after the last one.
+        processed (int): Items processed so far.
+        marks (dict): Newest timestamp seen per resource.
+
+    """
+    SyncCheckpoint.objects.update_or_create(
+        stage=stage,
+        account_id=account_id,
+        defaults={
+            "cursor": cursor,
+            "processed": processed,
+            "marks": {
+                resource: mark.isoformat()
+                for resource, mark in marks.items()
+                if mark is not None
+            },
+            "completed": False,
+        },
+    )
+    logger.debug(f"Saved {stage} checkpoint for {account_id} at cursor {cursor}.")
+
+
+def checkpoint_marks(checkpoint):
+    """Return the marks of ``checkpoint`` as datetimes."""
+    if checkpoint is None:
+        return {}
+    return {
+        resource: parse_datetime(mark) for resource, mark in checkpoint.marks.items()
+    }
+
+
+def complete_stage(stage, account_id):
+    """Mark ``stage`` as finished for ``account_id``."""
+    SyncCheckpoint.objects.update_or_create(
+        stage=stage,
+        account_id=account_id,
+        defaults={"cursor": None, "completed": True},
+    )
+
+
+def completed_stages(account_id):
+    """Return the names of the stages finished for ``account_id``."""
+    return set(
+        SyncCheckpoint.objects.filter(
+            account_id=account_id, completed=True
+        ).values_list("stage", flat=True)
+    )
+
+
+def clear_checkpoints(account_id=None):
+    """Forget all checkpoints, or those of one account, to start afresh."""
+    checkpoints = SyncCheckpoint.objects.all()
+    if account_id is not None:
+        checkpoints = checkpoints.filter(account_id=account_id)
+    checkpoints.delete()
+
+
+def record_dead_letter(stage, account_id, object_id, request, error, attempts):
+    """Park a request that failed every retry.
+
+    A request that is parked again has its attempts added up and its
+    error replaced.
+
+    """
+    updated = SyncDeadLetter.objects.filter(
+        object_id=object_id, request=request
+    ).update(
+        stage=stage,
+        account_id=account_id,
+        error=str(error),
+        attempts=F("attempts") + attempts,
+        updated_at=timezone.now(),
+    )
+    if not updated:
+        SyncDeadLetter.objects.create(
+            stage=stage,
+            account_id=account_id,
+            object_id=object_id,
+            request=request,
+            error=str(error),
+            attempts=attempts,
+        )
+    logger.error(f"Parked {request} of {object_id} after {attempts} attempts: {error}")
@@ -0,0 +1,136 @@
+import logging
+import threading
+import time
+
+from django.conf import settings
+from sage_meta.service import FacebookClient
+
+from django_sage_meta.repository.cache import CachedGraphSession
+from django_sage_meta.repository.graph import get_graph_url, rebase_graph_url
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLIENT_CACHE_TTL = 300
+
+
+class GraphSession(CachedGraphSession):
+    """A ``CachedGraphSession`` sending requests to ``get_graph_url()``.
+
+    facebook-sdk builds its URLs from a fixed host and version, so without
+    the rebase ``META_GRAPH_URL`` would only redirect ``GraphBatch`` and the
+    async transport.
+
+    """
+
+    def request(self, method, url, *args, **kwargs):
+        return super().request(method, rebase_graph_url(url), *args, **kwargs)
+
+
+class GraphClient(FacebookClient):
+    """A ``FacebookClient`` whose Graph requests go through ``graph_session``.
+
+    ``FacebookClient.__init__`` builds its ``GraphAPI`` and requests ``me``
+    right away, so the session is attached in ``get_user_data``, before that
+    first request. Every request of the client, ``me`` included, is then
+    cached, throttled and sent to ``get_graph_url()``.
+
+    Args:
+        access_token (str): Graph API token.
+        graph_session (requests.Session, optional): The session used for
+            Graph requests. Defaults to a new ``GraphSession``.
+
+    """
+
+    def __init__(self, access_token, graph_session=None):
+        self.graph_session = graph_session or GraphSession()
+        super().__init__(access_token)
+        # Read by the handlers that call the API with plain ``requests``.
+        self.graph_url = get_graph_url()
+
+    def get_user_data(self):
+        self.graph.session = self.graph_session
+        super().get_user_data()
+
+
+class ClientProvider:
+    """Process-wide provider of shared ``FacebookClient`` instances.
+
+    One client is kept per access token, and the accounts payload together
+    with the user info it populates is cached for ``META_CLIENT_CACHE_TTL``
+    seconds. Every sync stage and publisher in the process goes through the
+    provider, so a full sync fetches the accounts payload once instead of
+    once per stage.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._clients = {}
+        self._snapshots = {}
+
+    def get_client(self, access_token=None):
+        """Return the shared client for ``access_token``.
+
+        Args:
+            access_token (str, optional): Graph API token. Defaults to the
+                ``FACEBOOK_ACCESS_TOKEN`` setting.
+
+        Returns:
+            GraphClient: The memoized client.
+
+        """
+        token = access_token or settings.FACEBOOK_ACCESS_TOKEN
+        with self._lock:
+            client = self._clients.get(token)
+            if client is None:
+                logger.debug("Creating a new FacebookClient.")
+                client = GraphClient(token, graph_session=GraphSession())
+                self._clients[token] = client
+            return client
+
+    def get_accounts(self, access_token=None):
+        """Return the cached accounts payload for ``access_token``."""
+        return self._get_snapshot(access_token)[0]
+
+    def get_user_info(self, access_token=None):
+        """Return the cached user info for ``access_token``."""
+        return self._get_snapshot(access_token)[1]
+
+    def invalidate(self, access_token=None, drop_client=False):
+        """Forget the cached accounts snapshot.
+
+        Args:
+            access_token (str, optional): Only invalidate this token. All
+                tokens are invalidated when omitted.
+            drop_client (bool): Also discard the memoized client(s).
+
+        """
+        with self._lock:
+            if access_token is None:
+                self._snapshots.clear()
+                if drop_client:
+                    self._clients.clear()
+            else:
+                self._snapshots.pop(access_token, None)
+                if drop_client:
+                    self._clients.pop(access_token, None)
+        logger.debug("Invalidated cached Facebook accounts snapshot.")
+
+    def _get_snapshot(self, access_token=None):
+        token = access_token or settings.FACEBOOK_ACCESS_TOKEN
+        with self._lock:
+            snapshot = self._snapshots.get(token)
+            if snapshot is not None and snapshot[0] > time.monotonic():
+                return snapshot[1:]
+
+            client = self.get_client(token)
+            accounts = client.account_handler.get_accounts()
+            # python-sage-meta releases name the ``me`` result differently.
+            user_info = getattr(client, "user_info", None) or client.user
+            ttl = getattr(settings, "META_CLIENT_CACHE_TTL", DEFAULT_CLIENT_CACHE_TTL)
+            self._snapshots[token] = (time.monotonic() + ttl, accounts, user_info)
+            logger.debug(f"Cached {len(accounts)} Facebook accounts for {ttl}s.")
+            return accounts, user_info
+
+
+client_provider = ClientProvider()
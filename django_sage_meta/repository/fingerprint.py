@@ -0,0 +1,107 @@
+import hashlib
+import json
+import logging
+from collections import defaultdict
+
+from django_sage_meta.repository.upsert import UPSERT_KEYS
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_FIELD = "fingerprint"
+
+
+def compute_fingerprint(values):
+    """Return the SHA-256 fingerprint of a normalized row payload.
+
+    Args:
+        values (dict): Attribute names mapped to the values to store.
+
+    Returns:
+        str: A 64 character hex digest, independent of key order.
+
+    """
+    payload = json.dumps(values, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ChangeSet:
+    """Collects the new and changed rows of one model during a sync.
+
+    Incoming rows are passed to ``add`` as normalized values and compared
+    with the stored columns, so a row edited in the database is repaired by
+    the next sync even though its payload did not change. A row whose
+    columns and fingerprint all match is skipped. Changed rows are grouped
+    by the exact set of columns that differ, so each group is written with
+    an update touching only those columns.
+
+    Attributes:
+        model (Model): The model the rows belong to.
+        created (list): New, unsaved instances.
+        changed (dict): Changed instances keyed by their update field names.
+        unchanged (int): Number of rows whose stored columns matched.
+
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.created = []
+        self.changed = defaultdict(list)
+        self.unchanged = 0
+        self._create_fields = None
+
+    def __len__(self):
+        return len(self.created) + sum(len(objs) for objs in self.changed.values())
+
+    def add(self, existing, values):
+        """Merge ``values`` into ``existing``, or build a new instance.
+
+        Args:
+            existing (Model | None): The stored row, loaded with at least the
+                keys of ``values`` and the fingerprint.
+            values (dict): Attribute names (``<fk>_id`` for foreign keys)
+                mapped to the incoming values.
+
+        Returns:
+            Model: The existing or new instance.
+
+        """
+        fingerprint = compute_fingerprint(values)
+        if existing is None:
+            obj = self.model(**values, fingerprint=fingerprint)
+            self.created.append(obj)
+            if self._create_fields is None:
+                self._create_fields = self._field_names(values)
+            return obj
+
+        changed = [
+            name for name, value in values.items() if getattr(existing, name) != value
+        ]
+        if not changed and existing.fingerprint == fingerprint:
+            self.unchanged += 1
+            return existing
+
+        for name in changed:
+            setattr(existing, name, values[name])
+        existing.fingerprint = fingerprint
+        self.changed[tuple(self._field_names(changed))].append(existing)
+        return existing
+
+    def objects(self):
+        """Return every new and changed instance."""
+        return self.created + [obj for objs in self.changed.values() for obj in objs]
+
+    def batches(self):
+        """Yield ``(objs, update_fields)`` pairs ready for ``bulk_upsert``."""
+        if self.created:
+            yield self.created, self._create_fields
+        for fields, objs in self.changed.items():
+            yield objs, list(fields)
+
+    def _field_names(self, attnames):
+        key = UPSERT_KEYS[self.model]
+        names = [
+            self.model._meta.get_field(attname).name
+            for attname in attnames
+            if attname != key
+        ]
+        return names + [FINGERPRINT_FIELD]
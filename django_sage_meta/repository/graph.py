@@ -0,0 +1,226 @@
+import logging
+import re
+
+import facebook
+from django.conf import settings
+from sage_meta.models import Comment, Insight, Media, Story
+
+from django_sage_meta.repository.retry import retry_call
+
+logger = logging.getLogger(__name__)
+
+GRAPH_URL = "https://graph.facebook.com/v20.0"
+
+_SDK_VERSION = re.compile(r"^v\d+\.\d+/")
+
+# Graph fields requested per resource: only what the parsers below read
+# and the sync stores. ``counters`` is used by counters-only refreshes.
+FIELD_PROJECTIONS = {
+    "media": (
+        "id",
+        "username",
+        "caption",
+        "media_type",
+        "media_url",
+        "timestamp",
+        "like_count",
+        "comments_count",
+    ),
+    "comments": ("id", "text", "username", "like_count", "timestamp"),
+    "stories": ("id", "username", "media_type", "media_url", "timestamp"),
+    "insights": ("id", "name", "period", "values", "title", "description"),
+    "counters": ("id", "like_count", "comments_count"),
+}
+
+
+def project(resource):
+    """Return the ``fields`` parameter for ``resource``."""
+    return ",".join(FIELD_PROJECTIONS[resource])
+
+
+MEDIA_FIELDS = project("media")
+MEDIA_EXPANDED_FIELDS = f"{MEDIA_FIELDS},children{{media_url}}"
+COMMENT_FIELDS = project("comments")
+STORY_FIELDS = project("stories")
+INSIGHT_FIELDS = project("insights")
+COUNTER_FIELDS = project("counters")
+MEDIA_INSIGHT_METRICS = "impressions,reach,saved"
+ACCOUNT_INSIGHT_METRICS = {
+    "impressions": ["day", "lifetime"],
+    "reach": ["day", "lifetime"],
+    "profile_views": ["day", "lifetime"],
+    "follower_count": ["day"],
+    "audience_gender_age": ["lifetime"],
+    "audience_city": ["lifetime"],
+    "audience_country": ["lifetime"],
+    "audience_locale": ["lifetime"],
+    "saved": ["lifetime"],
+}
+
+
+def get_graph_url():
+    """Return the Graph API base URL.
+
+    The ``META_GRAPH_URL`` setting points requests at another host, such as
+    the local ``graph_stub`` server.
+
+    """
+    return getattr(settings, "META_GRAPH_URL", GRAPH_URL).rstrip("/")
+
+
+def rebase_graph_url(url):
+    """Point a facebook-sdk request URL at ``get_graph_url()``.
+
+    facebook-sdk prefixes every path with its own host and a pinned
+    ``v3.1`` version; both are replaced by the configured base URL. Other
+    URLs are returned unchanged.
+
+    """
+    if not url.startswith(facebook.FACEBOOK_GRAPH_URL):
+        return url
+    path = _SDK_VERSION.sub("", url[len(facebook.FACEBOOK_GRAPH_URL) :])
+    return f"{get_graph_url()}/{path}"
+
+
+def parse_media(item):
+    """Build a media item from a raw Graph payload.
+
+    Carousel children are read from a ``children{media_url}`` field
+    expansion instead of a separate request.
+
+    """
+    children = item.get("children", {}).get("data", [])
+    media = Media(
+        id=item["id"],
+        caption=item.get("caption"),
+        media_type=item.get("media_type"),
+        media_url=(
+            [child.get("media_url") for child in children]
+            if children
+            else [item.get("media_url")]
+        ),
+        timestamp=item.get("timestamp"),
+        like_count=item.get("like_count"),
+        comments_count=item.get("comments_count"),
+    )
+    media.username = item.get("username")
+    return media
+
+
+def parse_comment(item):
+    """Build a comment from a raw Graph payload."""
+    return Comment(
+        id=item["id"],
+        text=item.get("text"),
+        username=item.get("username"),
+        like_count=item.get("like_count"),
+        timestamp=item.get("timestamp"),
+    )
+
+
+def parse_insight(item):
+    """Build an insight from a raw Graph payload."""
+    return Insight(
+        id=item["id"],
+        name=item["name"],
+        period=item["period"],
+        values=item.get("values", []),
+        title=item.get("title", ""),
+        description=item.get("description", ""),
+    )
+
+
+def parse_story(item):
+    """Build a story from a raw Graph payload."""
+    story = Story(
+        id=item["id"],
+        media_type=item.get("media_type"),
+        media_url=item.get("media_url"),
+        timestamp=item.get("timestamp"),
+    )
+    story.username = item.get("username")
+    return story
+
+
+def iter_media_pages(
+    client, insta_id, page_size, after=None, fields=MEDIA_EXPANDED_FIELDS
+):
+    """Yield the media of an Instagram account one Graph page at a time.
+
+    Pages are requested lazily, newest media first, so a caller can flush
+    each page before the next one is fetched or stop early. A failing page
+    request is retried with backoff.
+
+    Args:
+        client (FacebookClient): The client used for the requests.
+        insta_id (str): Instagram business account ID.
+        page_size (int): Media items requested per page.
+        after (str, optional): Pagination cursor to resume from.
+        fields (str): The fields requested per media item.
+
+    Yields:
+        tuple: ``(media_items, next_cursor)``. ``next_cursor`` is None on
+        the last page.
+
+    """
+    while True:
+        params = {"fields": fields, "limit": page_size}
+        if after:
+            params["after"] = after
+        payload = retry_call(client.graph.get_connections, insta_id, "media", **params)
+
+        media_items = [parse_media(item) for item in payload.get("data", [])]
+
+        paging = payload.get("paging", {})
+        after = paging.get("cursors", {}).get("after") if paging.get("next") else None
+        logger.debug(f"Fetched a page of {len(media_items)} media items.")
+        yield media_items, after
+        if not after:
+            return
+
+
+def fetch_stories(client, insta_id):
+    """Return the current stories of an Instagram account."""
+    payload = retry_call(
+        client.graph.get_connections, insta_id, "stories", fields=STORY_FIELDS
+    )
+    return [parse_story(item) for item in payload.get("data", [])]
+
+
+def fetch_comments(client, media_id):
+    """Return the comments of a media item."""
+    payload = client.graph.get_connections(media_id, "comments", fields=COMMENT_FIELDS)
+    return [parse_comment(item) for item in payload.get("data", [])]
+
+
+def fetch_account_insights(client, insta_id):
+    """Return the insights of an Instagram account.
+
+    Metrics are requested one period at a time, as the Graph API rejects
+    some combinations. A metric that fails is logged and skipped.
+
+    """
+    insights = []
+    for metric, periods in ACCOUNT_INSIGHT_METRICS.items():
+        for period in periods:
+            try:
+                payload = client.graph.get_connections(
+                    insta_id,
+                    "insights",
+                    metric=metric,
+                    period=period,
+                    fields=INSIGHT_FIELDS,
+                )
+            except facebook.GraphAPIError as e:
+                logger.error(f"Error fetching insight {metric}/{period}: {e}")
+                continue
+            insights.extend(parse_insight(item) for item in payload.get("data", []))
+    return insights
+
+
+def fetch_media_insights(client, media_id):
+    """Return the insights of a media item."""
+    payload = client.graph.get_connections(
+        media_id, "insights", metric=MEDIA_INSIGHT_METRICS, fields=INSIGHT_FIELDS
+    )
+    return [parse_insight(item) for item in payload.get("data", [])]
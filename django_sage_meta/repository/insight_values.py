@@ -0,0 +1,262 @@
+import logging
+from numbers import Number
+
+from django.db import connections, router, transaction
+from django.db.models import Avg, Count, Max, Min, Q, Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+from django.utils import timezone
+
+from django_sage_meta.helper.timestamp import parse_graph_timestamp
+from django_sage_meta.models import Insight, InsightValue
+from django_sage_meta.repository.lookup import chunked, resolve_pks
+from django_sage_meta.repository.retention import retention_cutoff
+from django_sage_meta.repository.rollups import mark_stale_buckets
+from django_sage_meta.repository.upsert import get_batch_size
+
+logger = logging.getLogger(__name__)
+
+BUCKETS = {"day": TruncDay, "week": TruncWeek, "month": TruncMonth}
+AGGREGATES = {"sum": Sum, "avg": Avg, "min": Min, "max": Max}
+# The columns of the ``unique_insight_value`` constraint.
+POINT_FIELDS = ["insight", "end_time", "key"]
+
+
+def iter_data_points(values):
+    """Yield the numeric data points of an insight ``values`` blob.
+
+    Args:
+        values (list): Graph insight values, e.g.
+            ``[{"value": 5, "end_time": "2024-07-02T07:00:00+0000"}]``.
+
+    Yields:
+        tuple: ``(end_time, key, value)``. ``key`` is empty for plain values
+        and the breakdown key for mapping values. Non-numeric values are
+        skipped.
+
+    """
+    for entry in values or []:
+        if not isinstance(entry, dict):
+            continue
+        end_time = parse_graph_timestamp(entry.get("end_time"))
+        value = entry.get("value")
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if isinstance(item, Number) and not isinstance(item, bool):
+                    yield end_time, str(key), float(item)
+        elif isinstance(value, Number) and not isinstance(value, bool):
+            yield end_time, "", float(value)
+
+
+def build_data_points(insight, insight_pk, model=InsightValue):
+    """Return the unsaved value rows of one insight."""
+    return [
+        model(
+            insight_id=insight_pk,
+            metric=insight.name,
+            period=insight.period,
+            end_time=end_time,
+            key=key,
+            value=value,
+        )
+        for end_time, key, value in iter_data_points(insight.values)
+    ]
+
+
+def _incoming_points(insights, insight_pks):
+    """Map the points of ``insights`` to their unsaved rows.
+
+    Dated points older than the ``insight_values`` retention cutoff are
+    left out, so a sync does not bring back pruned values.
+
+    """
+    cutoff = retention_cutoff("insight_values")
+    incoming = {}
+    for insight in insights:
+        if insight.insight_id not in insight_pks:
+            continue
+        for row in build_data_points(insight, insight_pks[insight.insight_id]):
+            if cutoff is None or row.end_time is None or row.end_time >= cutoff:
+                incoming[(row.insight_id, row.end_time, row.key)] = row
+    return incoming
+
+
+def _existing_points(insight_pks):
+    """Map the stored points of ``insight_pks`` to ``(pk, value)``."""
+    existing = {}
+    for chunk in chunked(insight_pks):
+        for pk, insight_id, end_time, key, value in InsightValue.objects.filter(
+            insight_id__in=chunk
+        ).values_list("pk", "insight_id", "end_time", "key", "value"):
+            existing[(insight_id, end_time, key)] = (pk, value)
+    return existing
+
+
+def _diff_points(incoming, existing):
+    """Split incoming rows into created and changed ones, and find stale pks.
+
+    Changed rows get the primary key of their stored row and a new
+    ``updated_at``. Stale pks are stored keys of a reported ``end_time``
+    that the incoming rows no longer list.
+
+    """
+    now = timezone.now()
+    created, changed = [], []
+    for point, row in incoming.items():
+        if point not in existing:
+            created.append(row)
+            continue
+        pk, value = existing[point]
+        if value != row.value:
+            row.pk = pk
+            row.updated_at = now
+            changed.append(row)
+    reported = {(insight_id, end_time) for insight_id, end_time, _ in incoming}
+    stale = [
+        pk
+        for point, (pk, _) in existing.items()
+        if point[:2] in reported and point not in incoming
+    ]
+    return created, changed, stale
+
+
+def _split_writes(rows, connection):
+    """Split rows into upserted, inserted and updated ones.
+
+    Dated points are upserted on the unique constraint, so a point a
+    concurrent sync inserted first is updated instead of duplicated.
+    Lifetime points have no end_time to match on and fall back to
+    insert-or-ignore plus an update by primary key, like backends without
+    upsert support.
+
+    """
+    upserted, inserted, updated = [], [], []
+    for row in rows:
+        if row.end_time is not None and connection.features.supports_update_conflicts:
+            row.pk = None
+            upserted.append(row)
+        elif row.pk is None:
+            inserted.append(row)
+        else:
+            updated.append(row)
+    return upserted, inserted, updated
+
+
+def write_insight_values(insights, batch_size=None):
+    """Upsert the value rows of new and changed insights.
+
+    Rows are matched on ``(insight, end_time, key)``, which the database
+    keeps unique. New data points are inserted and changed values updated,
+    with ``updated_at`` moved forward so the rollup refresh picks up their
+    buckets. Dated points that fell out of the API's window are kept, so
+    the history grows beyond it. A reported ``end_time`` replaces its whole
+    breakdown, so keys it no longer lists are deleted and their rollup
+    buckets flagged stale.
+
+    Args:
+        insights (list): ``Insight`` instances whose values were written.
+        batch_size (int, optional): Rows per insert or update.
+
+    Returns:
+        int: Number of value rows inserted or updated.
+
+    """
+    if not insights:
+        return 0
+    pks = resolve_pks(Insight, (insight.insight_id for insight in insights))
+    created, changed, stale = _diff_points(
+        _incoming_points(insights, pks), _existing_points(pks.values())
+    )
+
+    connection = connections[router.db_for_write(InsightValue)]
+    upserted, inserted, updated = _split_writes(created + changed, connection)
+    batch_size = batch_size or get_batch_size(InsightValue)
+    with transaction.atomic():
+        InsightValue.objects.bulk_create(
+            upserted,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=(
+                POINT_FIELDS
+                if connection.features.supports_update_conflicts_with_target
+                else None
+            ),
+            update_fields=["value", "updated_at"],
+        )
+        InsightValue.objects.bulk_create(
+            inserted, batch_size=batch_size, ignore_conflicts=True
+        )
+        InsightValue.objects.bulk_update(
+            updated, ["value", "updated_at"], batch_size=batch_size
+        )
+        for chunk in chunked(stale):
+            values = InsightValue.objects.filter(pk__in=chunk)
+            mark_stale_buckets(values)
+            values.delete()
+    logger.debug(
+        f"Wrote values of {len(pks)} insights: {len(created)} created, "
+        f"{len(changed)} updated, {len(stale)} stale removed."
+    )
+    return len(created) + len(changed)
+
+
+def aggregate_insight_values(
+    metric,
+    start=None,
+    end=None,
+    period="day",
+    bucket="day",
+    aggregate="sum",
+    kind=None,
+    account_id=None,
+    key="",
+):
+    """Aggregate the values of a metric per time bucket in SQL.
+
+    For example, the daily reach of all media over the last 90 days::
+
+        aggregate_insight_values(
+            "reach", start=now - timedelta(days=90), kind=InsightKindEnum.media
+        )
+
+    Args:
+        metric (str): The metric name, e.g. ``reach``.
+        start (datetime, optional): Include values ending at or after it.
+        end (datetime, optional): Include values ending before it.
+        period (str): The metric period, e.g. ``day`` or ``lifetime``.
+        bucket (str): ``day``, ``week`` or ``month``.
+        aggregate (str): ``sum``, ``avg``, ``min`` or ``max``.
+        kind (str, optional): An ``InsightKindEnum`` value.
+        account_id (str, optional): Only this Instagram account's account
+            insights and media insights.
+        key (str | None): Breakdown key. ``None`` aggregates every key
+            separately.
+
+    Returns:
+        list: Dicts with ``bucket``, ``value`` and ``count`` (and ``key``
+        when ``key`` is None), ordered by bucket.
+
+    """
+    values = InsightValue.objects.filter(metric=metric, period=period)
+    if start is not None:
+        values = values.filter(end_time__gte=start)
+    if end is not None:
+        values = values.filter(end_time__lt=end)
+    if kind is not None:
+        values = values.filter(insight__kind=kind)
+    if account_id is not None:
+        values = values.filter(
+            Q(insight__account__account_id=account_id)
+            | Q(insight__media__account__account_id=account_id)
+        )
+    group_by = ["bucket"]
+    if key is None:
+        group_by.append("key")
+    else:
+        values = values.filter(key=key)
+
+    return list(
+        values.annotate(bucket=BUCKETS[bucket]("end_time"))
+        .values(*group_by)
+        .annotate(value=AGGREGATES[aggregate]("value"), count=Count("pk"))
+        .order_by(*group_by)
+    )
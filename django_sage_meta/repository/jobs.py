@@ -0,0 +1,232 @@
+import logging
+import os
+import socket
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connections, transaction
+from django.utils import timezone
+
+from django_sage_meta.helper.choice import SyncJobKindEnum, SyncJobStatusEnum
+from django_sage_meta.models import InstagramAccount, SyncJob
+from django_sage_meta.models.job import ACTIVE_JOB_STATUSES
+from django_sage_meta.repository.resolver import SyncResolver
+from django_sage_meta.repository.scheduler import count_rows
+from django_sage_meta.repository.service import SyncService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_TIMEOUT = timedelta(hours=1)
+DEFAULT_HEARTBEAT_INTERVAL = timedelta(minutes=1)
+
+JOB_HANDLERS = {
+    SyncJobKindEnum.categories: SyncService.sync_categories,
+    SyncJobKindEnum.users: SyncService.sync_user_data,
+    SyncJobKindEnum.accounts: SyncService.sync_instagram_accounts,
+    SyncJobKindEnum.pages: SyncService.sync_facebook_pages,
+    SyncJobKindEnum.media: SyncService.sync_media,
+    SyncJobKindEnum.insights: SyncService.sync_insights,
+    SyncJobKindEnum.stories: SyncService.sync_stories,
+}
+
+
+def default_worker_name():
+    """Return a name identifying the current worker process."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue_job(kind):
+    """Queue a sync job unless the same kind is already queued or running.
+
+    Args:
+        kind (str): A ``SyncJobKindEnum`` value.
+
+    Returns:
+        tuple: The queued or already active ``SyncJob`` and whether it was
+        created.
+
+    """
+    fail_stale_jobs()
+    job = SyncJob.objects.filter(kind=kind, status__in=ACTIVE_JOB_STATUSES).first()
+    if job is not None:
+        logger.debug(f"Sync job {job.pk} for {kind} is already {job.status}.")
+        return job, False
+    try:
+        with transaction.atomic():
+            job = SyncJob.objects.create(kind=kind)
+    except IntegrityError:
+        # Another request queued the same kind in the meantime.
+        job = SyncJob.objects.get(kind=kind, status__in=ACTIVE_JOB_STATUSES)
+        return job, False
+    logger.info(f"Queued sync job {job.pk} for {kind}.")
+    return job, True
+
+
+def claim_job(worker=None):
+    """Claim the oldest queued job for this worker.
+
+    The row is locked with ``SELECT ... FOR UPDATE SKIP LOCKED``, so
+    concurrent workers never claim the same job and never wait on each
+    other.
+
+    Args:
+        worker (str, optional): Name recorded on the job.
+
+    Returns:
+        SyncJob | None: The claimed job, or None if the queue is empty.
+
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        job = (
+            SyncJob.objects.select_for_update(skip_locked=True)
+            .filter(status=SyncJobStatusEnum.queued)
+            .order_by("created_at")
+            .first()
+        )
+        if job is None:
+            return None
+        job.status = SyncJobStatusEnum.running
+        job.worker = worker or default_worker_name()
+        job.started_at = job.heartbeat_at = now
+        job.save(update_fields=["status", "worker", "started_at", "heartbeat_at"])
+    logger.info(f"Worker {job.worker} claimed sync job {job.pk} ({job.kind}).")
+    return job
+
+
+def run_job(job):
+    """Run a claimed job and record its outcome.
+
+    Args:
+        job (SyncJob): A job returned by ``claim_job``.
+
+    Returns:
+        SyncJob: The finished job.
+
+    """
+    kwargs = {"resolver": SyncResolver()}
+    if job.kind == SyncJobKindEnum.media:
+        job.total = (
+            InstagramAccount.objects.filter(account_id=settings.INSTA_ID)
+            .values_list("media_counts", flat=True)
+            .first()
+        )
+        job.save(update_fields=["total"])
+        kwargs["on_progress"] = lambda processed: report_progress(job, processed)
+
+    try:
+        with JobHeartbeat(job):
+            result = JOB_HANDLERS[job.kind](**kwargs)
+    except Exception as e:
+        logger.error(f"Sync job {job.pk} ({job.kind}) failed: {e}")
+        job.status = SyncJobStatusEnum.failed
+        job.error = str(e)
+    else:
+        job.status = SyncJobStatusEnum.done
+        job.rows = count_rows(result)
+        if job.total is not None:
+            job.processed = job.total
+        logger.info(f"Sync job {job.pk} ({job.kind}) finished, {job.rows} rows.")
+    job.finished_at = timezone.now()
+    # A job failed as stale meanwhile may have been queued again already,
+    # so its failure is kept instead of being overwritten.
+    finished = SyncJob.objects.filter(
+        pk=job.pk, status=SyncJobStatusEnum.running
+    ).update(
+        status=job.status,
+        error=job.error,
+        rows=job.rows,
+        processed=job.processed,
+        finished_at=job.finished_at,
+    )
+    if not finished:
+        logger.warning(
+            f"Sync job {job.pk} ({job.kind}) was failed as stale while it ran."
+        )
+        job.refresh_from_db()
+    return job
+
+
+def report_progress(job, processed):
+    """Store the progress of a running job and refresh its heartbeat."""
+    job.processed = processed
+    SyncJob.objects.filter(pk=job.pk, status=SyncJobStatusEnum.running).update(
+        processed=processed, heartbeat_at=timezone.now()
+    )
+
+
+class JobHeartbeat:
+    """Refresh the heartbeat of a running job from a background thread.
+
+    Only the media handler reports progress, and only between pages, so
+    any other job would look stale to ``fail_stale_jobs`` once it ran
+    longer than the timeout. The heartbeat beats every ``interval`` while
+    the handler runs, whatever its kind.
+
+    Args:
+        job (SyncJob): The running job.
+        interval (timedelta, optional): Time between beats. Defaults to
+            the ``META_SYNC_JOB_HEARTBEAT`` setting.
+
+    """
+
+    def __init__(self, job, interval=None):
+        if interval is None:
+            interval = getattr(
+                settings, "META_SYNC_JOB_HEARTBEAT", DEFAULT_HEARTBEAT_INTERVAL
+            )
+        self.job = job
+        self.interval = interval.total_seconds()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        try:
+            while not self._stopped.wait(self.interval):
+                try:
+                    SyncJob.objects.filter(
+                        pk=self.job.pk, status=SyncJobStatusEnum.running
+                    ).update(heartbeat_at=timezone.now())
+                except Exception as e:
+                    logger.warning(f"Sync job {self.job.pk} heartbeat failed: {e}")
+        finally:
+            # The thread owns its database connections.
+            connections.close_all()
+
+
+def fail_stale_jobs(timeout=None):
+    """Fail running jobs whose worker stopped reporting.
+
+    A worker that crashed leaves its job running, which would block new
+    jobs of the same kind forever.
+
+    Args:
+        timeout (timedelta, optional): Silence after which a job is stale.
+            Defaults to the ``META_SYNC_JOB_TIMEOUT`` setting.
+
+    Returns:
+        int: The number of jobs marked as failed.
+
+    """
+    if timeout is None:
+        timeout = getattr(settings, "META_SYNC_JOB_TIMEOUT", DEFAULT_JOB_TIMEOUT)
+    now = timezone.now()
+    stale = SyncJob.objects.filter(
+        status=SyncJobStatusEnum.running, heartbeat_at__lt=now - timeout
+    ).update(
+        status=SyncJobStatusEnum.failed,
+        error="The worker stopped reporting progress.",
+        finished_at=now,
+    )
+    if stale:
+        logger.warning(f"Marked {stale} stale sync jobs as failed.")
+    return stale
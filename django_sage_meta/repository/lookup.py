@@ -0,0 +1,72 @@
+import logging
+
+from django.conf import settings
+
+from django_sage_meta.repository.upsert import UPSERT_KEYS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOOKUP_CHUNK_SIZE = 1000
+
+
+def chunked(ids, chunk_size=None):
+    chunk_size = chunk_size or getattr(
+        settings, "META_SYNC_LOOKUP_CHUNK_SIZE", DEFAULT_LOOKUP_CHUNK_SIZE
+    )
+    ids = list(dict.fromkeys(i for i in ids if i is not None))
+    for i in range(0, len(ids), chunk_size):
+        yield ids[i : i + chunk_size]
+
+
+def load_existing(model, ids, fields, chunk_size=None):
+    """Load the existing rows of an incoming batch, keyed by external ID.
+
+    Only rows whose external ID is in ``ids`` are read, in chunks, and only
+    the primary key, the external ID and ``fields`` are selected. Memory
+    therefore grows with the batch, not with the table.
+
+    The returned instances are built from those columns only; every other
+    column holds its default. They are meant for change detection and for
+    the upsert in ``bulk_upsert``, which only writes the listed update
+    fields of existing rows. They must not be passed to ``save()``.
+
+    Args:
+        model (Model): The model class to query.
+        ids (iterable): External IDs of the incoming batch.
+        fields (iterable): Attribute names needed for change detection.
+            Use ``<fk>_id`` for foreign keys.
+        chunk_size (int, optional): IDs per query. Defaults to the
+            ``META_SYNC_LOOKUP_CHUNK_SIZE`` setting.
+
+    Returns:
+        dict: Maps external IDs to partially loaded model instances.
+
+    """
+    key = UPSERT_KEYS[model]
+    columns = list(dict.fromkeys(["pk", key, *fields]))
+    rows = {}
+    for chunk in chunked(ids, chunk_size):
+        for row in model.objects.filter(**{f"{key}__in": chunk}).values(*columns):
+            rows[row[key]] = model(**row)
+
+    logger.debug(f"Loaded {len(rows)} existing {model.__name__} rows.")
+    return rows
+
+
+def resolve_pks(model, ids, chunk_size=None):
+    """Map external IDs to primary keys with chunked queries.
+
+    Args:
+        model (Model): The model class to query.
+        ids (iterable): External IDs to resolve.
+        chunk_size (int, optional): IDs per query.
+
+    Returns:
+        dict: Maps external IDs to primary keys. Unknown IDs are omitted.
+
+    """
+    key = UPSERT_KEYS[model]
+    pks = {}
+    for chunk in chunked(ids, chunk_size):
+        pks.update(model.objects.filter(**{f"{key}__in": chunk}).values_list(key, "pk"))
+    return pks
@@ -0,0 +1,88 @@
+import logging
+import threading
+from collections import defaultdict
+
+from django_sage_meta.repository.lookup import chunked, resolve_pks
+
+logger = logging.getLogger(__name__)
+
+
+class SyncResolver:
+    """Run-scoped identity map used to resolve foreign keys during a sync.
+
+    Referenced rows (accounts, users, categories, media) are preloaded in
+    bulk for the values of the current batch and then served from memory,
+    so the processing helpers issue no per-item queries. One resolver is
+    created per sync run and passed through every ``SyncService`` stage.
+    Stages that write a referenced model call ``invalidate`` afterwards.
+    The resolver is safe to share between stages running in parallel.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._rows = defaultdict(dict)
+        self._pks = defaultdict(dict)
+
+    def preload(self, model, field, values):
+        """Load the rows of ``model`` whose ``field`` is in ``values``.
+
+        Values that are already cached are not queried again.
+
+        """
+        with self._lock:
+            cache = self._rows[(model, field)]
+            missing = [value for value in set(values) if value not in cache]
+            for chunk in chunked(missing):
+                rows = {value: [] for value in chunk}
+                for obj in model.objects.filter(**{f"{field}__in": chunk}):
+                    rows.setdefault(getattr(obj, field), []).append(obj)
+                cache.update(rows)
+        if missing:
+            logger.debug(
+                f"Preloaded {len(missing)} {model.__name__} values by {field}."
+            )
+
+    def filter(self, model, field, value):
+        """Return every cached row of ``model`` whose ``field`` equals ``value``."""
+        with self._lock:
+            self.preload(model, field, [value])
+            return list(self._rows[(model, field)][value])
+
+    def get(self, model, field, value):
+        """Return the row of ``model`` matching ``value``, or None."""
+        rows = self.filter(model, field, value)
+        return rows[0] if rows else None
+
+    def require(self, model, field, value):
+        """Like ``get``, but raise ``model.DoesNotExist`` if nothing matches."""
+        obj = self.get(model, field, value)
+        if obj is None:
+            raise model.DoesNotExist(
+                f"{model.__name__} matching {field}={value!r} does not exist."
+            )
+        return obj
+
+    def pk_map(self, model, external_ids):
+        """Map external IDs of ``model`` to primary keys.
+
+        Only IDs that are not cached yet are queried. IDs without a row
+        are left out and looked up again on the next call, since they may
+        be written later in the run.
+
+        """
+        with self._lock:
+            cache = self._pks[model]
+            external_ids = set(external_ids)
+            cache.update(
+                resolve_pks(model, (i for i in external_ids if i not in cache))
+            )
+            return {i: cache[i] for i in external_ids if i in cache}
+
+    def invalidate(self, *models):
+        """Drop everything cached for ``models``."""
+        with self._lock:
+            for key in [key for key in self._rows if key[0] in models]:
+                del self._rows[key]
+            for model in models:
+                self._pks.pop(model, None)
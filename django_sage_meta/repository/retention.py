@@ -0,0 +1,191 @@
+import gzip
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Tuple
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from django_sage_meta.models import Comment, Insight, InsightValue, Story
+from django_sage_meta.repository.rollups import mark_stale_buckets
+
+logger = logging.getLogger(__name__)
+
+# Days a row is kept, per policy. ``None`` keeps rows forever. Stories
+# expire on Instagram after a day, so their copies only serve reports.
+DEFAULT_RETENTION_DAYS = {
+    "stories": 30,
+    "comments": 365,
+    "insight_values": 400,
+    "insights": 730,
+}
+DEFAULT_PRUNE_CHUNK_SIZE = 1000
+DEFAULT_ARCHIVE_DIR = "meta_archive"
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Which rows of a model age out, judged by one datetime field.
+
+    ``cascades`` lists the ``(name, model, foreign_key)`` of the rows the
+    database deletes along with a pruned row, so they are archived too.
+
+    """
+
+    name: str
+    model: type
+    date_field: str
+    cascades: Tuple[Tuple[str, type, str], ...] = ()
+
+
+# Values go before insights. Values still attached to a pruned insight,
+# such as lifetime values without an end time, are archived with it.
+POLICIES = (
+    RetentionPolicy("stories", Story, "published_at"),
+    RetentionPolicy("comments", Comment, "published_at"),
+    RetentionPolicy("insight_values", InsightValue, "end_time"),
+    RetentionPolicy(
+        "insights",
+        Insight,
+        "media__published_at",
+        cascades=(("insight_values", InsightValue, "insight"),),
+    ),
+)
+
+
+def get_retention(name):
+    """Return the retention window of a policy, or None to keep rows.
+
+    Windows are configured in days with the ``META_RETENTION_DAYS``
+    setting, e.g. ``{"comments": 180, "insights": None}``.
+
+    """
+    days = {
+        **DEFAULT_RETENTION_DAYS,
+        **getattr(settings, "META_RETENTION_DAYS", {}),
+    }.get(name)
+    return None if days is None else timedelta(days=days)
+
+
+def retention_cutoff(name):
+    """Return the date before which a policy prunes rows, or None.
+
+    Syncs skip rows older than it, so a full sync does not bring back the
+    rows the last prune removed.
+
+    """
+    retention = get_retention(name)
+    return None if retention is None else timezone.now() - retention
+
+
+def pruned_values(policy, pks):
+    """Return the ``InsightValue`` rows deleted with the rows ``pks``.
+
+    Returns:
+        list: Querysets of the values deleted directly or by cascade.
+
+    """
+    querysets = []
+    if policy.model is InsightValue:
+        querysets.append(InsightValue.objects.filter(pk__in=pks))
+    for _, related, foreign_key in policy.cascades:
+        if related is InsightValue:
+            querysets.append(related.objects.filter(**{f"{foreign_key}__in": pks}))
+    return querysets
+
+
+def archive_rows(path, rows):
+    """Append rows to a gzip compressed JSON lines file.
+
+    Every call writes a new gzip member, which ``gzip.open`` reads back as
+    one stream, so each pruned chunk is on disk before it is deleted.
+
+    Returns:
+        int: Number of rows written.
+
+    """
+    written = 0
+    with gzip.open(path, "at", encoding="utf-8") as archive:
+        for row in rows:
+            archive.write(json.dumps(row, cls=DjangoJSONEncoder) + "\n")
+            written += 1
+    return written
+
+
+def prune(policy, cutoff, chunk_size=None, archive_dir=None, dry_run=False):
+    """Delete the rows of ``policy`` older than ``cutoff`` in chunks.
+
+    Rows are walked in primary key order. Each chunk is archived and
+    deleted in its own short transaction, so no lock is held for the whole
+    run and an interrupted prune continues where it stopped. A chunk whose
+    archive cannot be written is not deleted. Rows without a date are kept.
+    Rows deleted by cascade are archived in the same transaction, to a
+    file of their own next to the policy's, e.g.
+    ``insights-insight_values-<stamp>.jsonl.gz``. The rollup buckets of
+    pruned insight values are flagged stale.
+
+    Args:
+        policy (RetentionPolicy): The rows to prune.
+        cutoff (datetime): Rows dated before it are pruned.
+        chunk_size (int, optional): Rows per chunk. Defaults to the
+            ``META_PRUNE_CHUNK_SIZE`` setting.
+        archive_dir (str, optional): Directory of the archive files. None
+            deletes without archiving.
+        dry_run (bool): Only count the rows that would be pruned.
+
+    Returns:
+        tuple: ``(rows, archive_path)``. ``archive_path`` is None when
+        nothing was archived.
+
+    """
+    chunk_size = chunk_size or getattr(
+        settings, "META_PRUNE_CHUNK_SIZE", DEFAULT_PRUNE_CHUNK_SIZE
+    )
+    model = policy.model
+    rows = model.objects.filter(**{f"{policy.date_field}__lt": cutoff}).order_by("pk")
+    if dry_run:
+        return rows.count(), None
+
+    path = None
+    cascade_paths = {}
+    if archive_dir is not None:
+        os.makedirs(archive_dir, exist_ok=True)
+        stamp = timezone.now().strftime("%Y%m%dT%H%M%S")
+        path = os.path.join(archive_dir, f"{policy.name}-{stamp}.jsonl.gz")
+        cascade_paths = {
+            name: os.path.join(archive_dir, f"{policy.name}-{name}-{stamp}.jsonl.gz")
+            for name, _, _ in policy.cascades
+        }
+
+    pruned = 0
+    last_pk = None
+    while True:
+        chunk = rows if last_pk is None else rows.filter(pk__gt=last_pk)
+        pks = list(chunk.values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            break
+        last_pk = pks[-1]
+        with transaction.atomic():
+            if path is not None:
+                archive_rows(path, model.objects.filter(pk__in=pks).values())
+                for name, related, foreign_key in policy.cascades:
+                    cascaded = list(
+                        related.objects.filter(**{f"{foreign_key}__in": pks})
+                        .order_by("pk")
+                        .values()
+                    )
+                    if cascaded:
+                        archive_rows(cascade_paths[name], cascaded)
+            for values in pruned_values(policy, pks):
+                mark_stale_buckets(values)
+            model.objects.filter(pk__in=pks).delete()
+        pruned += len(pks)
+        logger.debug(f"Pruned {pruned} {model.__name__} rows so far.")
+
+    logger.info(f"Pruned {pruned} {model.__name__} rows dated before {cutoff}.")
+    return pruned, path if pruned else None
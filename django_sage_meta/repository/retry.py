@@ -0,0 +1,105 @@
+import logging
+import random
+import time
+
+import facebook
+import requests
+from django.conf import settings
+
+from django_sage_meta.repository.throttle import RATE_LIMIT_CODES
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETRIES = 3
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 30.0
+
+# Graph error codes of temporary failures: an unknown server error, a
+# service outage and the rate limits.
+TRANSIENT_ERROR_CODES = {1, 2} | RATE_LIMIT_CODES
+
+
+def backoff_delay(attempt, base_delay=None, max_delay=None):
+    """Return the delay before retry number ``attempt``, with full jitter.
+
+    The upper bound doubles with every attempt, starting at
+    ``META_SYNC_RETRY_BASE_DELAY`` and capped at
+    ``META_SYNC_RETRY_MAX_DELAY``. Picking a random delay below the bound
+    keeps concurrent workers from retrying in lockstep.
+
+    """
+    if base_delay is None:
+        base_delay = getattr(settings, "META_SYNC_RETRY_BASE_DELAY", DEFAULT_BASE_DELAY)
+    if max_delay is None:
+        max_delay = getattr(settings, "META_SYNC_RETRY_MAX_DELAY", DEFAULT_MAX_DELAY)
+    return random.uniform(0, min(max_delay, base_delay * 2**attempt))
+
+
+def get_retries():
+    """Return how often a failing call is retried."""
+    return getattr(settings, "META_SYNC_RETRIES", DEFAULT_RETRIES)
+
+
+def is_transient(error):
+    """Return whether a failed call may succeed when it is made again.
+
+    Timeouts, dropped connections, HTTP 429 and 5xx responses, rate limits
+    and Graph errors flagged ``is_transient`` are temporary. Anything else,
+    such as an expired token, a missing permission or a bug, fails the same
+    way on every attempt.
+
+    """
+    if isinstance(error, (requests.Timeout, requests.ConnectionError)):
+        return True
+    if httpx is not None and isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, requests.HTTPError) or (
+        httpx is not None and isinstance(error, httpx.HTTPStatusError)
+    ):
+        status = getattr(error.response, "status_code", None)
+        return status is not None and (status == 429 or status >= 500)
+    if isinstance(error, facebook.GraphAPIError):
+        details = error.result.get("error") if isinstance(error.result, dict) else None
+        if isinstance(details, dict) and details.get("is_transient"):
+            return True
+        return error.code in TRANSIENT_ERROR_CODES
+    return False
+
+
+def retry_call(func, *args, retries=None, **kwargs):
+    """Call ``func`` and retry it with exponential backoff on transient errors.
+
+    Args:
+        func (callable): The call to make.
+        *args: Positional arguments for ``func``.
+        retries (int, optional): Retries after the first attempt. Defaults
+            to the ``META_SYNC_RETRIES`` setting.
+        **kwargs: Keyword arguments for ``func``.
+
+    Returns:
+        The return value of ``func``.
+
+    Raises:
+        Exception: The first error that is not transient, or the error of
+            the last attempt.
+
+    """
+    if retries is None:
+        retries = get_retries()
+    for attempt in range(retries + 1):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt == retries or not is_transient(e):
+                raise
+            delay = backoff_delay(attempt)
+            logger.warning(
+                f"{getattr(func, '__name__', func)} failed ({e}), "
+                f"retrying in {delay:.2f}s."
+            )
+            time.sleep(delay)
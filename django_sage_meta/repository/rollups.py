@@ -0,0 +1,259 @@
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, DateField, Max, Min, Sum
+from django.db.models.functions import Coalesce, TruncDate, TruncWeek
+from django.utils import timezone
+
+from django_sage_meta.helper.choice import RollupGranularityEnum, SyncResourceEnum
+from django_sage_meta.models import InsightRollup, InsightValue, SyncWatermark
+from django_sage_meta.repository.lookup import chunked
+from django_sage_meta.repository.upsert import UpsertStats, get_batch_size
+
+logger = logging.getLogger(__name__)
+
+# Rollups cover every account, so their watermark is not tied to one.
+ROLLUP_WATERMARK_ACCOUNT = "*"
+
+BUCKET_FUNCTIONS = {
+    RollupGranularityEnum.day: lambda field: TruncDate(field),
+    RollupGranularityEnum.week: lambda field: TruncWeek(
+        field, output_field=DateField()
+    ),
+}
+
+
+def bucket_start(day, granularity):
+    """Return the first day of the ``granularity`` bucket holding ``day``."""
+    if granularity == RollupGranularityEnum.week:
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def group_buckets(days):
+    """Group ``(metric, period, day)`` triples into buckets.
+
+    Returns:
+        dict: Maps ``(granularity, metric, period)`` to a set of bucket
+        start dates.
+
+    """
+    buckets = {}
+    for metric, period, day in days:
+        for granularity in RollupGranularityEnum.values:
+            buckets.setdefault((granularity, metric, period), set()).add(
+                bucket_start(day, granularity)
+            )
+    return buckets
+
+
+def value_days(values):
+    """Return the distinct ``(metric, period, day)`` of dated ``values``."""
+    return (
+        values.filter(end_time__isnull=False)
+        .annotate(day=TruncDate("end_time"))
+        .values_list("metric", "period", "day")
+        .distinct()
+    )
+
+
+def mark_stale_buckets(values):
+    """Flag the rollups of the buckets holding ``values`` as stale.
+
+    Call it before deleting ``values``: a deleted value leaves no row for
+    ``touched_buckets`` to find, so the next refresh would keep counting it.
+
+    Args:
+        values (QuerySet): ``InsightValue`` rows about to be deleted.
+
+    Returns:
+        int: Number of rollup rows flagged.
+
+    """
+    flagged = 0
+    for (granularity, metric, period), buckets in group_buckets(
+        value_days(values)
+    ).items():
+        for chunk in chunked(sorted(buckets)):
+            flagged += InsightRollup.objects.filter(
+                granularity=granularity,
+                metric=metric,
+                period=period,
+                bucket__in=chunk,
+                stale=False,
+            ).update(stale=True)
+    return flagged
+
+
+def touched_buckets(since=None):
+    """Return the buckets holding values written at or after ``since``.
+
+    Buckets whose rollups were flagged stale are included too.
+
+    Args:
+        since (datetime, optional): Only values updated since then. None
+            returns the buckets of every dated value.
+
+    Returns:
+        dict: Maps ``(granularity, metric, period)`` to a set of bucket
+        start dates.
+
+    """
+    values = InsightValue.objects.all()
+    if since is not None:
+        values = values.filter(updated_at__gte=since)
+    buckets = group_buckets(value_days(values))
+    stale = (
+        InsightRollup.objects.filter(stale=True)
+        .values_list("granularity", "metric", "period", "bucket")
+        .distinct()
+    )
+    for granularity, metric, period, bucket in stale:
+        buckets.setdefault((granularity, metric, period), set()).add(bucket)
+    return buckets
+
+
+def compute_rollups(granularity, metric, period, buckets):
+    """Aggregate the values of ``buckets`` with one grouped query.
+
+    Args:
+        granularity (str): A ``RollupGranularityEnum`` value.
+        metric (str): The metric name.
+        period (str): The metric period.
+        buckets (list): Sorted bucket start dates.
+
+    Returns:
+        list: Unsaved ``InsightRollup`` rows, one per bucket, key and
+        account or media.
+
+    """
+    wanted = set(buckets)
+    rows = (
+        InsightValue.objects.filter(metric=metric, period=period)
+        .annotate(
+            bucket=BUCKET_FUNCTIONS[granularity]("end_time"),
+            rollup_account=Coalesce("insight__account", "insight__media__account"),
+        )
+        .filter(bucket__gte=buckets[0], bucket__lte=buckets[-1])
+        .values("bucket", "key", "rollup_account", "insight__media")
+        .annotate(
+            total=Sum("value"),
+            samples=Count("pk"),
+            minimum=Min("value"),
+            maximum=Max("value"),
+        )
+        .order_by()
+    )
+    return [
+        InsightRollup(
+            granularity=granularity,
+            bucket=row["bucket"],
+            metric=metric,
+            period=period,
+            key=row["key"],
+            account_id=row["rollup_account"],
+            media_id=row["insight__media"],
+            total=row["total"],
+            samples=row["samples"],
+            minimum=row["minimum"],
+            maximum=row["maximum"],
+        )
+        for row in rows
+        if row["bucket"] in wanted
+    ]
+
+
+def refresh_insight_rollups(full=False, chunk_size=None):
+    """Recompute the daily and weekly rollups of recently written values.
+
+    Only the buckets holding values updated since the last refresh, or
+    flagged stale by a delete, are recomputed, so the cost follows the sync's changes instead of the
+    history. Each group of buckets is deleted and inserted again in one
+    transaction, so readers never see a half-written bucket.
+
+    Args:
+        full (bool): Recompute every bucket instead.
+        chunk_size (int, optional): Buckets per transaction. Defaults to the
+            ``META_SYNC_LOOKUP_CHUNK_SIZE`` setting.
+
+    Returns:
+        UpsertStats: ``created`` holds the number of rollup rows written.
+
+    """
+    started_at = timezone.now()
+    watermark, _ = SyncWatermark.objects.get_or_create(
+        account_id=ROLLUP_WATERMARK_ACCOUNT, resource=SyncResourceEnum.rollups
+    )
+    since = None if full else watermark.last_timestamp
+    written = 0
+    for (granularity, metric, period), buckets in touched_buckets(since).items():
+        for chunk in chunked(sorted(buckets), chunk_size):
+            rows = compute_rollups(granularity, metric, period, chunk)
+            with transaction.atomic():
+                InsightRollup.objects.filter(
+                    granularity=granularity,
+                    metric=metric,
+                    period=period,
+                    bucket__in=chunk,
+                ).delete()
+                InsightRollup.objects.bulk_create(
+                    rows, batch_size=get_batch_size(InsightRollup)
+                )
+            written += len(rows)
+
+    watermark.last_timestamp = started_at
+    watermark.save(update_fields=["last_timestamp", "updated_at"])
+    logger.info(f"Refreshed insight rollups since {since}, {written} rows.")
+    return UpsertStats(created=written)
+
+
+def rollup_series(
+    metric,
+    granularity=RollupGranularityEnum.day,
+    start=None,
+    end=None,
+    period="day",
+    account_id=None,
+    media_id=None,
+    key="",
+):
+    """Read a metric's rollups per bucket, summed over the selected rows.
+
+    Args:
+        metric (str): The metric name.
+        granularity (str): ``day`` or ``week``.
+        start (date, optional): First bucket to include.
+        end (date, optional): Include buckets before it.
+        period (str): The metric period.
+        account_id (str, optional): Only this Instagram account, its media
+            included.
+        media_id (str, optional): Only this media item.
+        key (str): Breakdown key.
+
+    Returns:
+        list: Dicts with ``bucket``, ``total``, ``samples``, ``minimum`` and
+        ``maximum``, ordered by bucket.
+
+    """
+    rollups = InsightRollup.objects.filter(
+        granularity=granularity, metric=metric, period=period, key=key
+    )
+    if start is not None:
+        rollups = rollups.filter(bucket__gte=start)
+    if end is not None:
+        rollups = rollups.filter(bucket__lt=end)
+    if account_id is not None:
+        rollups = rollups.filter(account__account_id=account_id)
+    if media_id is not None:
+        rollups = rollups.filter(media__media_id=media_id)
+    return list(
+        rollups.values("bucket")
+        .annotate(
+            total=Sum("total"),
+            samples=Sum("samples"),
+            minimum=Min("minimum"),
+            maximum=Max("maximum"),
+        )
+        .order_by("bucket")
+    )
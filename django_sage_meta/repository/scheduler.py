@@ -0,0 +1,178 @@
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Tuple
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stage:
+    """A named unit of sync work and the stages it depends on."""
+
+    name: str
+    func: Callable
+    depends_on: Tuple[str, ...] = ()
+
+
+@dataclass
+class StageReport:
+    """Outcome of a single stage run.
+
+    Attributes:
+        name (str): The stage name.
+        status (str): ``done``, ``failed`` or ``blocked`` when a dependency
+            failed.
+        duration (float): Wall-clock seconds spent in the stage.
+        rows (int): Rows created, updated or found unchanged.
+        error (Exception): The raised exception for failed stages.
+
+    """
+
+    name: str
+    status: str
+    duration: float = 0.0
+    rows: int = 0
+    error: Optional[Exception] = field(default=None, repr=False)
+
+
+def count_rows(result):
+    """Count the rows of an ``UpsertResult`` or an iterable of them."""
+    if result is None:
+        return 0
+    if hasattr(result, "created"):
+        return result.created + result.updated + result.unchanged
+    return sum(count_rows(item) for item in result)
+
+
+class StageScheduler:
+    """Run stages concurrently while respecting their declared dependencies.
+
+    A stage starts as soon as all of its selected dependencies are done, up
+    to ``max_parallel`` stages at a time. Dependencies that were not
+    selected count as satisfied. When a stage fails, the stages depending
+    on it are reported as blocked and independent stages keep running.
+
+    """
+
+    def __init__(self, stages, max_parallel=1):
+        self.stages = {stage.name: stage for stage in stages}
+        self.max_parallel = max(1, max_parallel)
+        for stage in stages:
+            unknown = set(stage.depends_on) - set(self.stages)
+            if unknown:
+                raise ValueError(
+                    f"Stage {stage.name!r} depends on unknown stages: {sorted(unknown)}"
+                )
+
+    def select(self, only=None, skip=None):
+        """Return the stage names to run, in declaration order.
+
+        Raises:
+            ValueError: If ``only`` or ``skip`` name an unknown stage.
+
+        """
+        unknown = (set(only or ()) | set(skip or ())) - set(self.stages)
+        if unknown:
+            raise ValueError(f"Unknown stages: {sorted(unknown)}")
+        return [
+            name
+            for name in self.stages
+            if (not only or name in only) and name not in (skip or ())
+        ]
+
+    def run(self, only=None, skip=None, on_start=None, on_finish=None):
+        """Run the selected stages and return one report per stage.
+
+        Args:
+            only (iterable, optional): Run only these stages.
+            skip (iterable, optional): Do not run these stages.
+            on_start (callable, optional): Called with the stage name when
+                a stage starts.
+            on_finish (callable, optional): Called with the ``StageReport``
+                of every finished or blocked stage.
+
+        Returns:
+            list: ``StageReport`` objects in declaration order.
+
+        """
+        selected = self.select(only, skip)
+        pending = {
+            name: {dep for dep in self.stages[name].depends_on if dep in selected}
+            for name in selected
+        }
+        reports = {}
+        running = {}
+
+        def finish(report):
+            reports[report.name] = report
+            if on_finish:
+                on_finish(report)
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+            while pending or running:
+                blocked, ready = self._triage(
+                    pending, reports, self.max_parallel - len(running)
+                )
+                for name in blocked:
+                    del pending[name]
+                    finish(StageReport(name=name, status="blocked"))
+                for name in ready:
+                    del pending[name]
+                    if on_start:
+                        on_start(name)
+                    running[executor.submit(self._run_stage, name)] = name
+
+                if not running:
+                    # Stages blocked in this pass may block their own
+                    # dependents in the next one.
+                    if pending and not blocked:
+                        raise ValueError(
+                            f"Circular stage dependencies: {sorted(pending)}"
+                        )
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del running[future]
+                    finish(future.result())
+
+        return [reports[name] for name in selected]
+
+    @staticmethod
+    def _triage(pending, reports, slots):
+        """Split the pending stages into blocked ones and ones ready to start.
+
+        Args:
+            pending (dict): Maps pending stage names to their dependencies.
+            reports (dict): Reports of the finished stages.
+            slots (int): Stages that may start now.
+
+        Returns:
+            tuple: The stages with a failed or blocked dependency, and up to
+            ``slots`` stages whose dependencies are all done.
+
+        """
+        blocked, ready = [], []
+        for name, deps in pending.items():
+            if any(dep in reports and reports[dep].status != "done" for dep in deps):
+                blocked.append(name)
+            elif len(ready) < slots and all(dep in reports for dep in deps):
+                ready.append(name)
+        return blocked, ready
+
+    def _run_stage(self, name):
+        started = time.monotonic()
+        try:
+            result = self.stages[name].func()
+            report = StageReport(name=name, status="done", rows=count_rows(result))
+        except Exception as e:
+            logger.error(f"Stage {name} failed: {e}")
+            report = StageReport(name=name, status="failed", error=e)
+        finally:
+            # Each worker thread owns its database connections.
+            connections.close_all()
+        report.duration = time.monotonic() - started
+        return report
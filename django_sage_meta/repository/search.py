@@ -0,0 +1,81 @@
+import logging
+from functools import reduce
+from operator import and_, or_
+
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from django_sage_meta.models import Comment, Media
+
+logger = logging.getLogger(__name__)
+
+# Text columns covered by the full-text index, per model. Migration
+# 0006_search_index spells them out, so changing them needs a new migration.
+SEARCH_FIELDS = {
+    Media: ("caption",),
+    Comment: ("text", "username"),
+}
+# Captions and comments mix languages, so words are lowercased but never
+# stemmed.
+SEARCH_CONFIG = "simple"
+# The generated column and FTS5 tables queried here are created by
+# migration 0006_search_index.
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+
+def search_filter(model, query, using="default"):
+    """Return a filter matching the rows whose indexed text has every word.
+
+    Args:
+        model (Model): ``Media`` or ``Comment``.
+        query (str): Words to search for, e.g. ``summer sale``.
+        using (str): The database alias the filter is used on.
+
+    Returns:
+        Q: The filter, matching everything for an empty query.
+
+    """
+    words = query.split()
+    if not words:
+        return Q()
+
+    connection = connections[using]
+    quote_name = connection.ops.quote_name
+    table = model._meta.db_table
+    pk = quote_name(model._meta.pk.column)
+    if connection.vendor == "postgresql":
+        sql = (
+            f"SELECT {pk} FROM {quote_name(table)} "
+            f"WHERE {quote_name(SEARCH_VECTOR_COLUMN)} @@ "
+            f"plainto_tsquery('{SEARCH_CONFIG}'::regconfig, %s)"
+        )
+        return Q(pk__in=RawSQL(sql, [query]))
+    if connection.vendor == "sqlite":
+        fts = quote_name(f"{table}_fts")
+        # Quoting every word keeps FTS5 operators in the input literal.
+        match = " ".join('"{}"'.format(word.replace('"', '""')) for word in words)
+        sql = f"SELECT rowid FROM {fts} WHERE {fts} MATCH %s"
+        return Q(pk__in=RawSQL(sql, [match]))
+
+    return reduce(
+        and_,
+        (
+            reduce(
+                or_,
+                (Q(**{f"{field}__icontains": word}) for field in SEARCH_FIELDS[model]),
+            )
+            for word in words
+        ),
+    )
+
+
+def full_text_search(queryset, query):
+    """Narrow a ``Media`` or ``Comment`` queryset to the rows matching ``query``.
+
+    For example, the comments of one media item mentioning a refund::
+
+        full_text_search(Comment.objects.filter(media=media), "refund")
+
+    """
+    return queryset.filter(search_filter(queryset.model, query, queryset.db))
@@ -1,4 +1,8 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
 from django.conf import settings
 from django_sage_meta.models import (
     UserData,
@@ -9,316 +13,777 @@ from django_sage_meta.models import (
     Media,
     Comment,
     Story,
+    SyncWatermark,
+)
+from django_sage_meta.helper.choice import (
+    ContentFileEnum,
+    InsightKindEnum,
+    SyncJobKindEnum,
+    SyncResourceEnum,
 )
-from django_sage_meta.helper.choice import ContentFileEnum, InsightKindEnum
+from django_sage_meta.helper.timestamp import parse_graph_timestamp
 from django.db import transaction
-from sage_meta.service import FacebookClient
+from django_sage_meta.repository.batch import GraphBatch
+from django_sage_meta.repository.checkpoint import (
+    checkpoint_marks,
+    complete_stage,
+    load_checkpoint,
+    record_dead_letter,
+    save_checkpoint,
+)
+from django_sage_meta.repository.client import client_provider
+from django_sage_meta.repository.fingerprint import ChangeSet
+from django_sage_meta.repository.graph import (
+    COMMENT_FIELDS,
+    COUNTER_FIELDS,
+    INSIGHT_FIELDS,
+    MEDIA_INSIGHT_METRICS,
+    fetch_account_insights,
+    fetch_comments,
+    fetch_media_insights,
+    fetch_stories,
+    iter_media_pages,
+    parse_comment,
+    parse_insight,
+)
+from django_sage_meta.repository.insight_values import write_insight_values
+from django_sage_meta.repository.lookup import chunked, load_existing
+from django_sage_meta.repository.resolver import SyncResolver
+from django_sage_meta.repository.retention import retention_cutoff
+from django_sage_meta.repository.retry import (
+    backoff_delay,
+    get_retries,
+    is_transient,
+    retry_call,
+)
+from django_sage_meta.repository.throttle import graph_throttle
+from django_sage_meta.repository.upsert import UpsertResult, UpsertStats, bulk_upsert
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_CHUNK_SIZE = 50
+DEFAULT_LOOKBACK = timedelta(days=3)
+
+# Columns loaded for change detection. They are compared with the incoming
+# payload, and ``fingerprint`` is rewritten when it is stale.
+INSTAGRAM_ACCOUNT_DIFF_FIELDS = [
+    "username",
+    "follows_counts",
+    "followers_counts",
+    "media_counts",
+    "profile_picture_url",
+    "website",
+    "biography",
+    "fingerprint",
+]
+FACEBOOK_PAGE_DIFF_FIELDS = [
+    "name",
+    "access_token",
+    "tasks",
+    "instagram_business_account_id",
+    "user_id",
+    "fingerprint",
+]
+INSIGHT_DIFF_FIELDS = [
+    "name",
+    "period",
+    "values",
+    "title",
+    "description",
+    "kind",
+    "account_id",
+    "media_id",
+    "fingerprint",
+]
+MEDIA_DIFF_FIELDS = [
+    "username",
+    "caption",
+    "kind",
+    "media_url",
+    "timestamp",
+    "published_at",
+    "like_counts",
+    "comments_counts",
+    "account_id",
+    "fingerprint",
+]
+COMMENT_DIFF_FIELDS = [
+    "text",
+    "username",
+    "like_counts",
+    "timestamp",
+    "published_at",
+    "media_id",
+    "fingerprint",
+]
+STORY_DIFF_FIELDS = [
+    "media_type",
+    "media_url",
+    "timestamp",
+    "published_at",
+    "account_id",
+    "fingerprint",
+]
+
 
 class SyncService:
     """Service class to handle synchronization of data from Facebook and
     Instagram to the local database."""
 
     @staticmethod
-    def sync_instagram_accounts():
+    def sync_instagram_accounts(resolver=None):
         logger.info("Starting sync of Instagram accounts...")
-        client = FacebookClient(settings.FACEBOOK_ACCESS_TOKEN)
-        accounts = client.account_handler.get_accounts()
+        accounts = client_provider.get_accounts()
         logger.debug(f"Fetched {len(accounts)} Instagram accounts from Facebook.")
 
-        insta_objs, objs = SyncService._process_instagram_accounts(accounts)
-        logger.debug(f"Processed {len(insta_objs)} Instagram accounts for sync.")
+        insta_changes = SyncService._process_instagram_accounts(accounts)
+        logger.debug(f"Processed {len(insta_changes)} Instagram accounts for sync.")
 
-        SyncService._bulk_sync(
-            insta_objs,
-            InstagramAccount,
-            [
-                "username",
-                "follows_counts",
-                "followers_counts",
-                "media_counts",
-                "profile_picture_url",
-                "website",
-                "biography",
-            ],
-        )
+        result = SyncService._bulk_sync_changes(insta_changes)
+        if resolver is not None:
+            resolver.invalidate(InstagramAccount)
         logger.info("Instagram accounts sync completed.")
+        return result
 
     @staticmethod
-    def sync_facebook_pages():
+    def sync_facebook_pages(resolver=None):
         logger.info("Starting sync of Facebook pages...")
-        client = FacebookClient(settings.FACEBOOK_ACCESS_TOKEN)
-        pages = client.account_handler.get_accounts()
-        user_info = client.user_info
+        resolver = resolver or SyncResolver()
+        pages = client_provider.get_accounts()
+        user_info = client_provider.get_user_info()
         logger.debug(f"Fetched {len(pages)} Facebook pages.")
 
-        page_objs, page_to_categories = SyncService._process_facebook_pages(
-            pages, user_info
+        page_changes, page_to_categories = SyncService._process_facebook_pages(
+            pages, user_info, resolver
         )
-        logger.debug(f"Processed {len(page_objs)} Facebook pages for sync.")
+        logger.debug(f"Processed {len(page_changes)} Facebook pages for sync.")
 
-        SyncService._bulk_sync(
-            page_objs,
-            FacebookPageData,
-            [
-                "name",
-                "access_token",
-                "tasks",
-                "instagram_business_account",
-            ],
-        )
+        result = SyncService._bulk_sync_changes(page_changes)
         for page, category in page_to_categories:
             if page.pk:
                 page.categories.set(category)
                 logger.debug(f"Set categories for page {page.page_id}.")
 
         logger.info("Facebook pages sync completed.")
+        return result
 
     @staticmethod
-    def sync_insights(kind=0, insights_object=None, media_id=None):
+    def sync_insights(
+        kind=0,
+        insights_object=None,
+        media_id=None,
+        resolver=None,
+        insta_id=None,
+        access_token=None,
+    ):
         logger.info(f"Starting sync of Instagram insights, kind={kind}...")
-        client = FacebookClient(settings.FACEBOOK_ACCESS_TOKEN)
-        media_obj = None
+        resolver = resolver or SyncResolver()
+        insta_id = insta_id or settings.INSTA_ID
         if kind == 0:
-            insights = client.media_handler.get_instagram_insights(settings.INSTA_ID)
+            client = client_provider.get_client(access_token)
+            insights = fetch_account_insights(client, insta_id)
+            insight_pairs = [(None, insight) for insight in insights]
         else:
-            insights = insights_object
-            media_obj = media_id
+            insight_pairs = [(media_id, insight) for insight in insights_object]
 
         logger.debug(f"Fetched insights for kind={kind} with media_id={media_id}.")
 
-        insight_objs = SyncService._process_insights(insights, kind, media_obj)
-        logger.debug(f"Processed {len(insight_objs)} insights for sync.")
+        result = SyncService._ingest_insights(insight_pairs, resolver, kind, insta_id)
+        logger.info("Instagram insights sync completed.")
+        return result
 
-        SyncService._bulk_sync(
-            insight_objs, Insight, ["name", "period", "values", "title", "description"]
+    @staticmethod
+    def _ingest_insights(insight_pairs, resolver, kind=0, insta_id=None):
+        """Diff and upsert a batch of insights in a single pass.
+
+        The numeric data points of new and changed insights are written to
+        ``InsightValue`` alongside the ``values`` blob.
+
+        Args:
+            insight_pairs (list): ``(media_id, insight)`` pairs. ``media_id``
+                is None for account insights.
+            resolver (SyncResolver): The run's foreign key resolver.
+            kind (int): 0 for account insights, 1 for media insights.
+            insta_id (str, optional): The account of account insights.
+                Defaults to the ``INSTA_ID`` setting.
+
+        Returns:
+            UpsertResult: The row counts of the bulk write.
+
+        """
+        insight_changes = SyncService._process_insights(
+            insight_pairs, resolver, kind, insta_id
         )
-        logger.info("Instagram insights sync completed.")
+        logger.debug(f"Processed {len(insight_changes)} insights for sync.")
+
+        result = SyncService._bulk_sync_changes(insight_changes)
+        write_insight_values(insight_changes.objects())
+        return result
 
     @staticmethod
-    def sync_user_data():
+    def sync_user_data(resolver=None):
         logger.info("Starting sync of user data...")
-        client = FacebookClient(settings.FACEBOOK_ACCESS_TOKEN)
-        client.account_handler.get_accounts()
-        user_info = client.user_info
+        user_info = client_provider.get_user_info()
         logger.debug(f"Fetched user data: {user_info.name} (ID: {user_info.id}).")
 
-        UserData.objects.update_or_create(
+        _, created = UserData.objects.update_or_create(
             user_id=user_info.id,
             defaults={"name": user_info.name, "email": user_info.email},
         )
+        if resolver is not None:
+            resolver.invalidate(UserData)
         logger.info("User data sync completed.")
+        return UpsertResult(
+            model=UserData.__name__,
+            batches=[UpsertStats(created=int(created), updated=int(not created))],
+        )
 
     @staticmethod
-    def sync_categories():
+    def sync_categories(resolver=None):
         logger.info("Starting sync of categories...")
-        client = FacebookClient(settings.FACEBOOK_ACCESS_TOKEN)
-        accounts = client.account_handler.get_accounts()
+        accounts = client_provider.get_accounts()
         logger.debug("Fetched accounts for category sync.")
 
         category_objs = SyncService._process_categories(accounts)
         logger.debug(f"Processed {len(category_objs)} categories for sync.")
 
-        SyncService._bulk_sync(category_objs, Category, ["name"])
+        result = SyncService._bulk_sync(category_objs, Category, ["name"])
+        if resolver is not None:
+            resolver.invalidate(Category)
         logger.info("Categories sync completed.")
+        return result
 
     @staticmethod
-    def sync_media():
-        logger.info("Starting sync of media...")
-        client = FacebookClient(settings.FACEBOOK_ACCESS_TOKEN)
-        media_list = client.media_handler.get_instagram_media(settings.INSTA_ID)
-        logger.debug(f"Fetched {len(media_list)} media items from Instagram.")
+    def sync_media(
+        max_workers=None,
+        incremental=False,
+        lookback=None,
+        chunk_size=None,
+        resolver=None,
+        on_progress=None,
+        insta_id=None,
+        access_token=None,
+        resume=False,
+    ):
+        """Synchronize media, their comments and insights page by page.
+
+        Each Graph page of media is diffed, its comments and insights are
+        fetched, and the chunk is flushed before the next page is requested.
+        Memory stays bounded by the chunk size. After every chunk a
+        checkpoint with the next page cursor is saved, so a failed run can
+        be resumed instead of redone.
+
+        Args:
+            max_workers (int, optional): Pool size for per-media fetches.
+            incremental (bool): Only sync items newer than the watermark.
+            lookback (timedelta, optional): Look-back window for
+                incremental syncs.
+            chunk_size (int, optional): Media items per page. Defaults to
+                the ``META_SYNC_CHUNK_SIZE`` setting.
+            resolver (SyncResolver, optional): The run's foreign key
+                resolver. A new one is created when omitted.
+            on_progress (callable, optional): Called with the number of
+                media items processed so far after each chunk is written.
+            insta_id (str, optional): The Instagram account to sync.
+                Defaults to the ``INSTA_ID`` setting.
+            access_token (str, optional): The token used for the account,
+                typically its page token.
+            resume (bool): Continue from the checkpoint of an unfinished
+                run, if there is one.
+
+        Returns:
+            list: The ``UpsertResult`` of every chunk write.
+
+        """
+        logger.info(f"Starting sync of media, incremental={incremental}...")
+        resolver = resolver or SyncResolver()
+        insta_id = insta_id or settings.INSTA_ID
+        client = client_provider.get_client(access_token)
+        if chunk_size is None:
+            chunk_size = getattr(settings, "META_SYNC_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
 
-        media_objs, all_comment_objs, media_to_comments = SyncService._process_media(
-            media_list, client
+        media_since = comments_since = None
+        if incremental:
+            media_since = SyncService._incremental_since(
+                SyncResourceEnum.media, lookback, insta_id
+            )
+            comments_since = SyncService._incremental_since(
+                SyncResourceEnum.comments, lookback, insta_id
+            )
+
+        checkpoint = (
+            load_checkpoint(SyncJobKindEnum.media, insta_id) if resume else None
         )
-        logger.debug(
-            f"Processed {len(media_objs)} media items and {len(all_comment_objs)} comments for sync."
+        marks = checkpoint_marks(checkpoint)
+        media_marks = [marks.get(SyncResourceEnum.media)]
+        comment_marks = [marks.get(SyncResourceEnum.comments)]
+        results = []
+        fetched = 0
+        pages = iter_media_pages(client, insta_id, chunk_size)
+        if checkpoint is not None:
+            logger.info(
+                f"Resuming media sync of {insta_id} after {checkpoint.processed} items."
+            )
+            fetched = checkpoint.processed
+            # A checkpoint without a cursor was saved after the last page.
+            pages = (
+                iter_media_pages(client, insta_id, chunk_size, checkpoint.cursor)
+                if checkpoint.cursor
+                else ()
+            )
+
+        for media_page, next_cursor in pages:
+            fetched += len(media_page)
+            media_marks.append(SyncService._newest_timestamp(media_page))
+            changed_media = SyncService._filter_since(media_page, media_since)
+            comments, chunk_results = SyncService._sync_media_chunk(
+                changed_media, client, resolver, max_workers, comments_since, insta_id
+            )
+            results.extend(chunk_results)
+            comment_marks.append(SyncService._newest_timestamp(comments))
+            reached_watermark = len(changed_media) < len(media_page)
+            save_checkpoint(
+                SyncJobKindEnum.media,
+                insta_id,
+                None if reached_watermark else next_cursor,
+                fetched,
+                {
+                    SyncResourceEnum.media: SyncService._newest(media_marks),
+                    SyncResourceEnum.comments: SyncService._newest(comment_marks),
+                },
+            )
+            if on_progress is not None:
+                on_progress(fetched)
+            if reached_watermark:
+                logger.debug("Reached media older than the watermark, stopping.")
+                break
+
+        SyncService._advance_watermark(
+            SyncResourceEnum.media, *media_marks, insta_id=insta_id
+        )
+        SyncService._advance_watermark(
+            SyncResourceEnum.comments, *comment_marks, insta_id=insta_id
         )
+        complete_stage(SyncJobKindEnum.media, insta_id)
+        logger.info(f"Media sync completed, {fetched} media items fetched.")
+        return results
 
-        SyncService._bulk_sync(
-            media_objs,
-            Media,
-            [
-                "username",
-                "caption",
-                "kind",
-                "media_url",
-                "timestamp",
-                "like_counts",
-                "comments_counts",
-            ],
+    @staticmethod
+    def _sync_media_chunk(
+        media_list,
+        client,
+        resolver,
+        max_workers=None,
+        comments_since=None,
+        insta_id=None,
+    ):
+        """Fetch, diff and flush one chunk of media with its comments.
+
+        Returns:
+            tuple: Every comment seen in the chunk, changed or not, and the
+            ``UpsertResult`` of each write.
+
+        """
+        media_children = SyncService._fetch_media_children(
+            media_list, client, max_workers, insta_id
         )
-        SyncService._bulk_sync(
-            all_comment_objs, Comment, ["text", "username", "like_counts", "timestamp"]
+        return SyncService._write_media_chunk(
+            media_list, media_children, resolver, comments_since
         )
 
-        for media_id, comment_id in media_to_comments:
-            media_obj = Media.objects.get(media_id=media_id)
-            comment_obj = Comment.objects.get(comment_id=comment_id)
-            comment_obj.media = media_obj
-            comment_obj.save()
-            logger.debug(f"Linked comment {comment_id} to media {media_id}.")
+    @staticmethod
+    def _write_media_chunk(media_list, media_children, resolver, comments_since=None):
+        """Diff and flush one chunk of media whose children are fetched.
+
+        Media rows are written first so that comments and insights can be
+        linked to their primary keys in memory before they are written.
+
+        Args:
+            media_list (list): Media items of the chunk.
+            media_children (dict): Maps media IDs to ``(comments, insights)``.
+            resolver (SyncResolver): The run's foreign key resolver.
+            comments_since (datetime, optional): Skip older comments.
 
-        logger.info("Media sync completed.")
+        Returns:
+            tuple: Every comment seen in the chunk, changed or not, and the
+            ``UpsertResult`` of each write.
+
+        """
+        media_changes, media_comments, media_insights = SyncService._process_media(
+            media_list, media_children, resolver, comments_since
+        )
+        media_result = SyncService._bulk_sync_changes(media_changes)
+
+        comment_changes = SyncService._process_comments(media_comments, resolver)
+        logger.debug(
+            f"Processed {len(media_changes)} media items, {len(comment_changes)} comments "
+            f"and {len(media_insights)} insights for sync."
+        )
+        comment_result = SyncService._bulk_sync_changes(comment_changes)
+        insight_result = SyncService._ingest_insights(media_insights, resolver, 1)
+        return (
+            [comment for _, comment in media_comments],
+            [media_result, comment_result, insight_result],
+        )
+
+    @staticmethod
+    def refresh_media_counters(
+        lookback=None, chunk_size=None, insta_id=None, access_token=None
+    ):
+        """Refresh the like and comment counts of recently published media.
+
+        Only ``id,like_count,comments_count`` is requested per media item,
+        newest first, until every stored media item published since the
+        media watermark minus the look-back window was seen. Captions,
+        URLs, comments and insights are left alone.
+
+        Args:
+            lookback (timedelta, optional): Look-back window. Defaults to the
+                ``META_SYNC_LOOKBACK`` setting.
+            chunk_size (int, optional): Media items requested per page.
+                Defaults to the ``META_SYNC_CHUNK_SIZE`` setting.
+            insta_id (str, optional): The Instagram account. Defaults to the
+                ``INSTA_ID`` setting.
+            access_token (str, optional): The token used for the account.
+
+        Returns:
+            UpsertResult: The row counts of the counter updates.
+
+        """
+        insta_id = insta_id or settings.INSTA_ID
+        logger.info(f"Starting counters refresh of {insta_id} media...")
+        since = SyncService._incremental_since(
+            SyncResourceEnum.media, lookback, insta_id
+        )
+        if since is None:
+            logger.info("No media synced yet, nothing to refresh.")
+            return UpsertResult(model=Media.__name__)
+
+        rows = Media.objects.filter(
+            account__account_id=insta_id, published_at__gte=since
+        ).values("pk", "media_id", *MEDIA_DIFF_FIELDS)
+        stored = {row["media_id"]: Media(**row) for row in rows}
+        if chunk_size is None:
+            chunk_size = getattr(settings, "META_SYNC_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+        client = client_provider.get_client(access_token)
+
+        changes = ChangeSet(Media)
+        pending = set(stored)
+        for media_page, _ in iter_media_pages(
+            client, insta_id, chunk_size, fields=COUNTER_FIELDS
+        ):
+            for counters in media_page:
+                existing = stored.get(counters.id)
+                if existing is None:
+                    continue
+                pending.discard(counters.id)
+                values = {
+                    "media_id": existing.media_id,
+                    **{
+                        name: getattr(existing, name)
+                        for name in MEDIA_DIFF_FIELDS
+                        if name != "fingerprint"
+                    },
+                    "like_counts": counters.like_count,
+                    "comments_counts": counters.comments_count,
+                }
+                changes.add(existing, values)
+            if not pending:
+                break
+
+        logger.info(
+            f"Counters refresh completed, {len(changes)} of {len(stored)} media changed."
+        )
+        return SyncService._bulk_sync_changes(changes)
 
     @staticmethod
-    def sync_stories():
-        logger.info("Starting sync of Instagram stories...")
-        client = FacebookClient(settings.FACEBOOK_ACCESS_TOKEN)
-        stories = client.story_handler.get_instagram_stories(settings.INSTA_ID)
+    def sync_stories(
+        incremental=False,
+        lookback=None,
+        resolver=None,
+        insta_id=None,
+        access_token=None,
+    ):
+        logger.info(f"Starting sync of Instagram stories, incremental={incremental}...")
+        resolver = resolver or SyncResolver()
+        insta_id = insta_id or settings.INSTA_ID
+        client = client_provider.get_client(access_token)
+        stories = fetch_stories(client, insta_id)
         logger.debug(f"Fetched {len(stories)} stories from Instagram.")
 
-        story_objs = SyncService._process_stories(stories)
-        logger.debug(f"Processed {len(story_objs)} stories for sync.")
+        changed_stories = stories
+        if incremental:
+            changed_stories = SyncService._filter_since(
+                stories,
+                SyncService._incremental_since(
+                    SyncResourceEnum.stories, lookback, insta_id
+                ),
+            )
+            logger.debug(f"Incremental sync limited to {len(changed_stories)} stories.")
+
+        story_changes = SyncService._process_stories(changed_stories, resolver)
+        logger.debug(f"Processed {len(story_changes)} stories for sync.")
 
-        SyncService._bulk_sync(story_objs, Story)
+        result = SyncService._bulk_sync_changes(story_changes)
+        SyncService._advance_watermark(
+            SyncResourceEnum.stories,
+            SyncService._newest_timestamp(stories),
+            insta_id=insta_id,
+        )
         logger.info("Instagram stories sync completed.")
+        return result
+
+    @staticmethod
+    def _incremental_since(resource, lookback=None, insta_id=None):
+        """Return the lower timestamp bound for an incremental fetch.
+
+        The bound is the stored watermark minus a look-back window, so
+        recently published items whose counters are still moving are
+        refreshed as well.
+
+        Args:
+            resource (str): A ``SyncResourceEnum`` value.
+            lookback (timedelta, optional): Look-back window. Defaults to the
+                ``META_SYNC_LOOKBACK`` setting.
+            insta_id (str, optional): The Instagram account. Defaults to the
+                ``INSTA_ID`` setting.
+
+        Returns:
+            datetime | None: The bound, or None if nothing was synced yet.
+
+        """
+        watermark = SyncWatermark.objects.filter(
+            account_id=insta_id or settings.INSTA_ID, resource=resource
+        ).first()
+        if watermark is None or watermark.last_timestamp is None:
+            return None
+        if lookback is None:
+            lookback = getattr(settings, "META_SYNC_LOOKBACK", DEFAULT_LOOKBACK)
+        return watermark.last_timestamp - lookback
+
+    @staticmethod
+    def _filter_since(items, since):
+        """Keep the items published at or after ``since``.
+
+        Items without a parsable timestamp are kept so they are never
+        skipped silently.
+
+        """
+        if since is None:
+            return list(items)
+        filtered = []
+        for item in items:
+            timestamp = parse_graph_timestamp(item.timestamp)
+            if timestamp is None or timestamp >= since:
+                filtered.append(item)
+        return filtered
+
+    @staticmethod
+    def _newest_timestamp(items):
+        """Return the newest parsable timestamp of ``items``, if any."""
+        timestamps = [parse_graph_timestamp(item.timestamp) for item in items]
+        return max((ts for ts in timestamps if ts is not None), default=None)
+
+    @staticmethod
+    def _newest(timestamps):
+        """Return the newest of ``timestamps``, ignoring None."""
+        return max((ts for ts in timestamps if ts is not None), default=None)
+
+    @staticmethod
+    def _advance_watermark(resource, *timestamps, insta_id=None):
+        """Move the watermark of ``resource`` to the newest of ``timestamps``."""
+        newest = SyncService._newest(timestamps)
+        if newest is None:
+            return
+
+        watermark, _ = SyncWatermark.objects.get_or_create(
+            account_id=insta_id or settings.INSTA_ID, resource=resource
+        )
+        if watermark.last_timestamp is None or newest > watermark.last_timestamp:
+            watermark.last_timestamp = newest
+            watermark.save(update_fields=["last_timestamp", "updated_at"])
+            logger.debug(f"Advanced {resource} watermark to {newest}.")
 
     @staticmethod
-    def _bulk_sync(objs, model, update_fields=None):
+    def _bulk_sync(objs, model, update_fields=None, batch_size=None):
         logger.debug(
             f"Starting bulk sync for model {model.__name__} with {len(objs)} objects."
         )
         try:
             with transaction.atomic():
-                batch_size = 1000
-                for i in range(0, len(objs), batch_size):
-                    model.objects.bulk_create(
-                        [obj for obj in objs[i : i + batch_size] if not obj.pk],
-                        ignore_conflicts=True,
-                    )
-                    if update_fields:
-                        model.objects.bulk_update(
-                            [obj for obj in objs[i : i + batch_size] if obj.pk],
-                            update_fields,
-                        )
-                logger.debug(f"Bulk sync for model {model.__name__} completed.")
+                result = bulk_upsert(objs, model, update_fields, batch_size)
+            logger.info(f"Bulk sync completed, {result}.")
+            return result
         except Exception as e:
             logger.error(f"Error during bulk synchronization: {e}")
             raise
 
+    @staticmethod
+    def _bulk_sync_changes(changes, batch_size=None):
+        """Write a ``ChangeSet``, one upsert per group of changed columns.
+
+        Returns:
+            UpsertResult: Row counts of all writes, with the rows skipped by
+            the change detection counted as unchanged.
+
+        """
+        result = UpsertResult(model=changes.model.__name__, skipped=changes.unchanged)
+        with transaction.atomic():
+            for objs, update_fields in changes.batches():
+                written = SyncService._bulk_sync(
+                    objs, changes.model, update_fields, batch_size
+                )
+                result.batches.extend(written.batches)
+        logger.info(f"Synced changes, {result}.")
+        return result
+
     @staticmethod
     def _process_instagram_accounts(accounts):
         logger.debug("Processing Instagram accounts for sync.")
-        insta_objs = []
-        objs = []
-        for account in accounts:
-            insta_account = account.instagram_business_account
-            if not insta_account:
-                logger.debug("Skipping account without Instagram business account.")
-                continue
-
-            media_obj = Media.objects.filter(username=insta_account.username)
-            insta_obj = InstagramAccount(
-                account_id=insta_account.id,
-                username=insta_account.username,
-                follows_counts=insta_account.follows_count,
-                followers_counts=insta_account.followers_count,
-                media_counts=insta_account.media_count,
-                profile_picture_url=insta_account.profile_picture_url,
-                website=insta_account.website,
-                biography=insta_account.biography,
+        insta_accounts = [
+            account.instagram_business_account
+            for account in accounts
+            if account.instagram_business_account
+        ]
+        existing_accounts_dict = load_existing(
+            InstagramAccount,
+            (insta_account.id for insta_account in insta_accounts),
+            INSTAGRAM_ACCOUNT_DIFF_FIELDS,
+        )
+        changes = ChangeSet(InstagramAccount)
+        for insta_account in insta_accounts:
+            changes.add(
+                existing_accounts_dict.get(insta_account.id),
+                {
+                    "account_id": insta_account.id,
+                    "username": insta_account.username,
+                    "follows_counts": insta_account.follows_count,
+                    "followers_counts": insta_account.followers_count,
+                    "media_counts": insta_account.media_count,
+                    "profile_picture_url": insta_account.profile_picture_url,
+                    "website": insta_account.website,
+                    "biography": insta_account.biography,
+                },
             )
-            insta_objs.append(insta_obj)
-            objs.append((insta_obj, media_obj))
 
-        logger.debug(f"Processed {len(insta_objs)} Instagram accounts for bulk sync.")
-        return insta_objs, objs
+        logger.debug(
+            f"Processed {len(insta_accounts)} Instagram accounts, "
+            f"{changes.unchanged} unchanged."
+        )
+        return changes
 
     @staticmethod
-    def _process_facebook_pages(pages, user_info):
+    def _process_facebook_pages(pages, user_info, resolver):
         logger.debug("Processing Facebook pages for sync.")
-        existing_pages_dict = {p.page_id: p for p in FacebookPageData.objects.all()}
+        existing_pages_dict = load_existing(
+            FacebookPageData, (page.id for page in pages), FACEBOOK_PAGE_DIFF_FIELDS
+        )
+        resolver.preload(Category, "name", (page.category for page in pages))
+        user_obj = resolver.require(UserData, "name", user_info.name)
+        insta_pks = resolver.pk_map(
+            InstagramAccount,
+            (
+                page.instagram_business_account.id
+                for page in pages
+                if page.instagram_business_account
+            ),
+        )
 
-        page_objs = []
+        changes = ChangeSet(FacebookPageData)
         page_to_categories = []
         for page in pages:
-            categories = Category.objects.filter(name=page.category)
-            page_obj = existing_pages_dict.get(page.id)
-            user_obj = UserData.objects.get(name=user_info.name)
-            insta_obj = InstagramAccount.objects.get(account_id=settings.INSTA_ID)
-            if page_obj:
-                if page_obj.name != page.name or page_obj.tasks != page.tasks:
-                    page_obj.name = page.name
-                    page_obj.tasks = page.tasks
-                    page_obj.user = user_obj
-                    page_obj.instagram_business_account = (
-                        page.instagram_business_account
-                    )
-                    page_objs.append(page_obj)
-                    logger.debug(f"Updated existing page {page.id}.")
-            else:
-                page_obj = FacebookPageData(
-                    page_id=page.id,
-                    name=page.name,
-                    access_token=page.access_token,
-                    tasks=page.tasks,
-                    instagram_business_account=insta_obj,
-                    user=user_obj,
-                )
-                page_objs.append(page_obj)
+            existing = existing_pages_dict.get(page.id)
+            page_obj = changes.add(
+                existing,
+                {
+                    "page_id": page.id,
+                    "name": page.name,
+                    "access_token": page.access_token,
+                    "tasks": page.tasks,
+                    "instagram_business_account_id": (
+                        insta_pks.get(page.instagram_business_account.id)
+                        if page.instagram_business_account
+                        else None
+                    ),
+                    "user_id": user_obj.pk,
+                },
+            )
+            if existing is None:
+                categories = resolver.filter(Category, "name", page.category)
                 page_to_categories.append((page_obj, categories))
                 logger.debug(f"Created new page {page.id}.")
 
-        logger.debug(f"Processed {len(page_objs)} Facebook pages for bulk sync.")
-        return page_objs, page_to_categories
+        logger.debug(
+            f"Processed {len(pages)} Facebook pages, {changes.unchanged} unchanged."
+        )
+        return changes, page_to_categories
 
     @staticmethod
-    def _process_insights(insights, kind=0, media_id=None):
+    def _unexpired_insights(insight_pairs):
+        """Drop the media insights the retention policy already pruned.
+
+        Args:
+            insight_pairs (list): ``(media_id, insight)`` pairs.
+
+        Returns:
+            list: The pairs of media published at or after the cutoff.
+
+        """
+        cutoff = retention_cutoff("insights")
+        if cutoff is None:
+            return insight_pairs
+        expired = set()
+        for chunk in chunked({media_id for media_id, _ in insight_pairs}):
+            expired.update(
+                Media.objects.filter(
+                    media_id__in=chunk, published_at__lt=cutoff
+                ).values_list("media_id", flat=True)
+            )
+        return [pair for pair in insight_pairs if pair[0] not in expired]
+
+    @staticmethod
+    def _process_insights(insight_pairs, resolver, kind=0, insta_id=None):
         logger.debug("Processing Instagram insights for sync.")
-        existing_insights_dict = {i.insight_id: i for i in Insight.objects.all()}
-        insight_objs = []
-        insta_obj = None
-        media_obj = None
-        for insight in insights:
-            insight_obj = existing_insights_dict.get(insight.id)
-            if kind == 0:
-                insta_obj = InstagramAccount.objects.get(account_id=settings.INSTA_ID)
-                insight_kind = InsightKindEnum.account
-            else:
-                media_obj = Media.objects.filter(media_id=media_id).first()
-                insight_kind = InsightKindEnum.media
-
-            if insight_obj:
-                if (
-                    insight_obj.name != insight.name
-                    or insight_obj.period != insight.period
-                    or insight_obj.values != insight.values
-                    or insight_obj.title != insight.title
-                    or insight_obj.description != insight.description
-                    or insight_obj.kind != insight_kind
-                ):
-                    insight_obj.name = insight.name
-                    insight_obj.period = insight.period
-                    insight_obj.values = insight.values
-                    insight_obj.title = insight.title
-                    insight_obj.description = insight.description
-                    insight_obj.account = insight.account
-                    insight_obj.media = media_obj
-                    insight_obj.kind = insight_kind
-
-                    insight_objs.append(insight_obj)
-                    logger.debug(f"Updated existing insight {insight.id}.")
-            else:
-                insight_obj = Insight(
-                    insight_id=insight.id,
-                    name=insight.name,
-                    period=insight.period,
-                    values=insight.values,
-                    media=media_obj,
-                    title=insight.title,
-                    kind=insight_kind,
-                    description=insight.description,
-                    account=insta_obj,
-                )
-                insight_objs.append(insight_obj)
-                logger.debug(f"Created new insight {insight.id}.")
+        if kind != 0:
+            insight_pairs = SyncService._unexpired_insights(insight_pairs)
+        existing_insights_dict = load_existing(
+            Insight, (insight.id for _, insight in insight_pairs), INSIGHT_DIFF_FIELDS
+        )
+        account_pk = None
+        media_pks = {}
+        if kind == 0:
+            account_pk = resolver.require(
+                InstagramAccount, "account_id", insta_id or settings.INSTA_ID
+            ).pk
+            insight_kind = InsightKindEnum.account
+        else:
+            media_pks = resolver.pk_map(
+                Media, (media_id for media_id, _ in insight_pairs)
+            )
+            insight_kind = InsightKindEnum.media
 
-        logger.debug(f"Processed {len(insight_objs)} insights for bulk sync.")
-        return insight_objs
+        changes = ChangeSet(Insight)
+        for media_id, insight in insight_pairs:
+            changes.add(
+                existing_insights_dict.get(insight.id),
+                {
+                    "insight_id": insight.id,
+                    "name": insight.name,
+                    "period": insight.period,
+                    "values": insight.values,
+                    "title": insight.title,
+                    "description": insight.description,
+                    "kind": insight_kind,
+                    "account_id": account_pk,
+                    "media_id": media_pks.get(media_id),
+                },
+            )
+
+        logger.debug(
+            f"Processed {len(insight_pairs)} insights, {changes.unchanged} unchanged."
+        )
+        return changes
 
     @staticmethod
     def _process_categories(accounts):
@@ -328,7 +793,9 @@ class SyncService:
             for category in account.category_list:
                 categories.append({"id": category.id, "name": category.name})
 
-        existing_categories_dict = {c.category_id: c for c in Category.objects.all()}
+        existing_categories_dict = load_existing(
+            Category, (category["id"] for category in categories), ["name"]
+        )
         category_objs = []
 
         for category in categories:
@@ -349,117 +816,296 @@ class SyncService:
         return category_objs
 
     @staticmethod
-    def _process_media(media_list, client):
+    def _fetch_media_children(media_list, client, max_workers=None, insta_id=None):
+        """Fetch comments and insights for many media items at once.
+
+        The per-media requests are sent as Graph batch calls unless the
+        ``META_GRAPH_BATCH`` setting is False, in which case they are fanned
+        out over a bounded thread pool. Failing requests are retried with
+        backoff; those that fail every attempt are parked as dead letters
+        and yield no rows, so one bad media item does not fail the chunk.
+
+        Args:
+            media_list (list): Media items returned by the Graph API.
+            client (FacebookClient): The client used for the requests.
+            max_workers (int, optional): Pool size, also used for the batch
+                calls sent at once. Defaults to the ``META_SYNC_MAX_WORKERS``
+                setting.
+            insta_id (str, optional): The account being synced, recorded on
+                dead letters. Defaults to the ``INSTA_ID`` setting.
+
+        Returns:
+            dict: Maps each media ID to a ``(comments, insights)`` tuple.
+
+        """
+        if max_workers is None:
+            max_workers = getattr(
+                settings, "META_SYNC_MAX_WORKERS", DEFAULT_MAX_WORKERS
+            )
+        max_workers = graph_throttle.limit_workers(max_workers)
+        media_ids = [media.id for media in media_list]
+        if getattr(settings, "META_GRAPH_BATCH", True):
+            children, failures = SyncService._fetch_media_children_batched(
+                media_ids, client, max_workers
+            )
+        else:
+            children, failures = SyncService._fetch_media_children_pooled(
+                media_ids, client, max_workers
+            )
+
+        for (media_id, request), (error, attempts) in failures.items():
+            record_dead_letter(
+                SyncJobKindEnum.media,
+                insta_id or settings.INSTA_ID,
+                media_id,
+                request,
+                error,
+                attempts,
+            )
+        return {
+            media_id: (
+                children.get((media_id, "comments"), []),
+                children.get((media_id, "insights"), []),
+            )
+            for media_id in media_ids
+        }
+
+    @staticmethod
+    def _fetch_media_children_pooled(media_ids, client, max_workers):
+        """Fetch comments and insights with one request per media item.
+
+        Returns:
+            tuple: ``{(media_id, request): items}`` for the successful
+            requests and ``{(media_id, request): (error, attempts)}`` for
+            the failed ones.
+
+        """
+        handlers = {"comments": fetch_comments, "insights": fetch_media_insights}
+        logger.debug(
+            f"Fetching comments and insights for {len(media_ids)} media items "
+            f"with {max_workers} workers."
+        )
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                (media_id, request): executor.submit(
+                    retry_call, handler, client, media_id
+                )
+                for media_id in media_ids
+                for request, handler in handlers.items()
+            }
+        children, failures = {}, {}
+        for key, future in futures.items():
+            try:
+                children[key] = future.result()
+            except Exception as e:
+                failures[key] = (e, get_retries() + 1 if is_transient(e) else 1)
+        return children, failures
+
+    @staticmethod
+    def _fetch_media_children_batched(media_ids, client, max_workers):
+        """Fetch comments and insights through Graph batch calls.
+
+        Two sub-requests are queued per media item, so a chunk of 50 media
+        costs two batch calls instead of 100 requests. Failed sub-requests
+        are batched again after an exponential backoff when their error is
+        transient.
+
+        Returns:
+            tuple: ``{(media_id, request): items}`` for the successful
+            requests and ``{(media_id, request): (error, attempts)}`` for
+            the failed ones.
+
+        """
+        pending = [
+            (media_id, request)
+            for media_id in media_ids
+            for request in ("comments", "insights")
+        ]
+        children, errors, failures = {}, {}, {}
+        retries = get_retries()
+        for attempt in range(retries + 1):
+            if attempt:
+                delay = backoff_delay(attempt - 1)
+                logger.warning(
+                    f"Retrying {len(pending)} failed media requests in {delay:.2f}s."
+                )
+                time.sleep(delay)
+            with GraphBatch(client.access_token, max_workers=max_workers) as batch:
+                futures = {
+                    (media_id, request): (
+                        batch.get(f"{media_id}/comments", fields=COMMENT_FIELDS)
+                        if request == "comments"
+                        else batch.get(
+                            f"{media_id}/insights",
+                            metric=MEDIA_INSIGHT_METRICS,
+                            fields=INSIGHT_FIELDS,
+                        )
+                    )
+                    for media_id, request in pending
+                }
+            logger.debug(
+                f"Fetched {len(futures)} media requests in {batch.calls} batch calls."
+            )
+
+            pending = []
+            for (media_id, request), future in futures.items():
+                try:
+                    data = future.result().get("data", [])
+                except Exception as e:
+                    if is_transient(e):
+                        errors[(media_id, request)] = e
+                        pending.append((media_id, request))
+                    else:
+                        failures[(media_id, request)] = (e, attempt + 1)
+                    continue
+                parse = parse_comment if request == "comments" else parse_insight
+                children[(media_id, request)] = [parse(item) for item in data]
+            if not pending:
+                break
+
+        failures.update({key: (errors[key], retries + 1) for key in pending})
+        return children, failures
+
+    @staticmethod
+    def _process_media(media_list, media_children, resolver, comments_since=None):
+        """Diff a chunk of media and collect their comments and insights.
+
+        Returns:
+            tuple: The media ``ChangeSet``, ``(media_id, comment)`` pairs and
+            ``(media_id, insight)`` pairs fetched for the chunk.
+
+        """
         logger.debug("Processing media items for sync.")
-        existing_media_dict = {m.media_id: m for m in Media.objects.all()}
-        existing_comment_dict = {c.comment_id: c for c in Comment.objects.all()}
-        media_objs = []
-        all_comment_objs = []
-        media_to_comments = []
+        existing_media_dict = load_existing(
+            Media, (media.id for media in media_list), MEDIA_DIFF_FIELDS
+        )
+        resolver.preload(
+            InstagramAccount, "username", (media.username for media in media_list)
+        )
 
+        changes = ChangeSet(Media)
+        media_comments = []
+        media_insights = []
         for media in media_list:
             kind = (
                 ContentFileEnum.image
                 if media.media_type == "IMAGE"
                 else ContentFileEnum.videos
             )
-            media_obj = existing_media_dict.get(media.id)
-            account_insta = InstagramAccount.objects.get(username=media.username)
-            if media_obj:
-                if (
-                    media_obj.username != media.username
-                    or media_obj.caption != media.caption
-                    or media_obj.kind != kind
-                    or media_obj.media_url != media.media_url
-                    or media_obj.timestamp != media.timestamp
-                    or media_obj.like_counts != media.like_count
-                    or media_obj.comments_counts != media.comments_count
-                    or media_obj.account != account_insta
-                ):
-                    media_obj.username = media.username
-                    media_obj.caption = media.caption
-                    media_obj.kind = kind
-                    media_obj.media_url = media.media_url
-                    media_obj.timestamp = media.timestamp
-                    media_obj.like_counts = media.like_count
-                    media_obj.comments_counts = media.comments_count
-                    media_obj.account = account_insta
-                    media_objs.append(media_obj)
-                    logger.debug(f"Updated existing media {media.id}.")
-            else:
-                media_obj = Media(
-                    username=media.username,
-                    media_id=media.id,
-                    caption=media.caption,
-                    kind=kind,
-                    media_url=media.media_url,
-                    timestamp=media.timestamp,
-                    like_counts=media.like_count,
-                    comments_counts=media.comments_count,
-                    account=account_insta,
-                )
-                media_objs.append(media_obj)
-                logger.debug(f"Created new media {media.id}.")
-
-            comments = client.comment_handler.get_instagram_comments(media.id)
-            comment_objs = []
-            for comment in comments:
-                comment_obj = existing_comment_dict.get(comment.id)
-                if comment_obj:
-                    if (
-                        comment_obj.text != comment.text
-                        or comment_obj.username != comment.username
-                        or comment_obj.like_counts != comment.like_count
-                        or comment_obj.timestamp != comment.timestamp
-                    ):
-                        comment_obj.text = comment.text
-                        comment_obj.username = comment.username
-                        comment_obj.like_counts = comment.like_count
-                        comment_obj.timestamp = comment.timestamp
-                        all_comment_objs.append(comment_obj)
-                        logger.debug(f"Updated existing comment {comment.id}.")
-                else:
-                    comment_obj = Comment(
-                        comment_id=comment.id,
-                        text=comment.text,
-                        username=comment.username,
-                        like_counts=comment.like_count,
-                        timestamp=comment.timestamp,
-                    )
-                    all_comment_objs.append(comment_obj)
-                    logger.debug(f"Created new comment {comment.id}.")
+            account_insta = resolver.require(
+                InstagramAccount, "username", media.username
+            )
+            changes.add(
+                existing_media_dict.get(media.id),
+                {
+                    "media_id": media.id,
+                    "username": media.username,
+                    "caption": media.caption,
+                    "kind": kind,
+                    "media_url": (
+                        ",".join(filter(None, media.media_url))
+                        if isinstance(media.media_url, list)
+                        else media.media_url
+                    ),
+                    "timestamp": media.timestamp,
+                    "published_at": parse_graph_timestamp(media.timestamp),
+                    "like_counts": media.like_count,
+                    "comments_counts": media.comments_count,
+                    "account_id": account_insta.pk,
+                },
+            )
+
+            comments, insights = media_children[media.id]
+            media_comments.extend(
+                (media.id, comment)
+                for comment in SyncService._filter_since(comments, comments_since)
+            )
+            media_insights.extend((media.id, insight) for insight in insights)
+
+        logger.debug(
+            f"Processed {len(media_list)} media items, {changes.unchanged} unchanged."
+        )
+        return changes, media_comments, media_insights
+
+    @staticmethod
+    def _process_comments(media_comments, resolver):
+        """Diff comments and link them to their media in memory.
 
-                comment_objs.append(comment_obj)
-                media_to_comments.append((media.id, comment.id))
-                logger.debug(f"Linked comment {comment.id} to media {media.id}.")
+        Comments older than the retention cutoff are skipped.
 
-            insights = client.media_handler.get_media_insights(media.id)
-            SyncService.sync_insights(1, insights, media.id)
+        Args:
+            media_comments (list): ``(media_id, comment)`` pairs.
+            resolver (SyncResolver): The run's foreign key resolver.
+
+        Returns:
+            ChangeSet: The new and changed comments.
+
+        """
+        logger.debug("Processing comments for sync.")
+        cutoff = retention_cutoff("comments")
+        if cutoff is not None:
+            # Comments the retention policy pruned are not brought back.
+            # Undated ones are kept, as prune keeps them.
+            media_comments = [
+                (media_id, comment)
+                for media_id, comment in media_comments
+                if (parse_graph_timestamp(comment.timestamp) or cutoff) >= cutoff
+            ]
+        existing_comment_dict = load_existing(
+            Comment, (comment.id for _, comment in media_comments), COMMENT_DIFF_FIELDS
+        )
+        media_pks = resolver.pk_map(Media, (media_id for media_id, _ in media_comments))
+
+        changes = ChangeSet(Comment)
+        for media_id, comment in media_comments:
+            changes.add(
+                existing_comment_dict.get(comment.id),
+                {
+                    "comment_id": comment.id,
+                    "text": comment.text,
+                    "username": comment.username,
+                    "like_counts": comment.like_count,
+                    "timestamp": comment.timestamp,
+                    "published_at": parse_graph_timestamp(comment.timestamp),
+                    "media_id": media_pks.get(media_id),
+                },
+            )
 
         logger.debug(
-            f"Processed {len(media_objs)} media items and {len(all_comment_objs)} comments for bulk sync."
+            f"Processed {len(media_comments)} comments, {changes.unchanged} unchanged."
         )
-        return media_objs, all_comment_objs, media_to_comments
+        return changes
 
     @staticmethod
-    def _process_stories(stories):
+    def _process_stories(stories, resolver):
         logger.debug("Processing stories for sync.")
-        story_objs = []
+        existing_stories_dict = load_existing(
+            Story, (story.id for story in stories), STORY_DIFF_FIELDS
+        )
+        resolver.preload(
+            InstagramAccount, "username", (story.username for story in stories)
+        )
+        changes = ChangeSet(Story)
         for story in stories:
-            account_insta = InstagramAccount.objects.get(username=story.username)
-            story_objs.append(
-                Story(
-                    story_id=story.id,
-                    media_type=story.media_type,
-                    media_url=story.media_url,
-                    timestamp=story.timestamp,
-                    account=account_insta,
-                )
+            account_insta = resolver.require(
+                InstagramAccount, "username", story.username
+            )
+            changes.add(
+                existing_stories_dict.get(story.id),
+                {
+                    "story_id": story.id,
+                    "media_type": story.media_type,
+                    "media_url": story.media_url,
+                    "timestamp": story.timestamp,
+                    "published_at": parse_graph_timestamp(story.timestamp),
+                    "account_id": account_insta.pk,
+                },
             )
-            logger.debug(f"Processed story {story.id} for sync.")
 
-        logger.debug(f"Processed {len(story_objs)} stories for bulk sync.")
-        return story_objs
+        logger.debug(
+            f"Processed {len(stories)} stories, {changes.unchanged} unchanged."
+        )
+        return changes
 
 
 class PublisherService:
@@ -468,14 +1114,19 @@ class PublisherService:
     This class handles the publishing of different types of content to
     Facebook using the FacebookClient. It includes methods for
     publishing media, stories, and comments, and provides error handling
-    and logging for these operations.
+    and logging for these operations. The library sends publishing requests
+    outside the client's session, so every publish takes its requests from
+    the shared ``graph_throttle`` up front.
 
     """
 
     def __init__(self):
         logger.info("Initializing PublisherService...")
-        self.client = FacebookClient(settings.FACEBOOK_ACCESS_TOKEN)
-        self.client.account_handler.get_accounts()
+        self.client = client_provider.get_client()
+        # Loading the accounts sets the client's Instagram business account,
+        # which the publisher posts to; the cached snapshot already did so
+        # for the shared client.
+        client_provider.get_accounts()
         logger.info("PublisherService initialized.")
 
     def publish_media(self, media):
@@ -484,16 +1135,21 @@ class PublisherService:
             if media.kind == "image":
                 if media.carousel:
                     carousel_list = media.media_url.split(",")
+                    # One container per item, the carousel container and
+                    # the publish call.
+                    graph_throttle.acquire(len(carousel_list) + 2)
                     self.client.content_publisher.publish_carousel(
                         carousel_list, media.caption
                     )
                     logger.debug(f"Published image carousel for media {media.id}.")
                 else:
+                    graph_throttle.acquire(2)
                     self.client.content_publisher.publish_photo(
                         media.media_url, media.caption
                     )
                     logger.debug(f"Published photo for media {media.id}.")
             else:
+                graph_throttle.acquire(2)
                 self.client.content_publisher.publish_video(media.media_url)
                 logger.debug(f"Published video for media {media.id}.")
             logger.info(f"Successfully published media with ID {media.id}.")
@@ -514,6 +1170,7 @@ class PublisherService:
     def publish_story(self, story):
         logger.info(f"Publishing story with ID {story.story_id}...")
         try:
+            graph_throttle.acquire(2)
             self.client.content_publisher.publish_story(story.media_url)
             logger.info(f"Successfully published story: {story.media_url}.")
         except Exception as e:
@@ -523,6 +1180,7 @@ class PublisherService:
     def publish_comment(self, comment):
         logger.info(f"Publishing comment with ID {comment.comment_id}...")
         try:
+            graph_throttle.acquire()
             self.client.content_publisher.put_comment(
                 comment.media.media_id, comment.text
             )
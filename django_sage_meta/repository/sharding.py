@@ -0,0 +1,191 @@
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+import django
+from django.conf import settings
+from django.db import connections
+
+from django_sage_meta.models import FacebookPageData
+from django_sage_meta.repository.checkpoint import complete_stage, completed_stages
+from django_sage_meta.repository.client import client_provider
+from django_sage_meta.repository.resolver import SyncResolver
+from django_sage_meta.repository.scheduler import count_rows
+from django_sage_meta.repository.service import SyncService
+from django_sage_meta.repository.throttle import graph_throttle
+
+logger = logging.getLogger(__name__)
+
+ACCOUNT_STAGES = ("media", "insights", "stories")
+
+
+@dataclass(frozen=True)
+class AccountTarget:
+    """An Instagram business account and the token used to sync it."""
+
+    account_id: str
+    access_token: str
+    page_id: str = ""
+
+
+@dataclass
+class AccountReport:
+    """Outcome of syncing one account."""
+
+    account_id: str
+    status: str = "done"
+    duration: float = 0.0
+    rows: int = 0
+    error: str = ""
+
+
+def list_account_targets():
+    """Return every Instagram business account linked to a stored page.
+
+    Each account is synced with the access token of its page, falling back
+    to the ``FACEBOOK_ACCESS_TOKEN`` setting for pages without one.
+
+    Returns:
+        list: One ``AccountTarget`` per account, ordered by account ID.
+
+    """
+    pages = (
+        FacebookPageData.objects.filter(instagram_business_account__isnull=False)
+        .values_list(
+            "instagram_business_account__account_id", "access_token", "page_id"
+        )
+        .order_by("instagram_business_account__account_id")
+    )
+    return [
+        AccountTarget(
+            account_id=account_id,
+            access_token=access_token or settings.FACEBOOK_ACCESS_TOKEN,
+            page_id=page_id,
+        )
+        for account_id, access_token, page_id in pages
+    ]
+
+
+def sync_account(
+    target, incremental=False, stages=ACCOUNT_STAGES, resolver=None, resume=False
+):
+    """Sync the per-account stages of one Instagram account.
+
+    Any error is caught and reported, so a broken token only fails its own
+    account.
+
+    Args:
+        target (AccountTarget): The account and its token.
+        incremental (bool): Whether media and stories sync incrementally.
+        stages (tuple): The account stages to run.
+        resolver (SyncResolver, optional): The foreign key resolver.
+        resume (bool): Skip the stages a previous run completed and resume
+            the media sync from its checkpoint.
+
+    Returns:
+        AccountReport: The status, duration and row count of the account.
+
+    """
+    resolver = resolver or SyncResolver()
+    kwargs = {
+        "resolver": resolver,
+        "insta_id": target.account_id,
+        "access_token": target.access_token,
+    }
+    report = AccountReport(account_id=target.account_id)
+    started = time.monotonic()
+    try:
+        if resume:
+            done = completed_stages(target.account_id)
+            stages = [stage for stage in stages if stage not in done]
+        if "media" in stages:
+            report.rows += count_rows(
+                SyncService.sync_media(incremental=incremental, resume=resume, **kwargs)
+            )
+        if "insights" in stages:
+            report.rows += count_rows(SyncService.sync_insights(**kwargs))
+            complete_stage("insights", target.account_id)
+        if "stories" in stages:
+            report.rows += count_rows(
+                SyncService.sync_stories(incremental=incremental, **kwargs)
+            )
+            complete_stage("stories", target.account_id)
+    except Exception as e:
+        logger.error(f"Sync of account {target.account_id} failed: {e}")
+        report.status = "failed"
+        report.error = str(e)
+    report.duration = time.monotonic() - started
+    return report
+
+
+def sync_accounts(
+    targets,
+    workers=1,
+    incremental=False,
+    stages=ACCOUNT_STAGES,
+    on_finish=None,
+    resume=False,
+):
+    """Sync many accounts, spread over a pool of worker processes.
+
+    Accounts are handed to the pool one at a time, so a worker that
+    finishes a small account picks up the next one instead of idling
+    behind a fixed shard. Each worker keeps to an equal share of the
+    Graph throttle's rate budget.
+
+    Args:
+        targets (list): The ``AccountTarget`` of every account.
+        workers (int): Number of worker processes. 1 syncs in-process.
+        incremental (bool): Whether media and stories sync incrementally.
+        stages (tuple): The account stages to run.
+        on_finish (callable, optional): Called with each ``AccountReport``.
+        resume (bool): Resume each account from its checkpoints.
+
+    Returns:
+        list: The ``AccountReport`` of every account, in target order.
+
+    """
+    logger.info(f"Syncing {len(targets)} accounts with {workers} workers.")
+    reports = {}
+    if workers <= 1:
+        resolver = SyncResolver()
+        for target in targets:
+            reports[target] = sync_account(
+                target, incremental, stages, resolver, resume
+            )
+            if on_finish is not None:
+                on_finish(reports[target])
+    else:
+        # Forked workers must not share the parent's database connections.
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(workers,)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    sync_account, target, incremental, stages, None, resume
+                ): target
+                for target in targets
+            }
+            for future in as_completed(futures):
+                target = futures[future]
+                try:
+                    reports[target] = future.result()
+                except Exception as e:
+                    logger.error(f"Worker for account {target.account_id} died: {e}")
+                    reports[target] = AccountReport(
+                        account_id=target.account_id, status="failed", error=str(e)
+                    )
+                if on_finish is not None:
+                    on_finish(reports[target])
+    return [reports[target] for target in targets]
+
+
+def _init_worker(workers):
+    django.setup()
+    connections.close_all()
+    # Forked workers inherit the parent's clients and their HTTP sessions,
+    # and pace their requests alone, so together they keep to one budget.
+    client_provider.invalidate(drop_client=True)
+    graph_throttle.share(workers)
@@ -0,0 +1,264 @@
+import json
+import logging
+import threading
+import time
+
+import requests
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_RATE = 50.0
+DEFAULT_MIN_RATE = 0.5
+DEFAULT_HIGH_USAGE = 75
+DEFAULT_LOW_USAGE = 50
+DEFAULT_COOLDOWN = 60
+DEFAULT_MAX_RETRIES = 3
+
+# Graph error codes returned once an app, user or business use case
+# exceeded its rate limit.
+RATE_LIMIT_CODES = {4, 17, 32, 613, 80001, 80002, 80006}
+
+
+class GraphThrottle:
+    """Adaptive pacing of Graph API requests from Meta usage headers.
+
+    Requests take tokens from a bucket refilled at ``rate`` tokens per
+    second. Every response reports the app's and the business use case's
+    usage in percent. Above ``high_usage`` the rate is halved; below
+    ``low_usage`` it grows back step by step. When Meta reports an
+    ``estimated_time_to_regain_access`` or a rate limit error, requests
+    pause until access is back. A single wait never exceeds the cooldown,
+    so a slowed-down throttle keeps probing the current usage instead of
+    stalling on a stale reading. The throttle is shared by every sync
+    stage and publisher in the process.
+
+    """
+
+    def __init__(
+        self,
+        max_rate=None,
+        min_rate=None,
+        high_usage=None,
+        low_usage=None,
+    ):
+        self.max_rate = max_rate or getattr(
+            settings, "META_THROTTLE_MAX_RATE", DEFAULT_MAX_RATE
+        )
+        self.min_rate = min_rate or getattr(
+            settings, "META_THROTTLE_MIN_RATE", DEFAULT_MIN_RATE
+        )
+        self.high_usage = high_usage or getattr(
+            settings, "META_THROTTLE_HIGH_USAGE", DEFAULT_HIGH_USAGE
+        )
+        self.low_usage = low_usage or getattr(
+            settings, "META_THROTTLE_LOW_USAGE", DEFAULT_LOW_USAGE
+        )
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget the observed usage and start again at the maximum rate."""
+        with self._lock:
+            self.rate = self.max_rate
+            self._tokens = self.max_rate
+            self._refilled_at = time.monotonic()
+            self._paused_until = 0.0
+            self._decreased_at = 0.0
+            self.app_usage = {}
+            self.business_usage = {}
+            self.requests = 0
+            self.waited = 0.0
+            self.rate_limited = 0
+
+    def reserve(self, tokens=1):
+        """Take ``tokens`` from the bucket.
+
+        Args:
+            tokens (int): Graph requests about to be sent. A batch call
+                counts once per sub-request.
+
+        Returns:
+            float: Seconds the caller must wait before sending.
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            capacity = max(self.rate, 1.0)
+            self._tokens = min(
+                capacity, self._tokens + (now - self._refilled_at) * self.rate
+            )
+            self._refilled_at = now
+            # Bound the debt so the next request goes out within the
+            # cooldown and reports fresh usage.
+            self._tokens = max(self._tokens - tokens, -self.rate * self._cooldown())
+            self.requests += tokens
+            wait = max(0.0, -self._tokens / self.rate, self._paused_until - now)
+            self.waited += wait
+            return wait
+
+    def acquire(self, tokens=1):
+        """Block until ``tokens`` requests may be sent."""
+        wait = self.reserve(tokens)
+        if wait:
+            logger.debug(f"Throttling Graph requests for {wait:.2f}s.")
+            time.sleep(wait)
+
+    def observe(self, headers):
+        """Adapt the rate to the usage reported in response headers.
+
+        Args:
+            headers (Mapping): Response headers, case-insensitive.
+
+        """
+        app_usage = _load_header(headers.get("X-App-Usage"))
+        business_usage = _load_header(headers.get("X-Business-Use-Case-Usage"))
+        if not app_usage and not business_usage:
+            return
+
+        regain = 0
+        with self._lock:
+            if app_usage:
+                self.app_usage = app_usage
+            for business_id, entries in (business_usage or {}).items():
+                for entry in entries:
+                    self.business_usage[f"{business_id}:{entry.get('type')}"] = entry
+                    regain = max(
+                        regain, entry.get("estimated_time_to_regain_access") or 0
+                    )
+            usage = self._usage()
+            now = time.monotonic()
+            if regain:
+                self._pause(now, regain * 60)
+            if usage >= self.high_usage:
+                # Several in-flight responses report the same window; halve
+                # at most once per second.
+                if now - self._decreased_at >= 1:
+                    self.rate = max(self.min_rate, self.rate / 2)
+                    self._decreased_at = now
+                    logger.warning(
+                        f"Graph usage at {usage}%, slowing down to {self.rate:.2f} req/s."
+                    )
+            elif usage < self.low_usage and self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+    def observe_rate_limit(self, code):
+        """Pause after a rate limit error.
+
+        Returns:
+            float: Seconds requests are paused for.
+
+        """
+        cooldown = self._cooldown()
+        with self._lock:
+            self.rate_limited += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._pause(time.monotonic(), cooldown)
+        logger.warning(f"Graph rate limit hit (code {code}), pausing for {cooldown}s.")
+        return cooldown
+
+    def share(self, parts):
+        """Keep to an equal share of the rate budget among ``parts``.
+
+        Every worker process has its own throttle, so a pool of ``parts``
+        workers splits the configured rates instead of each taking all of
+        it. The observed usage is forgotten.
+
+        """
+        self.max_rate = self.max_rate / parts
+        self.min_rate = self.min_rate / parts
+        self.reset()
+
+    def limit_workers(self, workers):
+        """Scale a worker pool size down with the current rate."""
+        return max(1, int(workers * self.rate / self.max_rate))
+
+    def metrics(self):
+        """Return the current usage and pacing.
+
+        Returns:
+            dict: ``usage`` is the highest reported usage in percent,
+            ``app_usage`` and ``business_usage`` the raw header values,
+            ``rate`` the allowed requests per second, ``paused_for`` the
+            seconds left in a pause, ``requests`` the requests sent,
+            ``waited`` the seconds spent throttled and ``rate_limited`` the
+            number of rate limit errors.
+
+        """
+        with self._lock:
+            return {
+                "usage": self._usage(),
+                "app_usage": dict(self.app_usage),
+                "business_usage": dict(self.business_usage),
+                "rate": round(self.rate, 2),
+                "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 2),
+                "requests": self.requests,
+                "waited": round(self.waited, 2),
+                "rate_limited": self.rate_limited,
+            }
+
+    def _usage(self):
+        entries = [self.app_usage, *self.business_usage.values()]
+        return max(
+            (
+                entry.get(key) or 0
+                for entry in entries
+                for key in ("call_count", "total_cputime", "total_time")
+            ),
+            default=0,
+        )
+
+    def _cooldown(self):
+        return getattr(settings, "META_THROTTLE_COOLDOWN", DEFAULT_COOLDOWN)
+
+    def _pause(self, now, seconds):
+        self._paused_until = max(self._paused_until, now + seconds)
+
+
+class ThrottledSession(requests.Session):
+    """A ``requests`` session that paces its calls with a ``GraphThrottle``.
+
+    Rate limit errors are retried after the throttle's pause, up to
+    ``META_THROTTLE_MAX_RETRIES`` times.
+
+    """
+
+    def __init__(self, throttle=None):
+        super().__init__()
+        self.throttle = throttle or graph_throttle
+
+    def request(self, method, url, *args, tokens=1, **kwargs):
+        retries = getattr(settings, "META_THROTTLE_MAX_RETRIES", DEFAULT_MAX_RETRIES)
+        for attempt in range(retries + 1):
+            self.throttle.acquire(tokens)
+            response = super().request(method, url, *args, **kwargs)
+            self.throttle.observe(response.headers)
+            code = rate_limit_code(response)
+            if code is None or attempt == retries:
+                return response
+            self.throttle.observe_rate_limit(code)
+        return response
+
+
+def rate_limit_code(response):
+    """Return the Graph rate limit error code of ``response``, if any."""
+    if response.status_code < 400:
+        return None
+    try:
+        code = response.json().get("error", {}).get("code")
+    except ValueError:
+        return None
+    return code if code in RATE_LIMIT_CODES else None
+
+
+def _load_header(value):
+    if not value:
+        return None
+    try:
+        return json.loads(value)
+    except ValueError:
+        logger.debug(f"Ignoring malformed usage header {value!r}.")
+        return None
+
+
+graph_throttle = GraphThrottle()
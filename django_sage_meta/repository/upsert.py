@@ -0,0 +1,185 @@
+import logging
+from dataclasses import dataclass, field
+from typing import List
+
+from django.conf import settings
+from django.db import connections, router
+
+from django_sage_meta.models import (
+    Category,
+    Comment,
+    FacebookPageData,
+    Insight,
+    InstagramAccount,
+    Media,
+    Story,
+    UserData,
+)
+
+logger = logging.getLogger(__name__)
+
+UPSERT_KEYS = {
+    Category: "category_id",
+    Comment: "comment_id",
+    FacebookPageData: "page_id",
+    Insight: "insight_id",
+    InstagramAccount: "account_id",
+    Media: "media_id",
+    Story: "story_id",
+    UserData: "user_id",
+}
+
+DEFAULT_BATCH_SIZES = {
+    "postgresql": 2000,
+    "mysql": 1000,
+    "sqlite": 500,
+    "oracle": 500,
+}
+DEFAULT_BATCH_SIZE = 1000
+
+
+@dataclass
+class UpsertStats:
+    """Row counts of a single upsert batch."""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+
+@dataclass
+class UpsertResult:
+    """Per-batch and total row counts of a bulk upsert.
+
+    Attributes:
+        model (str): Name of the written model.
+        batches (list): One ``UpsertStats`` entry per written batch.
+        skipped (int): Rows left out of the write because their content
+            did not change.
+
+    """
+
+    model: str
+    batches: List[UpsertStats] = field(default_factory=list)
+    skipped: int = 0
+
+    @property
+    def created(self):
+        return sum(batch.created for batch in self.batches)
+
+    @property
+    def updated(self):
+        return sum(batch.updated for batch in self.batches)
+
+    @property
+    def unchanged(self):
+        return self.skipped + sum(batch.unchanged for batch in self.batches)
+
+    def __str__(self):
+        return (
+            f"{self.model}: created={self.created}, updated={self.updated}, "
+            f"unchanged={self.unchanged}, batches={len(self.batches)}"
+        )
+
+
+def get_batch_size(model):
+    """Return the configured upsert batch size for the model's database.
+
+    ``META_SYNC_BATCH_SIZE`` may be an integer, or a dict keyed by database
+    vendor (``postgresql``, ``mysql``, ``sqlite``, ...).
+
+    """
+    connection = connections[router.db_for_write(model)]
+    configured = getattr(settings, "META_SYNC_BATCH_SIZE", None)
+    if isinstance(configured, dict):
+        configured = configured.get(connection.vendor)
+    if configured:
+        return int(configured)
+    return DEFAULT_BATCH_SIZES.get(connection.vendor, DEFAULT_BATCH_SIZE)
+
+
+def bulk_upsert(objs, model, update_fields=None, batch_size=None):
+    """Insert or update ``objs`` with one statement per batch.
+
+    Rows are matched on the model's external ID from ``UPSERT_KEYS``. When
+    ``update_fields`` is given, conflicting rows get those columns
+    overwritten with ``INSERT ... ON CONFLICT DO UPDATE``. Without it,
+    conflicting rows are left untouched. Backends without upsert support
+    fall back to ``bulk_create`` plus ``bulk_update``.
+
+    Rows already stored are recognized by their primary key, which
+    ``load_existing`` sets on the instances callers merge into, so counting
+    costs no query. Stored rows are counted as updated when
+    ``update_fields`` is given and as unchanged otherwise; callers pass only
+    the stored rows whose content changed. A new row that a concurrent sync
+    inserted first is still counted as created.
+
+    Args:
+        objs (list): Unsaved or saved model instances.
+        model (Model): The model class being written.
+        update_fields (list, optional): Columns to overwrite on conflict.
+        batch_size (int, optional): Rows per statement. Defaults to
+            ``get_batch_size(model)``.
+
+    Returns:
+        UpsertResult: Created, updated and unchanged counts per batch.
+
+    """
+    key = UPSERT_KEYS[model]
+    result = UpsertResult(model=model.__name__)
+    # The same external ID may not appear twice in one upsert statement.
+    objs = list({getattr(obj, key): obj for obj in objs}.values())
+    if not objs:
+        return result
+
+    batch_size = batch_size or get_batch_size(model)
+    connection = connections[router.db_for_write(model)]
+    for i in range(0, len(objs), batch_size):
+        batch = objs[i : i + batch_size]
+        existing = sum(1 for obj in batch if obj.pk is not None)
+        stats = UpsertStats(created=len(batch) - existing)
+        if update_fields:
+            stats.updated = existing
+        else:
+            stats.unchanged = existing
+
+        if not update_fields:
+            model.objects.bulk_create(batch, ignore_conflicts=True)
+        elif connection.features.supports_update_conflicts:
+            _upsert_batch(batch, model, key, update_fields, connection)
+        else:
+            model.objects.bulk_create(
+                [obj for obj in batch if not obj.pk], ignore_conflicts=True
+            )
+            model.objects.bulk_update([obj for obj in batch if obj.pk], update_fields)
+
+        result.batches.append(stats)
+        logger.debug(
+            f"Upserted batch {len(result.batches)} of {model.__name__}: {stats}."
+        )
+
+    return result
+
+
+def _upsert_batch(batch, model, key, update_fields, connection):
+    # Existing rows are matched by external ID, not primary key, so the
+    # primary keys are cleared for the statement and restored afterwards on
+    # backends that do not return them.
+    pks = [obj.pk for obj in batch]
+    for obj in batch:
+        obj.pk = None
+    try:
+        model.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=(
+                [key]
+                if connection.features.supports_update_conflicts_with_target
+                else None
+            ),
+            update_fields=update_fields,
+        )
+    finally:
+        for obj, pk in zip(batch, pks):
+            if obj.pk is None:
+                obj.pk = pk
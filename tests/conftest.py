@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from django_sage_meta.helper.choice import InsightKindEnum
+from django_sage_meta.models import Comment, Insight, InstagramAccount, Media, Story
+
+START = datetime(2024, 7, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def keep_everything(settings):
+    """Keep rows forever, as the fixture data is older than any retention."""
+    settings.META_RETENTION_DAYS = {
+        "stories": None,
+        "comments": None,
+        "insight_values": None,
+        "insights": None,
+    }
+
+
+@pytest.fixture
+def account(db):
+    return InstagramAccount.objects.create(
+        account_id="ig1",
+        username="brand",
+        follows_counts=1,
+        followers_counts=2,
+        media_counts=0,
+    )
+
+
+@pytest.fixture
+def seeded(account):
+    """Seed media with comments, stories and insights of one account."""
+    media = Media.objects.bulk_create(
+        Media(
+            media_id=f"m{i}",
+            username="brand",
+            caption=f"caption {i}",
+            media_url=f"https://example.com/{i}.jpg",
+            published_at=START + timedelta(hours=i),
+            like_counts=i,
+            comments_counts=5,
+            account=account,
+        )
+        for i in range(200)
+    )
+    Comment.objects.bulk_create(
+        Comment(
+            comment_id=f"{item.media_id}c{j}",
+            text=f"hello {j}",
+            username="bob",
+            published_at=item.published_at + timedelta(minutes=j),
+            media=item,
+        )
+        for item in media
+        for j in range(5)
+    )
+    Story.objects.bulk_create(
+        Story(
+            story_id=f"s{i}",
+            published_at=START + timedelta(hours=i),
+            account=account,
+        )
+        for i in range(50)
+    )
+    Insight.objects.bulk_create(
+        Insight(
+            insight_id=f"{item.media_id}/insights/reach/lifetime",
+            name="reach",
+            period="lifetime",
+            kind=InsightKindEnum.media,
+            media=item,
+        )
+        for item in media
+    )
+    return media
+
+
+class FakeGraph:
+    """Answer the Graph reads of a sync from in-memory payloads."""
+
+    def __init__(self):
+        self.media = []
+        self.comments = {}
+        self.insights = {}
+        self.stories = []
+        self.requests = []
+
+    def add_media(self, media_id, **fields):
+        item = {
+            "id": media_id,
+            "username": "brand",
+            "caption": f"caption {media_id}",
+            "media_type": "IMAGE",
+            "media_url": f"https://example.com/{media_id}.jpg",
+            "timestamp": "2024-07-01T10:00:00+0000",
+            "like_count": 1,
+            "comments_count": 0,
+            **fields,
+        }
+        self.media.append(item)
+        return item
+
+    def get_connections(self, object_id, edge, **params):
+        self.requests.append((object_id, edge, params))
+        if edge == "media":
+            start = int(params.get("after") or 0)
+            limit = int(params.get("limit", 25))
+            paging = {"cursors": {"after": str(start + limit)}}
+            if start + limit < len(self.media):
+                paging["next"] = "next"
+            return {"data": self.media[start : start + limit], "paging": paging}
+        if edge == "comments":
+            return {"data": self.comments.get(object_id, [])}
+        if edge == "insights":
+            return {"data": self.insights.get(object_id, [])}
+        if edge == "stories":
+            return {"data": self.stories}
+        raise AssertionError(f"Unexpected Graph read of {object_id}/{edge}")
+
+
+@pytest.fixture
+def graph(account, settings, monkeypatch):
+    """Point the sync at a ``FakeGraph`` for the ``account`` fixture."""
+    from django_sage_meta.repository.client import client_provider
+
+    settings.INSTA_ID = account.account_id
+    fake = FakeGraph()
+    client = SimpleNamespace(graph=fake, access_token=settings.FACEBOOK_ACCESS_TOKEN)
+    monkeypatch.setattr(client_provider, "get_client", lambda access_token=None: client)
+    return fake
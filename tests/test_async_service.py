@@ -0,0 +1,141 @@
+"""The async service writes through worker threads, so these tests commit."""
+
+import asyncio
+
+import facebook
+import pytest
+import requests
+from django.core.management import CommandError, call_command
+
+from django_sage_meta.management.commands import async_sync_all
+from django_sage_meta.models import Media, SyncDeadLetter, SyncWatermark
+from django_sage_meta.repository.async_service import (
+    AsyncGraphTransport,
+    AsyncSyncService,
+)
+from django_sage_meta.repository.graph import INSIGHT_FIELDS
+from django_sage_meta.repository.sharding import AccountTarget
+
+
+class FakeTransport(AsyncGraphTransport):
+    """Answer Graph reads from in-memory payloads or queued errors."""
+
+    def __init__(self, responses):
+        super().__init__(access_token="token")
+        self.responses = responses
+        self.paths = []
+        self.params = []
+
+    async def get(self, path, **params):
+        self.paths.append(path)
+        self.params.append(params)
+        response = self.responses.get(path, {"data": []})
+        if isinstance(response, list):
+            response = response.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def media(media_id):
+    return {
+        "id": media_id,
+        "username": "brand",
+        "caption": "hello",
+        "media_type": "IMAGE",
+        "media_url": f"https://example.com/{media_id}.jpg",
+        "timestamp": "2024-07-01T10:00:00+0000",
+        "like_count": 1,
+        "comments_count": 0,
+    }
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(settings):
+    settings.META_SYNC_RETRY_BASE_DELAY = 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_media_sync_uses_the_given_account(account):
+    transport = FakeTransport(
+        {
+            "ig1/media": {"data": [media("m1"), media("m2")]},
+            "m1/comments": [requests.Timeout(), {"data": []}],
+            "m2/insights": facebook.GraphAPIError(
+                {"error": {"message": "Unsupported request", "code": 100}}
+            ),
+        }
+    )
+    service = AsyncSyncService(transport=transport, insta_id="ig1")
+
+    asyncio.run(service.sync_media())
+
+    assert set(Media.objects.values_list("media_id", flat=True)) == {"m1", "m2"}
+    assert transport.paths.count("m1/comments") == 2
+    assert transport.paths.count("m2/insights") == 1
+    assert list(
+        SyncDeadLetter.objects.values_list(
+            "account_id", "object_id", "request", "attempts"
+        )
+    ) == [("ig1", "m2", "insights", 1)]
+    assert SyncWatermark.objects.filter(account_id="ig1").exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_account_insights_request_only_the_stored_fields(account):
+    transport = FakeTransport({})
+
+    asyncio.run(AsyncSyncService(transport=transport, insta_id="ig1").sync_insights())
+
+    assert set(transport.paths) == {"ig1/insights"}
+    assert {params["fields"] for params in transport.params} == {INSIGHT_FIELDS}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failing_child_requests_are_parked_after_every_retry(account, settings):
+    settings.META_SYNC_RETRIES = 2
+    transport = FakeTransport(
+        {
+            "ig1/media": {"data": [media("m1")]},
+            "m1/comments": [requests.ConnectionError("reset")] * 3,
+        }
+    )
+
+    asyncio.run(AsyncSyncService(transport=transport, insta_id="ig1").sync_media())
+
+    dead_letter = SyncDeadLetter.objects.get()
+    assert (dead_letter.request, dead_letter.attempts) == ("comments", 3)
+    assert Media.objects.filter(media_id="m1").exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_command_fails_when_the_sync_raises(monkeypatch):
+    async def sync_all(self, incremental=False):
+        raise RuntimeError("Graph is down")
+
+    monkeypatch.setattr(AsyncSyncService, "sync_all", sync_all)
+
+    with pytest.raises(CommandError, match="Graph is down"):
+        call_command("async_sync_all")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_command_fails_when_an_account_fails(monkeypatch):
+    async def sync_shared(self):
+        return {}
+
+    async def sync_account(self, incremental=False):
+        if self.insta_id == "ig2":
+            raise RuntimeError("token expired")
+        return {}
+
+    monkeypatch.setattr(AsyncSyncService, "sync_shared", sync_shared)
+    monkeypatch.setattr(AsyncSyncService, "sync_account", sync_account)
+    monkeypatch.setattr(
+        async_sync_all,
+        "list_account_targets",
+        lambda: [AccountTarget("ig1", "token"), AccountTarget("ig2", "token")],
+    )
+
+    with pytest.raises(CommandError, match="Accounts failed: ig2."):
+        call_command("async_sync_all", "--all-accounts")
@@ -0,0 +1,102 @@
+import pytest
+
+from django_sage_meta.models import Media
+from django_sage_meta.repository.fingerprint import ChangeSet, compute_fingerprint
+from django_sage_meta.repository.service import SyncService
+
+
+def stored_media(**values):
+    media = Media(pk=1, media_id="m1", caption="hello", like_counts=1)
+    for name, value in values.items():
+        setattr(media, name, value)
+    media.fingerprint = compute_fingerprint(
+        {"media_id": "m1", "caption": "hello", "like_counts": 1}
+    )
+    return media
+
+
+def payload(**values):
+    return {"media_id": "m1", "caption": "hello", "like_counts": 1, **values}
+
+
+def test_new_payload_is_created():
+    changes = ChangeSet(Media)
+
+    obj = changes.add(None, payload())
+
+    assert changes.created == [obj]
+    assert obj.fingerprint == compute_fingerprint(payload())
+    assert list(changes.batches()) == [
+        ([obj], ["caption", "like_counts", "fingerprint"])
+    ]
+
+
+def test_matching_payload_is_unchanged():
+    changes = ChangeSet(Media)
+
+    changes.add(stored_media(), payload())
+
+    assert changes.unchanged == 1
+    assert len(changes) == 0
+
+
+def test_changed_payload_updates_only_the_changed_columns():
+    changes = ChangeSet(Media)
+    existing = stored_media()
+
+    changes.add(existing, payload(like_counts=5))
+
+    assert existing.like_counts == 5
+    assert list(changes.batches()) == [([existing], ["like_counts", "fingerprint"])]
+
+
+def test_changes_are_grouped_by_changed_columns():
+    changes = ChangeSet(Media)
+
+    changes.add(stored_media(), payload(like_counts=5))
+    changes.add(stored_media(), payload(like_counts=6))
+    changes.add(stored_media(), payload(caption="edited"))
+
+    groups = {tuple(fields): len(objs) for objs, fields in changes.batches()}
+    assert groups == {("like_counts", "fingerprint"): 2, ("caption", "fingerprint"): 1}
+
+
+def test_local_edit_is_repaired_although_the_fingerprint_matches():
+    changes = ChangeSet(Media)
+    existing = stored_media(like_counts=99)
+
+    changes.add(existing, payload())
+
+    assert existing.like_counts == 1
+    assert changes.unchanged == 0
+    assert list(changes.batches()) == [([existing], ["like_counts", "fingerprint"])]
+
+
+@pytest.mark.django_db
+def test_sync_media_creates_skips_and_updates(graph):
+    graph.add_media("m1", like_count=1)
+    graph.add_media("m2", like_count=2)
+
+    first = SyncService.sync_media()
+    second = SyncService.sync_media()
+    graph.media[0]["like_count"] = 10
+    third = SyncService.sync_media()
+
+    media = [result for result in first if result.model == "Media"][0]
+    assert (media.created, media.updated, media.unchanged) == (2, 0, 0)
+    media = [result for result in second if result.model == "Media"][0]
+    assert (media.created, media.updated, media.unchanged) == (0, 0, 2)
+    media = [result for result in third if result.model == "Media"][0]
+    assert (media.created, media.updated, media.unchanged) == (0, 1, 1)
+    assert Media.objects.get(media_id="m1").like_counts == 10
+
+
+@pytest.mark.django_db
+def test_sync_media_repairs_a_local_edit(graph):
+    graph.add_media("m1", like_count=1)
+    SyncService.sync_media()
+    Media.objects.filter(media_id="m1").update(like_counts=99)
+
+    SyncService.sync_media()
+
+    assert Media.objects.get(media_id="m1").like_counts == 1
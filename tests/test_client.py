@@ -0,0 +1,44 @@
+import json
+
+import requests
+
+from django_sage_meta.repository import client as client_module
+from django_sage_meta.repository.client import ClientProvider, GraphClient
+
+
+class RecordingSession(requests.Session):
+    """Answer every request with an empty Graph object and record its URL."""
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    def request(self, method, url, *args, **kwargs):
+        self.urls.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps({"id": "u1", "name": "User"}).encode()
+        return response
+
+
+def test_first_request_goes_through_the_session():
+    session = RecordingSession()
+
+    client = GraphClient("token", graph_session=session)
+
+    assert client.graph.session is session
+    assert len(session.urls) == 1
+    assert session.urls[0].endswith("/me")
+    assert client.user.id == "u1"
+
+
+def test_provider_builds_clients_with_a_cached_session(monkeypatch):
+    monkeypatch.setattr(client_module, "GraphSession", RecordingSession)
+    provider = ClientProvider()
+
+    client = provider.get_client("token")
+
+    assert isinstance(client.graph.session, RecordingSession)
+    assert client.graph.session.urls[0].endswith("/me")
+    assert provider.get_client("token") is client
@@ -0,0 +1,49 @@
+"""A full sync runs offline against the Graph stub."""
+
+import threading
+
+import pytest
+from django.core.management import call_command
+
+from django_sage_meta.helper.graph_stub import GraphStub, make_server
+from django_sage_meta.models import (
+    Comment,
+    FacebookPageData,
+    InstagramAccount,
+    Media,
+    Story,
+    UserData,
+)
+from django_sage_meta.repository.client import client_provider
+
+
+@pytest.fixture
+def stub(settings):
+    stub = GraphStub(media_count=30, comments_per_media=2)
+    server = make_server(stub, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    settings.META_GRAPH_URL = f"http://{host}:{port}/v20.0"
+    settings.INSTA_ID = stub.account_id
+    client_provider.invalidate(drop_client=True)
+    yield stub
+    client_provider.invalidate(drop_client=True)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("batch", [False, True])
+def test_sync_all_runs_against_the_stub(stub, settings, batch):
+    settings.META_GRAPH_BATCH = batch
+
+    call_command("sync_all")
+
+    assert UserData.objects.get().user_id == stub.user_id
+    assert FacebookPageData.objects.get().page_id == stub.page_id
+    assert InstagramAccount.objects.get().account_id == stub.account_id
+    assert Media.objects.count() == 30
+    assert Comment.objects.count() == 60
+    assert Story.objects.count() == 1
+    assert stub.graph_requests > 0
@@ -0,0 +1,135 @@
+import pytest
+from django.db import IntegrityError, transaction
+
+from django_sage_meta.helper.choice import InsightKindEnum
+from django_sage_meta.models import Insight, InsightRollup, InsightValue
+from django_sage_meta.repository import insight_values
+from django_sage_meta.repository.insight_values import write_insight_values
+from django_sage_meta.repository.graph import ACCOUNT_INSIGHT_METRICS, INSIGHT_FIELDS
+from django_sage_meta.repository.rollups import refresh_insight_rollups
+from django_sage_meta.repository.service import SyncService
+from tests.conftest import START
+
+DAY = [
+    {"value": 5, "end_time": "2024-07-01T00:00:00+0000"},
+    {"value": 7, "end_time": "2024-07-02T00:00:00+0000"},
+]
+CITIES = [{"value": {"Rome": 3, "Paris": 2}}]
+
+
+@pytest.fixture
+def insights(account):
+    return [
+        Insight.objects.create(
+            insight_id="ig1/insights/reach/day",
+            name="reach",
+            period="day",
+            values=DAY,
+            kind=InsightKindEnum.account,
+            account=account,
+        ),
+        Insight.objects.create(
+            insight_id="ig1/insights/follower_demographics/lifetime",
+            name="follower_demographics",
+            period="lifetime",
+            values=CITIES,
+            kind=InsightKindEnum.account,
+            account=account,
+        ),
+    ]
+
+
+def points():
+    return set(InsightValue.objects.values_list("metric", "end_time", "key", "value"))
+
+
+def test_values_are_written_once(insights):
+    assert write_insight_values(insights) == 4
+    assert write_insight_values(insights) == 0
+    assert points() == {
+        ("reach", START, "", 5.0),
+        ("reach", START.replace(day=2), "", 7.0),
+        ("follower_demographics", None, "Rome", 3.0),
+        ("follower_demographics", None, "Paris", 2.0),
+    }
+
+
+def test_changed_and_dropped_values(insights):
+    write_insight_values(insights)
+    reach, cities = insights
+    reach.values = [{"value": 6, "end_time": "2024-07-02T00:00:00+0000"}]
+    cities.values = [{"value": {"Rome": 4}}]
+
+    assert write_insight_values(insights) == 2
+    assert points() == {
+        ("reach", START, "", 5.0),
+        ("reach", START.replace(day=2), "", 6.0),
+        ("follower_demographics", None, "Rome", 4.0),
+    }
+
+
+def test_account_insights_request_only_the_stored_fields(graph):
+    graph.insights["ig1"] = [
+        {
+            "id": "ig1/insights/reach/day",
+            "name": "reach",
+            "period": "day",
+            "values": DAY,
+        }
+    ]
+
+    SyncService.sync_insights()
+
+    requests = [params for _, edge, params in graph.requests if edge == "insights"]
+    assert len(requests) == sum(map(len, ACCOUNT_INSIGHT_METRICS.values()))
+    assert {params["fields"] for params in requests} == {INSIGHT_FIELDS}
+    assert Insight.objects.get().insight_id == "ig1/insights/reach/day"
+
+
+def test_dropped_keys_leave_the_rollups(account):
+    cities = Insight.objects.create(
+        insight_id="ig1/insights/city/day",
+        name="city",
+        period="day",
+        values=[{"value": {"Rome": 3, "Paris": 2}, "end_time": DAY[0]["end_time"]}],
+        kind=InsightKindEnum.account,
+        account=account,
+    )
+    write_insight_values([cities])
+    refresh_insight_rollups()
+
+    # Rome is unchanged, so only the deleted Paris value touches the bucket.
+    cities.values = [{"value": {"Rome": 3}, "end_time": DAY[0]["end_time"]}]
+    write_insight_values([cities])
+    refresh_insight_rollups()
+
+    assert set(InsightRollup.objects.values_list("granularity", "key", "stale")) == {
+        ("day", "Rome", False),
+        ("week", "Rome", False),
+    }
+
+
+def test_points_a_concurrent_sync_inserted_are_not_duplicated(insights, monkeypatch):
+    real_now = insight_values.timezone.now
+
+    def now():
+        # Called once the stored values were read, so the points written
+        # here are unknown to the outer write.
+        monkeypatch.setattr(insight_values.timezone, "now", real_now)
+        write_insight_values(insights)
+        return real_now()
+
+    monkeypatch.setattr(insight_values.timezone, "now", now)
+
+    write_insight_values(insights)
+
+    assert InsightValue.objects.count() == 4
+
+
+@pytest.mark.parametrize("end_time", [START, None], ids=["dated", "lifetime"])
+def test_database_rejects_duplicate_points(insights, end_time):
+    values = {"insight": insights[0], "metric": "reach", "period": "day", "value": 1}
+    InsightValue.objects.create(end_time=end_time, **values)
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        InsightValue.objects.create(end_time=end_time, **values)
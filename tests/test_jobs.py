@@ -0,0 +1,48 @@
+"""The heartbeat runs in a thread, so these tests commit their data."""
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from django_sage_meta.helper.choice import SyncJobKindEnum, SyncJobStatusEnum
+from django_sage_meta.models import SyncJob
+from django_sage_meta.repository import jobs
+
+
+@pytest.fixture
+def claimed():
+    SyncJob.objects.create(kind=SyncJobKindEnum.categories)
+    return jobs.claim_job("worker")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_jobs_without_progress_keep_their_heartbeat(claimed, settings, monkeypatch):
+    settings.META_SYNC_JOB_HEARTBEAT = timedelta(milliseconds=10)
+    beats = []
+
+    def sync_categories(**kwargs):
+        time.sleep(0.2)
+        beats.append(SyncJob.objects.get(pk=claimed.pk).heartbeat_at)
+
+    monkeypatch.setitem(jobs.JOB_HANDLERS, SyncJobKindEnum.categories, sync_categories)
+
+    job = jobs.run_job(claimed)
+
+    assert job.status == SyncJobStatusEnum.done
+    assert beats[0] > claimed.started_at
+
+
+@pytest.mark.django_db(transaction=True)
+def test_job_failed_as_stale_stays_failed(claimed, monkeypatch):
+    def sync_categories(**kwargs):
+        # Another worker gives up on the job while it runs.
+        jobs.fail_stale_jobs(timeout=timedelta(0))
+
+    monkeypatch.setitem(jobs.JOB_HANDLERS, SyncJobKindEnum.categories, sync_categories)
+
+    job = jobs.run_job(claimed)
+
+    assert job.status == SyncJobStatusEnum.failed
+    assert job.error == "The worker stopped reporting progress."
+    assert SyncJob.objects.get(pk=job.pk).status == SyncJobStatusEnum.failed
@@ -0,0 +1,121 @@
+import pytest
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+from tests.conftest import START
+
+APP = "django_sage_meta"
+LATEST = "0008_insight_rollup_stale"
+
+
+def migrate(name):
+    """Migrate the app to ``name`` and return the historical models."""
+    executor = MigrationExecutor(connection)
+    executor.migrate([(APP, name)])
+    executor.loader.build_graph()
+    return executor.loader.project_state([(APP, name)]).apps
+
+
+@pytest.fixture
+def rollback():
+    yield
+    migrate(LATEST)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_published_at_backfill(rollback):
+    apps = migrate("0001_initial")
+    account = apps.get_model(APP, "InstagramAccount").objects.create(
+        account_id="ig1",
+        username="brand",
+        follows_counts=1,
+        followers_counts=2,
+        media_counts=0,
+    )
+    Story = apps.get_model(APP, "Story")
+    Story.objects.bulk_create(
+        Story(story_id=story_id, timestamp=timestamp, account=account)
+        for story_id, timestamp in [
+            ("s1", "2024-07-01T00:00:00+0000"),
+            ("s2", "2024-07-01T02:00:00"),
+            ("s3", "yesterday"),
+        ]
+    )
+
+    Story = migrate("0002_backfill_published_at").get_model(APP, "Story")
+
+    assert dict(Story.objects.values_list("story_id", "published_at")) == {
+        "s1": START,
+        "s2": START.replace(hour=2),
+        "s3": None,
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_insight_values_backfill(rollback):
+    apps = migrate("0003_insight_value")
+    Insight = apps.get_model(APP, "Insight")
+    Insight.objects.create(
+        insight_id="m1/insights/reach/day",
+        name="reach",
+        period="day",
+        values=[
+            {"value": 5, "end_time": "2024-07-01T00:00:00+0000"},
+            {"value": "n/a", "end_time": "2024-07-02T00:00:00+0000"},
+        ],
+    )
+    Insight.objects.create(
+        insight_id="ig1/insights/follower_demographics/lifetime",
+        name="follower_demographics",
+        period="lifetime",
+        values=[{"value": {"Rome": 3, "Paris": True}}],
+    )
+
+    InsightValue = migrate("0004_backfill_insight_values").get_model(
+        APP, "InsightValue"
+    )
+
+    assert set(
+        InsightValue.objects.values_list("metric", "end_time", "key", "value")
+    ) == {
+        ("reach", START, "", 5.0),
+        ("follower_demographics", None, "Rome", 3.0),
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_duplicate_insight_values_are_removed(rollback):
+    apps = migrate("0006_search_index")
+    insight = apps.get_model(APP, "Insight").objects.create(
+        insight_id="m1/insights/reach/day", name="reach", period="day"
+    )
+    InsightValue = apps.get_model(APP, "InsightValue")
+    # Later rows of a point carry lower values, so keeping the newest row is
+    # not mistaken for keeping the largest value.
+    points = [
+        (START, "", 3),
+        (START, "", 2),
+        (START, "", 1),
+        (START, "Rome", 5),
+        (None, "", 9),
+        (None, "", 8),
+        (None, "Rome", 7),
+    ]
+    rows = [
+        InsightValue.objects.create(
+            insight=insight,
+            metric="reach",
+            period="day",
+            end_time=end_time,
+            key=key,
+            value=value,
+        )
+        for end_time, key, value in points
+    ]
+    newest = {(row.end_time, row.key): row.pk for row in rows}
+
+    InsightValue = migrate("0007_insight_value_unique").get_model(APP, "InsightValue")
+
+    kept = InsightValue.objects.values_list("end_time", "key", "pk", "value")
+    assert {(end_time, key): pk for end_time, key, pk, _ in kept} == newest
+    assert sorted(value for *_, value in kept) == [1.0, 5.0, 7.0, 8.0]
@@ -0,0 +1,21 @@
+from types import SimpleNamespace
+
+from django_sage_meta.repository import service
+from django_sage_meta.repository.client import ClientProvider
+
+
+def test_publishers_share_the_cached_accounts(monkeypatch):
+    calls = []
+    client = SimpleNamespace(
+        account_handler=SimpleNamespace(get_accounts=lambda: calls.append(1) or []),
+        user_info=SimpleNamespace(id="u1", name="User"),
+    )
+    provider = ClientProvider()
+    monkeypatch.setattr(provider, "get_client", lambda access_token=None: client)
+    monkeypatch.setattr(service, "client_provider", provider)
+
+    first = service.PublisherService()
+    second = service.PublisherService()
+
+    assert first.client is second.client is client
+    assert len(calls) == 1
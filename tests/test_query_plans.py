@@ -0,0 +1,92 @@
+"""The hot sync lookups and admin filters must be served by an index."""
+
+import re
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+
+from django_sage_meta.helper.choice import InsightKindEnum
+from django_sage_meta.models import (
+    Category,
+    Comment,
+    Insight,
+    InstagramAccount,
+    Media,
+    Story,
+    UserData,
+)
+from tests.conftest import START
+
+WINDOW = (START + timedelta(days=2), START + timedelta(days=4))
+
+HOT_QUERIES = {
+    # Resolver lookups by natural key.
+    "account by username": lambda: InstagramAccount.objects.filter(username="brand"),
+    "category by name": lambda: Category.objects.filter(name="Brand"),
+    "user by name": lambda: UserData.objects.filter(name="User One"),
+    # Existing rows of an incoming batch.
+    "media by id": lambda: Media.objects.filter(media_id__in=["m1", "m2"]),
+    "comments by id": lambda: Comment.objects.filter(comment_id__in=["m1c1"]),
+    "insights by id": lambda: Insight.objects.filter(
+        insight_id__in=["m1/insights/reach/lifetime"]
+    ),
+    # Insight filtering by metric.
+    "insights by metric": lambda: Insight.objects.filter(
+        kind=InsightKindEnum.media, name="reach", period="lifetime"
+    ),
+    # Counters refresh and incremental windows.
+    "recent media of account": lambda: Media.objects.filter(
+        account__account_id="ig1", published_at__gte=WINDOW[0]
+    ).order_by("-published_at"),
+    "recent comments of media": lambda: Comment.objects.filter(
+        media__media_id="m1"
+    ).order_by("-published_at"),
+    "recent stories of account": lambda: Story.objects.filter(
+        account__account_id="ig1", published_at__gte=WINDOW[0]
+    ).order_by("-published_at"),
+    # Admin date filters.
+    "media published filter": lambda: Media.objects.filter(
+        published_at__gte=WINDOW[0], published_at__lt=WINDOW[1]
+    ),
+    "comment published filter": lambda: Comment.objects.filter(
+        published_at__gte=WINDOW[0], published_at__lt=WINDOW[1]
+    ),
+    "story published filter": lambda: Story.objects.filter(
+        published_at__gte=WINDOW[0], published_at__lt=WINDOW[1]
+    ),
+}
+
+TABLES = [
+    model._meta.db_table
+    for model in (Category, Comment, Insight, InstagramAccount, Media, Story, UserData)
+]
+
+
+def explain(queryset):
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            # Small tables are cheaper to scan, so ask whether an index can
+            # serve the query at all.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN {sql}", params)
+        else:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return "\n".join(str(row[-1]) for row in cursor.fetchall())
+
+
+def full_scans(plan):
+    """Return the seeded tables the plan reads from start to end."""
+    if connection.vendor == "postgresql":
+        pattern = r"Seq Scan on (\w+)"
+    else:
+        pattern = r"\bSCAN (\w+)"
+    return [table for table in re.findall(pattern, plan) if table in TABLES]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("name", HOT_QUERIES)
+def test_hot_query_uses_an_index(seeded, name):
+    plan = explain(HOT_QUERIES[name]())
+    assert not full_scans(plan), f"{name} scans a whole table:\n{plan}"
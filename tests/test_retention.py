@@ -0,0 +1,128 @@
+import gzip
+import json
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from django_sage_meta.models import Comment, Insight, InsightRollup, InsightValue
+from django_sage_meta.repository.retention import POLICIES, prune
+from django_sage_meta.repository.rollups import refresh_insight_rollups
+from tests.conftest import START
+
+INSIGHTS = next(policy for policy in POLICIES if policy.name == "insights")
+VALUES = next(policy for policy in POLICIES if policy.name == "insight_values")
+CUTOFF = START + timedelta(hours=10)
+
+
+def read_archive(path):
+    with gzip.open(path, "rt", encoding="utf-8") as archive:
+        return [json.loads(line) for line in archive]
+
+
+def add_values(insights):
+    InsightValue.objects.bulk_create(
+        InsightValue(
+            insight=insight, metric="reach", period="lifetime", key=key, value=1
+        )
+        for insight in insights
+        for key in ("", "Rome")
+    )
+
+
+def test_cascaded_values_are_archived_with_their_insights(seeded, tmp_path):
+    add_values(Insight.objects.all())
+
+    rows, path = prune(INSIGHTS, CUTOFF, chunk_size=4, archive_dir=tmp_path)
+
+    assert rows == 10
+    assert len(read_archive(path)) == 10
+    [values_path] = tmp_path.glob("insights-insight_values-*.jsonl.gz")
+    archived = read_archive(values_path)
+    assert len(archived) == 20
+    assert {row["key"] for row in archived} == {"", "Rome"}
+    assert Insight.objects.count() == 190
+    assert InsightValue.objects.count() == 380
+
+
+def test_no_cascade_archive_without_cascaded_rows(seeded, tmp_path):
+    prune(INSIGHTS, CUTOFF, archive_dir=tmp_path)
+
+    assert not list(tmp_path.glob("insights-insight_values-*"))
+
+
+def test_command_prunes_without_archive(seeded, settings, tmp_path):
+    settings.META_RETENTION_DAYS = {"insights": 0}
+    add_values(Insight.objects.all()[:3])
+
+    call_command("prune_meta_data", "--only", "insights", "--no-archive")
+
+    assert not Insight.objects.exists()
+    assert not InsightValue.objects.exists()
+
+
+def test_pruned_values_leave_the_rollups(seeded):
+    insight = Insight.objects.first()
+    InsightValue.objects.bulk_create(
+        InsightValue(
+            insight=insight,
+            metric="reach",
+            period="day",
+            end_time=START + timedelta(days=day),
+            value=1,
+        )
+        for day in range(2)
+    )
+    refresh_insight_rollups()
+
+    prune(VALUES, START + timedelta(days=1))
+    refresh_insight_rollups()
+
+    # Only the bucket of the kept value is left, in any time zone.
+    rollups = InsightRollup.objects.values_list("granularity", "samples", "stale")
+    assert sorted(rollups) == [("day", 1, False), ("week", 1, False)]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_full_sync_does_not_bring_back_pruned_rows(graph, settings):
+    recent = (timezone.now() - timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%S+0000")
+    old = "2024-07-01T10:00:00+0000"
+    graph.add_media("m_old", timestamp=old, comments_count=1)
+    graph.add_media("m_new", timestamp=recent, comments_count=2)
+    graph.comments = {
+        "m_old": [{"id": "c_old", "text": "hi", "timestamp": old}],
+        "m_new": [
+            {"id": "c_older", "text": "hi", "timestamp": old},
+            {"id": "c_new", "text": "hi", "timestamp": recent},
+        ],
+    }
+    for media_id in ("m_old", "m_new"):
+        graph.insights[media_id] = [
+            {
+                "id": f"{media_id}/insights/reach/day",
+                "name": "reach",
+                "period": "day",
+                "values": [
+                    {"value": 1, "end_time": old},
+                    {"value": 2, "end_time": recent},
+                ],
+            }
+        ]
+    call_command("sync_all", "--only", "media")
+    assert Comment.objects.count() == 3
+    assert InsightValue.objects.count() == 4
+
+    settings.META_RETENTION_DAYS = {
+        "comments": 30,
+        "insight_values": 30,
+        "insights": 30,
+    }
+    call_command("prune_meta_data", "--no-archive")
+    call_command("sync_all", "--only", "media", "--full")
+
+    assert list(Comment.objects.values_list("comment_id", flat=True)) == ["c_new"]
+    assert list(Insight.objects.values_list("insight_id", flat=True)) == [
+        "m_new/insights/reach/day"
+    ]
+    assert list(InsightValue.objects.values_list("value", flat=True)) == [2.0]
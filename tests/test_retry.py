@@ -0,0 +1,88 @@
+import facebook
+import pytest
+import requests
+
+from django_sage_meta.repository.batch import GraphBatchError
+from django_sage_meta.repository.retry import is_transient, retry_call
+
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(response=response)
+
+
+def graph_error(**error):
+    return facebook.GraphAPIError({"error": {"message": "failed", **error}})
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        requests.Timeout(),
+        requests.ConnectionError(),
+        http_error(429),
+        http_error(503),
+        graph_error(code=4),
+        graph_error(code=2),
+        graph_error(code=100, is_transient=True),
+        GraphBatchError(500, {"code": 1}),
+        GraphBatchError(None, {"message": "No response"}),
+    ],
+)
+def test_transient_errors(error):
+    assert is_transient(error)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        http_error(400),
+        graph_error(code=190),
+        graph_error(code=10),
+        GraphBatchError(400, {"code": 100}),
+        ValueError("bad payload"),
+    ],
+)
+def test_permanent_errors(error):
+    assert not is_transient(error)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(settings):
+    settings.META_SYNC_RETRY_BASE_DELAY = 0
+
+
+def failing(errors):
+    calls = []
+
+    def call():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return call, calls
+
+
+def test_transient_errors_are_retried():
+    call, calls = failing([requests.Timeout(), graph_error(code=17)])
+
+    assert retry_call(call, retries=3) == "ok"
+    assert len(calls) == 3
+
+
+def test_permanent_errors_are_raised_at_once():
+    call, calls = failing([graph_error(code=190)])
+
+    with pytest.raises(facebook.GraphAPIError):
+        retry_call(call, retries=3)
+    assert len(calls) == 1
+
+
+def test_last_transient_error_is_raised():
+    call, calls = failing([requests.Timeout()] * 3)
+
+    with pytest.raises(requests.Timeout):
+        retry_call(call, retries=2)
+    assert len(calls) == 3
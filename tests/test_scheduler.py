@@ -0,0 +1,75 @@
+import logging
+
+import pytest
+
+from django_sage_meta.repository.scheduler import Stage, StageScheduler
+
+
+def fail():
+    raise RuntimeError("boom")
+
+
+def statuses(reports):
+    return {report.name: report.status for report in reports}
+
+
+def test_failure_blocks_dependents_transitively():
+    scheduler = StageScheduler(
+        [
+            Stage("a", fail),
+            Stage("b", lambda: None, depends_on=("a",)),
+            Stage("c", lambda: None, depends_on=("b",)),
+            Stage("d", lambda: None),
+        ],
+        max_parallel=2,
+    )
+
+    assert statuses(scheduler.run()) == {
+        "a": "failed",
+        "b": "blocked",
+        "c": "blocked",
+        "d": "done",
+    }
+
+
+def test_stages_wait_for_their_dependencies():
+    order = []
+    scheduler = StageScheduler(
+        [
+            Stage("b", lambda: order.append("b"), depends_on=("a",)),
+            Stage("a", lambda: order.append("a")),
+        ],
+        max_parallel=4,
+    )
+
+    scheduler.run()
+
+    assert order == ["a", "b"]
+
+
+def test_circular_dependencies_are_rejected():
+    scheduler = StageScheduler(
+        [
+            Stage("a", lambda: None, depends_on=("b",)),
+            Stage("b", lambda: None, depends_on=("a",)),
+        ]
+    )
+
+    with pytest.raises(ValueError, match="Circular"):
+        scheduler.run()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_stage_is_logged_once(graph, monkeypatch, caplog):
+    from django.core.management import CommandError, call_command
+
+    from django_sage_meta.repository.service import SyncService
+
+    monkeypatch.setattr(SyncService, "sync_media", lambda **kwargs: fail())
+
+    with caplog.at_level(logging.ERROR), pytest.raises(CommandError):
+        call_command("sync_all", "--only", "media")
+
+    assert [r.getMessage() for r in caplog.records].count(
+        "Stage media failed: boom"
+    ) == 1
@@ -0,0 +1,112 @@
+import re
+from importlib import import_module
+
+import pytest
+from django.contrib.admin.sites import site
+from django.db import connection
+
+from django_sage_meta.models import Comment, Media
+from django_sage_meta.repository.search import SEARCH_FIELDS, full_text_search
+
+MIGRATION = import_module("django_sage_meta.migrations.0006_search_index")
+
+
+def captions(query):
+    return set(
+        full_text_search(Media.objects.all(), query).values_list("caption", flat=True)
+    )
+
+
+def test_every_word_has_to_match(seeded):
+    Media.objects.filter(media_id="m1").update(caption="Summer sale starts today")
+    Media.objects.filter(media_id="m2").update(caption="Summer is here")
+
+    assert captions("summer") == {"Summer sale starts today", "Summer is here"}
+    assert captions("summer sale") == {"Summer sale starts today"}
+    assert captions("winter") == set()
+
+
+def test_index_follows_updates_and_deletes(seeded):
+    media = Media.objects.get(media_id="m1")
+    media.caption = "giveaway winners"
+    media.save()
+    assert captions("giveaway") == {"giveaway winners"}
+
+    media.caption = "thanks everyone"
+    media.save()
+    assert captions("giveaway") == set()
+
+    media.delete()
+    assert captions("thanks") == set()
+
+
+def test_operators_in_the_query_are_literal(seeded):
+    Media.objects.filter(media_id="m1").update(caption='new "drop" OR sale')
+
+    assert captions('"drop" OR') == {'new "drop" OR sale'}
+    assert captions("NOT") == set()
+
+
+def test_comments_match_text_and_username(seeded):
+    comments = Comment.objects.filter(media__media_id="m1")
+
+    assert full_text_search(comments, "hello bob").count() == 5
+    assert full_text_search(comments, "hello 3").get().comment_id == "m1c3"
+
+
+def test_admin_search_matches_graph_ids(seeded, rf):
+    admin = site._registry[Media]
+    request = rf.get("/")
+
+    results, distinct = admin.get_search_results(request, Media.objects.all(), "m7")
+
+    assert list(results.values_list("media_id", flat=True)) == ["m7"]
+    assert distinct is False
+
+
+def index_columns(model):
+    """Return every column list of the migration's index statements."""
+    table = model._meta.db_table
+    sqlite = [
+        sql for sql in MIGRATION.CREATE_SEARCH_INDEX["sqlite"] if f"{table}_fts" in sql
+    ]
+    [postgresql] = [
+        sql
+        for sql in MIGRATION.CREATE_SEARCH_INDEX["postgresql"]
+        if f'ALTER TABLE "{table}"' in sql
+    ]
+    columns = [re.findall(r'coalesce\("(\w+)"', postgresql)]
+    for sql in sqlite:
+        for listed in re.findall(r"fts5\((.*?)content=|UPDATE OF (.*?) ON", sql, re.S):
+            columns.append(re.findall(r'"(\w+)"', "".join(listed)))
+        for row in re.findall(r"(?:new|old)\.id, (.*?)\)", sql):
+            columns.append(re.findall(r'(?:new|old)\."(\w+)"', row))
+    return columns
+
+
+@pytest.mark.parametrize("model", SEARCH_FIELDS, ids=lambda model: model.__name__)
+def test_index_covers_the_search_fields(model):
+    fields = list(SEARCH_FIELDS[model])
+    columns = index_columns(model)
+
+    # The tsvector, the FTS5 table, the update trigger and the rows of the
+    # insert, delete and update triggers.
+    assert len(columns) == 7
+    assert all(listed == fields for listed in columns)
+    assert set(fields) <= {field.column for field in model._meta.fields}
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="The tsvector column and GIN index only exist on PostgreSQL.",
+)
+@pytest.mark.django_db(transaction=True)
+def test_postgresql_search_uses_the_search_vector(seeded):
+    Media.objects.filter(media_id="m1").update(caption="Summer sale starts today")
+    Media.objects.filter(media_id="m2").update(caption="Summer is here")
+    queryset = full_text_search(Media.objects.all(), "summer sale")
+
+    assert "plainto_tsquery" in str(queryset.query)
+    assert set(queryset.values_list("caption", flat=True)) == {
+        "Summer sale starts today"
+    }
@@ -0,0 +1,18 @@
+from django_sage_meta.repository import sharding
+from django_sage_meta.repository.throttle import GraphThrottle
+
+
+def test_workers_drop_inherited_clients_and_share_the_budget(monkeypatch):
+    throttle = GraphThrottle(max_rate=40, min_rate=1)
+    invalidated = []
+    monkeypatch.setattr(sharding, "graph_throttle", throttle)
+    monkeypatch.setattr(
+        sharding.client_provider,
+        "invalidate",
+        lambda **kwargs: invalidated.append(kwargs),
+    )
+
+    sharding._init_worker(4)
+
+    assert invalidated == [{"drop_client": True}]
+    assert (throttle.max_rate, throttle.min_rate, throttle.rate) == (10, 0.25, 10)
@@ -0,0 +1,121 @@
+"""sync_all runs stages in threads, so these tests commit their data."""
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from django_sage_meta.management.commands import sync_all
+from django_sage_meta.models import Media, SyncCheckpoint
+from django_sage_meta.repository.service import SyncService
+from django_sage_meta.repository.sharding import AccountReport
+from django_sage_meta.repository.upsert import UpsertStats
+
+
+@pytest.mark.django_db(transaction=True)
+def test_successful_run_exits_cleanly(graph, capsys):
+    graph.add_media("m1")
+
+    call_command("sync_all", "--only", "media")
+
+    assert Media.objects.filter(media_id="m1").exists()
+    assert "All data synchronized successfully." in capsys.readouterr().out
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_stage_raises_command_error(graph, monkeypatch):
+    def fail(**kwargs):
+        raise RuntimeError("Graph is down")
+
+    monkeypatch.setattr(SyncService, "sync_media", fail)
+
+    with pytest.raises(CommandError, match="finished with errors"):
+        call_command("sync_all", "--only", "media")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_account_raises_command_error(graph, monkeypatch):
+    monkeypatch.setattr(
+        sync_all,
+        "sync_accounts",
+        lambda targets, **kwargs: [AccountReport("ig1", status="failed")],
+    )
+    monkeypatch.setattr(sync_all, "list_account_targets", lambda: [])
+
+    with pytest.raises(CommandError, match="finished with errors"):
+        call_command("sync_all", "--all-accounts", "--only", "media")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_unexpected_error_raises_command_error(graph, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(sync_all, "clear_checkpoints", fail)
+
+    with pytest.raises(CommandError, match="boom"):
+        call_command("sync_all", "--only", "media")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_successful_run_leaves_nothing_to_resume(graph, monkeypatch):
+    graph.add_media("m1")
+    call_command("sync_all", "--only", "media")
+    assert not SyncCheckpoint.objects.exists()
+
+    synced = []
+    monkeypatch.setattr(
+        SyncService, "sync_media", lambda **kwargs: synced.append(kwargs)
+    )
+    call_command("sync_all", "--only", "media", "--resume")
+
+    assert len(synced) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_run_resumes_after_completed_stages(graph, monkeypatch):
+    def fail(**kwargs):
+        raise RuntimeError("Graph is down")
+
+    monkeypatch.setattr(SyncService, "sync_stories", fail)
+    with pytest.raises(CommandError):
+        call_command("sync_all", "--only", "media", "stories")
+
+    synced = []
+    monkeypatch.setattr(
+        SyncService, "sync_media", lambda **kwargs: synced.append("media")
+    )
+    monkeypatch.setattr(
+        SyncService, "sync_stories", lambda **kwargs: synced.append("stories")
+    )
+    call_command("sync_all", "--only", "media", "stories", "--resume")
+
+    assert synced == ["stories"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rollups_refresh_after_the_stages(graph, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        SyncService, "sync_media", lambda **kwargs: calls.append("media")
+    )
+    monkeypatch.setattr(
+        sync_all,
+        "refresh_insight_rollups",
+        lambda: calls.append("rollups") or UpsertStats(),
+    )
+
+    call_command("sync_all", "--only", "media", "rollups", "--max-parallel", "2")
+    call_command("sync_all", "--only", "rollups", "--resume")
+
+    assert calls == ["media", "rollups", "rollups"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rollups_are_skipped_after_a_failed_stage(graph, monkeypatch):
+    def fail(**kwargs):
+        raise RuntimeError("Graph is down")
+
+    monkeypatch.setattr(SyncService, "sync_media", fail)
+    monkeypatch.setattr(sync_all, "refresh_insight_rollups", fail)
+
+    with pytest.raises(CommandError, match="finished with errors"):
+        call_command("sync_all", "--only", "media", "rollups")
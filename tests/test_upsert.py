@@ -0,0 +1,93 @@
+import pytest
+
+from django_sage_meta.models import Category, Media
+from django_sage_meta.repository.lookup import load_existing
+from django_sage_meta.repository.upsert import bulk_upsert
+
+
+def categories(*names):
+    return [Category(category_id=f"c{i}", name=name) for i, name in enumerate(names)]
+
+
+@pytest.mark.django_db
+def test_new_rows_are_counted_as_created():
+    result = bulk_upsert(categories("Brand", "Shop"), Category, ["name"])
+
+    assert (result.created, result.updated, result.unchanged) == (2, 0, 0)
+    assert Category.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_loaded_rows_are_counted_as_updated():
+    bulk_upsert(categories("Brand", "Shop"), Category, ["name"])
+    existing = load_existing(Category, ["c0"], ["name"])
+    existing["c0"].name = "Brands"
+
+    result = bulk_upsert(
+        [existing["c0"], Category(category_id="c2", name="Food")], Category, ["name"]
+    )
+
+    assert (result.created, result.updated, result.unchanged) == (1, 1, 0)
+    assert Category.objects.get(category_id="c0").name == "Brands"
+
+
+@pytest.mark.django_db
+def test_conflicts_are_ignored_without_update_fields():
+    bulk_upsert(categories("Brand"), Category)
+    existing = load_existing(Category, ["c0"], ["name"])
+    existing["c0"].name = "Ignored"
+
+    result = bulk_upsert([existing["c0"]], Category)
+
+    assert (result.created, result.updated, result.unchanged) == (0, 0, 1)
+    assert Category.objects.get(category_id="c0").name == "Brand"
+
+
+@pytest.mark.django_db
+def test_conflicts_overwrite_only_the_listed_fields(account):
+    Media.objects.create(
+        media_id="m1",
+        username="brand",
+        caption="old caption",
+        media_url="https://example.com/old.jpg",
+        like_counts=1,
+        account=account,
+    )
+    incoming = Media(
+        media_id="m1",
+        username="brand",
+        caption="new caption",
+        media_url="https://example.com/new.jpg",
+        like_counts=5,
+        account=account,
+    )
+
+    bulk_upsert([incoming], Media, ["like_counts"])
+
+    stored = Media.objects.get(media_id="m1")
+    assert stored.like_counts == 5
+    assert stored.caption == "old caption"
+    assert stored.media_url == "https://example.com/old.jpg"
+    assert Media.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_one_statement_per_batch(django_assert_num_queries):
+    with django_assert_num_queries(2):
+        result = bulk_upsert(
+            categories("a", "b", "c", "d", "e"), Category, ["name"], batch_size=3
+        )
+
+    assert [batch.created for batch in result.batches] == [3, 2]
+
+
+@pytest.mark.django_db
+def test_duplicate_ids_in_one_call_are_written_once():
+    result = bulk_upsert(
+        [Category(category_id="c0", name="a"), Category(category_id="c0", name="b")],
+        Category,
+        ["name"],
+    )
+
+    assert result.created == 1
+    assert Category.objects.get().name == "b"